@@ -2,10 +2,14 @@ import { NextResponse } from 'next/server';
 import fs from 'fs';
 import path from 'path';
 import { parse } from 'csv-parse/sync';
+import { drilldownCombinedMonths, hasDrilldownIndex, readDrilldownCsv } from '@/lib/drilldownIndex';
 
 /**
  * GL계정별 상세 데이터 조회 API
  * GET /api/ledger/gl-account?brand=MLB&gl_account=광고선전비_매체광고&type=combined
+ *
+ * 드릴다운 인덱스(gl_analysis/drilldown_index.json)가 있으면 drilldown.csv에서 필요한 구간만 읽고,
+ * 없으면 기존 [Brand]/[GL_Account]_{type}.csv 파일을 읽음 (피벗 원장 파이프라인은 인덱스를 삭제)
  */
 export async function GET(request) {
   try {
@@ -21,49 +25,31 @@ export async function GET(request) {
       }, { status: 400 });
     }
     
-    // 브랜드명 매핑
-    const brandMap = {
-      'MLB': 'MLB',
-      'MLB_KIDS': 'MLB_KIDS',
-      'DISCOVERY': 'Discovery',
-      'DUVETICA': 'Duvetica',
-      'SERGIO_TACCHINI': 'SERGIO_TACCHINI',
-    };
-    
-    const folderName = brandMap[brand] || brand;
-    
-    // 파일명 정제 (GL계정명)
-    const safeGlName = glAccount
-      .replace(/\//g, '_')
-      .replace(/\\/g, '_')
-      .replace(/:/g, '')
-      .replace(/\(/g, '')
-      .replace(/\)/g, '')
-      .trim();
-    
-    // 파일 경로
-    const fileName = type === 'combined' 
-      ? `${safeGlName}_combined.csv`
-      : `${safeGlName}_${type}.csv`;
-    
-    const filePath = path.join(
-      process.cwd(), 
-      'public', 
-      'data', 
-      'gl_analysis', 
-      folderName, 
-      fileName
-    );
-    
-    if (!fs.existsSync(filePath)) {
-      return NextResponse.json({
-        success: false,
-        error: `파일을 찾을 수 없습니다: ${fileName}`
-      }, { status: 404 });
+    let fileContent = null;
+    if (hasDrilldownIndex()) {
+      // combined: 파이프라인 비교 기간 (기본: 최근 월 vs 전년 동월), 그 외: 해당 연월
+      const months = type === 'combined' ? drilldownCombinedMonths() : [type];
+      fileContent = readDrilldownCsv(brand, glAccount, months);
+      
+      // 조회 중 인덱스가 삭제된 경우(피벗 원장 파이프라인 재실행)는 기존 파일로 조회
+      if (fileContent === null && hasDrilldownIndex()) {
+        return NextResponse.json({
+          success: false,
+          error: `GL계정 데이터를 찾을 수 없습니다: ${brand} / ${glAccount}`
+        }, { status: 404 });
+      }
+    }
+    if (fileContent === null) {
+      fileContent = readLegacyFile(brand, glAccount, type);
+      
+      if (fileContent === null) {
+        return NextResponse.json({
+          success: false,
+          error: `파일을 찾을 수 없습니다: ${legacyFileName(glAccount, type)}`
+        }, { status: 404 });
+      }
     }
     
-    // CSV 파일 읽기
-    const fileContent = fs.readFileSync(filePath, 'utf-8');
     const records = parse(fileContent, {
       columns: true,
       skip_empty_lines: true,
@@ -146,3 +132,53 @@ export async function GET(request) {
   }
 }
 
+/**
+ * 기존 gl_analysis 파일명 ([GL_Account]_{type}.csv)
+ */
+function legacyFileName(glAccount, type) {
+  // 파일명 정제 (GL계정명)
+  const safeGlName = glAccount
+    .replace(/\//g, '_')
+    .replace(/\\/g, '_')
+    .replace(/:/g, '')
+    .replace(/\(/g, '')
+    .replace(/\)/g, '')
+    .trim();
+  
+  return type === 'combined' 
+    ? `${safeGlName}_combined.csv`
+    : `${safeGlName}_${type}.csv`;
+}
+
+/**
+ * 기존 gl_analysis/[Brand]/[GL_Account]_{type}.csv 읽기 (없으면 null)
+ */
+function readLegacyFile(brand, glAccount, type) {
+  // 브랜드명 매핑
+  const brandMap = {
+    'MLB': 'MLB',
+    'MLB_KIDS': 'MLB_KIDS',
+    'DISCOVERY': 'Discovery',
+    'DUVETICA': 'Duvetica',
+    'SERGIO_TACCHINI': 'SERGIO_TACCHINI',
+  };
+  
+  const folderName = brandMap[brand] || brand;
+  
+  // 파일 경로
+  const filePath = path.join(
+    process.cwd(), 
+    'public', 
+    'data', 
+    'gl_analysis', 
+    folderName, 
+    legacyFileName(glAccount, type)
+  );
+  
+  if (!fs.existsSync(filePath)) {
+    return null;
+  }
+  
+  // CSV 파일 읽기
+  return fs.readFileSync(filePath, 'utf-8');
+}
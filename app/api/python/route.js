@@ -1,9 +1,5 @@
 import { NextResponse } from 'next/server';
-import { exec } from 'child_process';
-import { promisify } from 'util';
-import path from 'path';
-
-const execAsync = promisify(exec);
+import { runPythonScript } from '@/lib/pythonWorker';
 
 export async function POST(request) {
   try {
@@ -25,19 +21,8 @@ export async function POST(request) {
       );
     }
     
-    // Python 스크립트 경로
-    const scriptPath = path.join(process.cwd(), 'python_scripts', `${script}.py`);
-    const venvPython = path.join(process.cwd(), 'venv', 'Scripts', 'python.exe');
-    
-    // Python 스크립트 실행
-    const { stdout, stderr } = await execAsync(`"${venvPython}" "${scriptPath}"`);
-    
-    if (stderr) {
-      console.error('Python stderr:', stderr);
-    }
-    
-    // Python 스크립트의 JSON 출력 파싱
-    const result = JSON.parse(stdout);
+    // 상주 Python 워커에서 실행 (요청마다 인터프리터를 새로 띄우지 않음)
+    const result = await runPythonScript(script);
     
     return NextResponse.json(result);
     
@@ -0,0 +1,151 @@
+/**
+ * GL계정 드릴다운 인덱스 리더
+ * scripts/drilldown_index.py가 만든 drilldown_index.json으로 drilldown.csv에서
+ * 브랜드 × GL계정 × 연월 구간만 읽음 (요청마다 파일명 추측/존재 확인/디렉토리 탐색 없음)
+ */
+
+import fs from 'fs';
+import path from 'path';
+
+const GL_ANALYSIS_DIR = path.join(process.cwd(), 'public', 'data', 'gl_analysis');
+const INDEX_PATH = path.join(GL_ANALYSIS_DIR, 'drilldown_index.json');
+
+// 인덱스 파일 변경 확인 주기 (ms)
+const INDEX_CHECK_INTERVAL = 5000;
+
+/**
+ * 브랜드명 비교 키 (MLB_KIDS, MLB KIDS, mlb kids → MLBKIDS)
+ */
+function brandKey(brand) {
+  return String(brand).replace(/[\s_]/g, '').toUpperCase();
+}
+
+/**
+ * 기존 gl_analysis 파일명 규칙으로 정제한 GL계정명
+ */
+export function safeGlName(glAccount) {
+  return String(glAccount)
+    .replace(/\//g, '_')
+    .replace(/\\/g, '_')
+    .replace(/:/g, '')
+    .replace(/\(/g, '')
+    .replace(/\)/g, '')
+    .trim()
+    .slice(0, 100);
+}
+
+/**
+ * 인덱스 로드 (메모리 캐시, INDEX_CHECK_INTERVAL마다 수정 시각 확인)
+ * @param {boolean} force - 캐시를 무시하고 다시 로드
+ * @returns 캐시 객체, 인덱스 파일이 없으면 null
+ */
+function loadIndex(force = false) {
+  const now = Date.now();
+  const cached = globalThis.__drilldownIndex;
+  if (!force && cached && now - cached.checkedAt < INDEX_CHECK_INTERVAL) {
+    return cached;
+  }
+
+  let stat;
+  try {
+    stat = fs.statSync(INDEX_PATH);
+  } catch {
+    globalThis.__drilldownIndex = null;
+    return null;
+  }
+
+  if (!force && cached && cached.mtimeMs === stat.mtimeMs) {
+    cached.checkedAt = now;
+    return cached;
+  }
+
+  const index = JSON.parse(fs.readFileSync(INDEX_PATH, 'utf-8'));
+  const cache = {
+    index,
+    mtimeMs: stat.mtimeMs,
+    checkedAt: now,
+    brands: new Map(Object.keys(index.entries).map((brand) => [brandKey(brand), brand])),
+    safeNames: new Map(), // 브랜드별 정제된 GL계정명 → GL계정명 (필요할 때 생성)
+  };
+  globalThis.__drilldownIndex = cache;
+  return cache;
+}
+
+/**
+ * 인덱스에서 브랜드 × GL계정 항목 찾기 (GL계정명이 정확히 없으면 정제된 이름으로 비교)
+ */
+function findAccount(cache, brand, glAccount) {
+  const brandName = cache.brands.get(brandKey(brand));
+  if (!brandName) return null;
+
+  const accounts = cache.index.entries[brandName];
+  if (accounts[glAccount]) return accounts[glAccount];
+
+  if (!cache.safeNames.has(brandName)) {
+    cache.safeNames.set(brandName, new Map(Object.keys(accounts).map((gl) => [safeGlName(gl), gl])));
+  }
+  const name = cache.safeNames.get(brandName).get(safeGlName(glAccount));
+  return name ? accounts[name] : null;
+}
+
+/**
+ * 인덱스가 있는지 여부
+ */
+export function hasDrilldownIndex() {
+  return loadIndex() !== null;
+}
+
+/**
+ * combined 조회 대상 월 (파이프라인의 비교 기간)
+ */
+export function drilldownCombinedMonths() {
+  const cache = loadIndex();
+  return cache ? cache.index.combined_months : [];
+}
+
+/**
+ * 브랜드 × GL계정 CSV 텍스트 (헤더 포함, 연월 순)
+ * @param {string} brand - 브랜드 (MLB_KIDS 등 폴더명 형식도 가능)
+ * @param {string} glAccount - GL계정명
+ * @param {string[]|null} months - 읽을 연월 (null이면 전체)
+ * @returns {string|null} CSV 텍스트, 인덱스나 계정이 없으면 null
+ */
+export function readDrilldownCsv(brand, glAccount, months = null) {
+  for (const force of [false, true]) {
+    const cache = loadIndex(force);
+    if (!cache) return null;
+
+    const account = findAccount(cache, brand, glAccount);
+    if (!account) return null;
+
+    const filePath = path.join(GL_ANALYSIS_DIR, cache.index.file);
+    let fd;
+    try {
+      fd = fs.openSync(filePath, 'r');
+    } catch (error) {
+      // 원장 파이프라인이 인덱스를 삭제한 직후 (캐시된 인덱스) → 인덱스를 다시 확인
+      if (error.code === 'ENOENT') continue;
+      throw error;
+    }
+    try {
+      // 파이프라인 재실행 중 파일만 바뀐 경우 인덱스를 다시 읽고 재시도
+      if (fs.fstatSync(fd).size !== cache.index.file_size) continue;
+
+      const [start, slices] = account;
+      const chunks = [Buffer.from(cache.index.columns.join(',') + '\n')];
+      let offset = start;
+      for (const [month, length] of slices) {
+        if (!months || months.includes(month)) {
+          const buffer = Buffer.alloc(length);
+          fs.readSync(fd, buffer, 0, length, offset);
+          chunks.push(buffer);
+        }
+        offset += length;
+      }
+      return Buffer.concat(chunks).toString('utf-8');
+    } finally {
+      fs.closeSync(fd);
+    }
+  }
+  return null;
+}
@@ -0,0 +1,119 @@
+/**
+ * 상주 Python 워커 클라이언트
+ * python_scripts/python_worker.py 프로세스를 한 번 띄워 두고 stdin/stdout JSON-RPC로 호출
+ * (요청마다 인터프리터 시작 + pandas/Snowflake/OpenAI import 비용을 내지 않음)
+ */
+
+import { spawn } from 'child_process';
+import path from 'path';
+import readline from 'readline';
+
+// 요청 타임아웃 (ms)
+const REQUEST_TIMEOUT = 60000;
+
+/**
+ * Python 실행 파일 경로 (PYTHON_BIN 환경변수 > 프로젝트 venv)
+ */
+function pythonExecutable() {
+  if (process.env.PYTHON_BIN) {
+    return process.env.PYTHON_BIN;
+  }
+  return process.platform === 'win32'
+    ? path.join(process.cwd(), 'venv', 'Scripts', 'python.exe')
+    : path.join(process.cwd(), 'venv', 'bin', 'python');
+}
+
+/**
+ * 워커 프로세스 시작 (종료되면 다음 호출에서 다시 시작)
+ */
+function startWorker() {
+  const scriptDir = path.join(process.cwd(), 'python_scripts');
+  const child = spawn(pythonExecutable(), ['-u', path.join(scriptDir, 'python_worker.py')], {
+    cwd: scriptDir,
+    env: { ...process.env, PYTHONIOENCODING: 'utf-8' },
+    stdio: ['pipe', 'pipe', 'pipe'],
+  });
+
+  const worker = { child, nextId: 1, pending: new Map(), alive: true };
+
+  readline.createInterface({ input: child.stdout }).on('line', (line) => {
+    let message;
+    try {
+      message = JSON.parse(line);
+    } catch {
+      console.error('Python worker 출력 파싱 실패:', line);
+      return;
+    }
+    const request = worker.pending.get(message.id);
+    if (!request) return;
+    worker.pending.delete(message.id);
+    clearTimeout(request.timer);
+    if (message.error) {
+      request.reject(new Error(message.error.message));
+    } else {
+      request.resolve(message.result);
+    }
+  });
+
+  child.stderr.on('data', (data) => {
+    console.error('Python worker stderr:', data.toString());
+  });
+
+  const fail = (error) => {
+    worker.alive = false;
+    for (const request of worker.pending.values()) {
+      clearTimeout(request.timer);
+      request.reject(error);
+    }
+    worker.pending.clear();
+  };
+  child.on('error', fail);
+  // 워커가 먼저 종료된 뒤 쓰면 stdin에서 EPIPE 발생 (처리하지 않으면 Node 프로세스 전체가 종료됨)
+  child.stdin.on('error', fail);
+  child.on('exit', (code) => fail(new Error(`Python 워커 종료 (code ${code})`)));
+
+  return worker;
+}
+
+/**
+ * 실행 중인 워커 반환 (개발 서버 HMR에서도 프로세스 하나만 유지하도록 globalThis에 보관)
+ */
+function getWorker() {
+  if (!globalThis.__pythonWorker || !globalThis.__pythonWorker.alive) {
+    globalThis.__pythonWorker = startWorker();
+  }
+  return globalThis.__pythonWorker;
+}
+
+/**
+ * 워커 메서드 호출
+ * @param {string} method - 'run' | 'ping'
+ * @param {object} params - 메서드 인자 (run: { script })
+ */
+export function callPythonWorker(method, params = {}, timeout = REQUEST_TIMEOUT) {
+  const worker = getWorker();
+  const id = worker.nextId++;
+
+  return new Promise((resolve, reject) => {
+    // 이미 종료된 워커에는 쓰지 않음 (다음 호출에서 다시 시작)
+    if (!worker.alive || !worker.child.stdin.writable) {
+      reject(new Error(`Python 워커를 사용할 수 없습니다 (${method})`));
+      return;
+    }
+
+    const timer = setTimeout(() => {
+      worker.pending.delete(id);
+      reject(new Error(`Python 워커 응답 시간 초과 (${method})`));
+    }, timeout);
+
+    worker.pending.set(id, { resolve, reject, timer });
+    worker.child.stdin.write(JSON.stringify({ jsonrpc: '2.0', id, method, params }) + '\n');
+  });
+}
+
+/**
+ * 예제 스크립트 실행 (스크립트 단독 실행 시 출력하던 JSON과 동일한 결과)
+ */
+export function runPythonScript(script) {
+  return callPythonWorker('run', { script });
+}
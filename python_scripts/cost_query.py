@@ -0,0 +1,94 @@
+"""
+Snowflake 비용 CSV 조회 CLI (정렬 + 존 맵 컬럼형 저장소, cost_store.py)
+- public/data/snowflake_costs.csv를 한 번 읽어 (BRD_CD, YYYYMM) 순으로 정렬한 컬럼별 .npy 파일로 저장 (.cache/cost_query)
+  문자열 컬럼은 사전 인코딩 (정렬된 고유값 목록 + int32 코드), COST_AMT는 float64
+- 조회 시 블록별 최소/최대 코드(존 맵)로 필터 값이 없는 블록을 건너뛰고, 남은 블록만 메모리 매핑으로 읽음
+  그룹별 합계는 코드 조합 → np.bincount (텍스트 전체 스캔 없음, pandas는 저장소 생성 시에만 로드)
+- 원본 CSV의 크기/수정 시각이 바뀌면 저장소를 자동으로 다시 생성
+
+사용법:
+    # DISCOVERY 2025년 10월 지급수수료 소분류별 (소분류가 비어 있으면 계정명)
+    python cost_query.py --where BRD_CD=X YYYYMM=202510 CATEGORY_L1=지급수수료 --by "CATEGORY_L3|GL_NM"
+
+    # DISCOVERY 2025년 광고선전비 월별 합계
+    python cost_query.py --where BRD_CD=X "YYYYMM=2025*" CATEGORY_L1=광고선전비 --by YYYYMM
+
+    # 지급수수료 + 제간비 대/중분류 × 계정명 상위 20개
+    python cost_query.py --where BRD_CD=X YYYYMM=202510 CATEGORY_L1=지급수수료,제간비 \\
+        --by CATEGORY_L1 CATEGORY_L2 GL_NM --top 20
+
+필터: 컬럼=값 (쉼표로 여러 값, 값 끝의 *는 접두어 일치), 그룹: 컬럼 또는 컬럼1|컬럼2 (앞 컬럼이 비어 있으면 다음 컬럼)
+"""
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+from cost_store import COSTS_FILE, open_store, parse_filters, query
+
+
+def print_result(result, by, top=None):
+    """조회 결과 출력 (금액, 백만원, 비중, top이면 상위 N개와 나머지 합계)"""
+    amounts, counts = result['amount'], result['rows']
+    total = amounts.sum()
+    print(f"\n총 합계: {total:,.0f}원 ({total / 1_000_000:.1f}백만원), {len(amounts):,}개 그룹\n")
+
+    shown = min(top, len(amounts)) if top else len(amounts)
+    for i in range(shown):
+        label = ' > '.join(str(result[spec][i]) for spec in by) if by else '전체'
+        share = amounts[i] / total * 100 if total else 0
+        print(f"  {i + 1:3d}. {label}: {amounts[i]:,.0f}원 ({amounts[i] / 1_000_000:.1f}백만원, {share:.1f}%, "
+              f"{counts[i]:,} rows)")
+
+    if shown < len(amounts):
+        rest = amounts[shown:].sum()
+        print(f"\n  상위 {shown}개 외 {len(amounts) - shown:,}개 그룹: {rest:,.0f}원 ({rest / 1_000_000:.1f}백만원)")
+
+
+def write_result_csv(result, output_file):
+    """조회 결과 CSV 저장 (UTF-8 BOM)"""
+    columns = list(result)
+    with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(zip(*(result[col].tolist() for col in columns)))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Snowflake 비용 CSV 필터/그룹 합계 조회 (정렬 + 존 맵 컬럼형 저장소)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='예: python cost_query.py --where BRD_CD=X YYYYMM=202510 CATEGORY_L1=지급수수료 '
+               '--by "CATEGORY_L3|GL_NM"')
+    parser.add_argument('--source', type=Path, default=COSTS_FILE, help='비용 CSV (기본 public/data/snowflake_costs.csv)')
+    parser.add_argument('--where', nargs='+', default=[], metavar='COL=VALUE',
+                        help='필터 (쉼표로 여러 값, 값 끝의 *는 접두어 일치)')
+    parser.add_argument('--by', nargs='+', default=[], metavar='COL', help='그룹 컬럼 (A|B: A가 비어 있으면 B)')
+    parser.add_argument('--top', type=int, help='금액 상위 N개만 출력')
+    parser.add_argument('--csv', type=Path, metavar='FILE', help='결과를 CSV로 저장')
+    parser.add_argument('--rebuild', action='store_true', help='컬럼형 저장소 다시 생성')
+    args = parser.parse_args()
+
+    try:
+        store = open_store(args.source, rebuild=args.rebuild)
+        started = time.perf_counter()
+        result = query(store, parse_filters(args.where), args.by)
+        elapsed = (time.perf_counter() - started) * 1000
+        blocks = result.pop('blocks')
+    except (FileNotFoundError, ValueError) as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
+
+    block_count = -(-store['rows'] // store['block_rows'])
+    print(f"[QUERY] {store['rows']:,} rows, {int(result['rows'].sum()):,} matched in {elapsed:.1f} ms "
+          f"({blocks}/{block_count} blocks scanned)")
+    print_result(result, args.by, args.top)
+    if args.csv:
+        write_result_csv(result, args.csv)
+        print(f"\n[OK] Saved: {args.csv}")
+
+
+if __name__ == '__main__':
+    main()
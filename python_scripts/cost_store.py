@@ -0,0 +1,321 @@
+"""
+비용 팩트 테이블 컬럼형 저장소 (정렬 + 존 맵)
+- snowflake_costs.csv를 컬럼별 .npy 파일로 저장 (.cache/cost_query)
+  문자열 컬럼은 사전 인코딩 (정렬된 고유값 목록 + int32 코드, 코드 순서 = 값 순서), COST_AMT는 float64
+- 행은 (BRD_CD, YYYYMM) 순으로 정렬해서 저장 → 같은 브랜드 × 월 행이 연속 구간
+- BLOCK_ROWS 행 단위 블록마다 컬럼별 최소/최대 코드(존 맵)를 저장
+  조회 시 필터 값이 블록 범위에 없으면 블록을 통째로 건너뜀
+  (브랜드/월 필터 조회는 전체 이력 길이와 무관하게 해당 구간 블록만 읽음)
+- 조회는 np.load(mmap_mode='r')로 필요한 컬럼만 매핑, 그룹별 합계는 np.bincount (pandas는 저장소 생성 시에만 로드)
+- 원본 CSV의 크기/수정 시각이 바뀌면 저장소를 자동으로 다시 생성
+"""
+
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'public' / 'data'
+COSTS_FILE = DATA_DIR / 'snowflake_costs.csv'
+CACHE_DIR = BASE_DIR / '.cache' / 'cost_query'
+
+# 저장소 버전 (저장 형식이 바뀌면 올려서 기존 저장소 무효화)
+STORE_VERSION = 2
+
+# 금액 컬럼 (나머지 컬럼은 모두 사전 인코딩)
+AMOUNT_COLUMN = 'COST_AMT'
+
+# 정렬 키 (앞 컬럼 우선, 원본에 없는 컬럼은 제외)
+SORT_COLUMNS = ['BRD_CD', 'YYYYMM']
+
+# 존 맵 블록 크기 (행)
+BLOCK_ROWS = 1 << 16
+
+# 그룹 키 조합 수가 이 이하이면 정렬 없이 bincount로 집계
+MAX_BINCOUNT_KEYS = 1 << 24
+
+
+def _store_dir(source, cache_dir):
+    key = hashlib.sha256(str(Path(source).resolve()).encode('utf-8')).hexdigest()[:16]
+    return Path(cache_dir) / key
+
+
+def _source_signature(source):
+    stat = Path(source).stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _zone_map(values, block_rows):
+    """블록별 (최소, 최대) 배열 (블록 수 × 2)"""
+    if len(values) == 0:
+        return np.empty((0, 2), dtype=values.dtype)
+    starts = np.arange(0, len(values), block_rows)
+    return np.stack([np.minimum.reduceat(values, starts), np.maximum.reduceat(values, starts)], axis=1)
+
+
+def build_store(source=COSTS_FILE, cache_dir=CACHE_DIR, block_rows=BLOCK_ROWS):
+    """
+    CSV → 정렬된 컬럼형 저장소 + 존 맵 생성
+
+    Returns:
+        저장소 폴더 경로
+    """
+    source = Path(source)
+    store_dir = _store_dir(source, cache_dir)
+    tmp_dir = store_dir.with_name(store_dir.name + '.tmp')
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    # 빈 값은 빈 문자열로 유지 (csv.reader와 동일)
+    df = pd.read_csv(source, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    df.columns = df.columns.str.strip()
+
+    arrays = {}
+    columns = {}
+    for col in df.columns:
+        if col == AMOUNT_COLUMN:
+            amount = pd.to_numeric(df[col].str.replace(',', '', regex=False), errors='coerce').fillna(0)
+            arrays[col] = amount.to_numpy(dtype='float64')
+            columns[col] = {'kind': 'amount'}
+        else:
+            codes, values = pd.factorize(df[col], sort=True)
+            arrays[col] = codes.astype('int32')
+            columns[col] = {'kind': 'dict', 'values': values.tolist()}
+
+    # (브랜드, 월) 순 안정 정렬 (np.lexsort는 마지막 키가 우선)
+    sort_columns = [col for col in SORT_COLUMNS if col in arrays and columns[col]['kind'] == 'dict']
+    if sort_columns:
+        order = np.lexsort([arrays[col] for col in reversed(sort_columns)])
+        arrays = {col: values[order] for col, values in arrays.items()}
+
+    for col, values in arrays.items():
+        np.save(tmp_dir / f'{col}.npy', values)
+        if columns[col]['kind'] == 'dict':
+            np.save(tmp_dir / f'{col}.zone.npy', _zone_map(values, block_rows))
+
+    meta = {
+        'version': STORE_VERSION,
+        'source': str(source),
+        'signature': _source_signature(source),
+        'rows': len(df),
+        'block_rows': block_rows,
+        'sort_columns': sort_columns,
+        'columns': columns,
+    }
+    with open(tmp_dir / 'meta.json', 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    # 이전 저장소 교체
+    if store_dir.exists():
+        for old_file in store_dir.iterdir():
+            old_file.unlink()
+        store_dir.rmdir()
+    tmp_dir.replace(store_dir)
+    return store_dir
+
+
+def open_store(source=COSTS_FILE, cache_dir=CACHE_DIR, rebuild=False):
+    """
+    저장소 열기 (없거나 원본이 바뀌었으면 다시 생성)
+
+    Returns:
+        {'rows', 'dir', 'block_rows', 'dictionaries': {컬럼: 고유값 배열}, 'amount_column'}
+    """
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"Cost file not found: {source}")
+
+    store_dir = _store_dir(source, cache_dir)
+    meta_file = store_dir / 'meta.json'
+    meta = None
+    if meta_file.exists() and not rebuild:
+        with open(meta_file, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != STORE_VERSION or meta.get('signature') != _source_signature(source):
+            meta = None
+
+    if meta is None:
+        started = time.perf_counter()
+        build_store(source, cache_dir)
+        print(f"[STORE] Built columnar copy of {source.name} in {time.perf_counter() - started:.2f}s",
+              file=sys.stderr)
+        with open(meta_file, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
+    return {
+        'rows': meta['rows'],
+        'dir': store_dir,
+        'block_rows': meta['block_rows'],
+        'dictionaries': {col: np.array(info['values'], dtype=object)
+                         for col, info in meta['columns'].items() if info['kind'] == 'dict'},
+        'amount_column': AMOUNT_COLUMN if AMOUNT_COLUMN in meta['columns'] else None,
+    }
+
+
+def _column(store, col):
+    """컬럼 배열 (메모리 매핑)"""
+    return np.load(store['dir'] / f'{col}.npy', mmap_mode='r')
+
+
+def _zone(store, col):
+    """컬럼 존 맵 (블록 수 × 2: 최소/최대 코드)"""
+    return np.load(store['dir'] / f'{col}.zone.npy')
+
+
+def _resolve_column(store, name):
+    """대소문자 구분 없이 컬럼명 확인"""
+    columns = {col.upper(): col for col in store['dictionaries']}
+    col = columns.get(name.strip().upper())
+    if col is None:
+        raise ValueError(f"Unknown column: {name} (choose from {', '.join(store['dictionaries'])})")
+    return col
+
+
+def parse_filters(expressions):
+    """['BRD_CD=X', 'YYYYMM=2025*'] → [(컬럼, [값, ...]), ...]"""
+    filters = []
+    for expression in expressions or []:
+        if '=' not in expression:
+            raise ValueError(f"Invalid filter (expected COLUMN=VALUE): {expression}")
+        col, values = expression.split('=', 1)
+        filters.append((col, [value.strip() for value in values.split(',')]))
+    return filters
+
+
+def _matched_codes(store, col, values):
+    """필터 값 → 사전 크기 불리언 배열 (값 끝의 *는 접두어 일치)"""
+    dictionary = store['dictionaries'][col]
+    matched = np.zeros(len(dictionary), dtype=bool)
+    for value in values:
+        if value.endswith('*'):
+            matched |= np.char.startswith(dictionary.astype(str), value[:-1])
+        else:
+            matched |= dictionary == value
+    return matched
+
+
+def candidate_blocks(store, filters):
+    """
+    존 맵으로 필터 값이 있을 수 있는 블록 번호
+
+    블록의 [최소, 최대] 코드 범위에 맞는 코드가 하나도 없으면 제외
+    (맞는 코드 누적합으로 범위마다 O(1) 확인)
+    """
+    block_count = -(-store['rows'] // store['block_rows'])
+    selected = np.ones(block_count, dtype=bool)
+    for name, values in filters:
+        col = _resolve_column(store, name)
+        matched = _matched_codes(store, col, values)
+        cumulative = np.concatenate(([0], np.cumsum(matched)))
+        zone = _zone(store, col)
+        selected &= cumulative[zone[:, 1] + 1] - cumulative[zone[:, 0]] > 0
+    return np.flatnonzero(selected)
+
+
+def filter_rows(store, filters):
+    """
+    필터를 만족하는 행 번호 (오름차순)
+
+    존 맵으로 고른 블록의 행만 검사하고, 필터마다 이전 필터를 통과한 행만 다시 검사
+
+    Returns:
+        (행 번호 배열, 읽은 블록 수)
+    """
+    blocks = candidate_blocks(store, filters)
+    block_rows, total = store['block_rows'], store['rows']
+    if len(blocks) == -(-total // block_rows):
+        rows = np.arange(total)
+    elif len(blocks):
+        starts = blocks * block_rows
+        lengths = np.minimum(starts + block_rows, total) - starts
+        # 블록 구간 [start, start + length)를 이어 붙인 행 번호
+        rows = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths) + np.arange(lengths.sum())
+    else:
+        return np.empty(0, dtype='int64'), 0
+
+    for name, values in filters:
+        col = _resolve_column(store, name)
+        matched = _matched_codes(store, col, values)
+        codes = np.flatnonzero(matched)
+        candidates = _column(store, col)[rows]
+        # 코드 1개는 직접 비교, 여러 개는 사전 크기 조회표로 확인
+        rows = rows[(candidates == codes[0]) if len(codes) == 1 else matched[candidates]]
+
+    return rows, len(blocks)
+
+
+def _group_codes(store, spec, rows):
+    """
+    그룹 컬럼 (또는 A|B 대체 컬럼) → (필터된 행의 코드, 코드별 레이블)
+    단일 컬럼은 사전 코드를 그대로 사용 (문자열 비교 없음)
+    """
+    names = spec.split('|')
+    if len(names) == 1:
+        col = _resolve_column(store, names[0])
+        return np.asarray(_column(store, col)[rows], dtype='int64'), store['dictionaries'][col]
+
+    labels = None
+    for name in names:
+        col = _resolve_column(store, name)
+        values = store['dictionaries'][col][_column(store, col)[rows]]
+        labels = values if labels is None else np.where(labels != '', labels, values)
+    labels, codes = np.unique(labels, return_inverse=True)
+    return codes.ravel().astype('int64'), labels
+
+
+def query(store, filters=(), by=()):
+    """
+    필터 + 그룹별 합계
+
+    Args:
+        filters: parse_filters 결과
+        by: 그룹 컬럼 목록 (각 항목은 컬럼 또는 'A|B')
+
+    Returns:
+        {그룹 컬럼...: 레이블 배열, 'amount': 합계, 'rows': 행 수, 'blocks': 읽은 블록 수} (금액 내림차순)
+    """
+    rows, blocks = filter_rows(store, filters)
+    amount = np.asarray(_column(store, store['amount_column'])[rows], dtype='float64')
+
+    if not by:
+        return {'amount': np.array([amount.sum()]), 'rows': np.array([len(rows)]), 'blocks': blocks}
+
+    # 그룹 코드 조합 → 단일 정수 키 (혼합 진법)
+    groups = [_group_codes(store, spec, rows) for spec in by]
+    sizes = [max(len(labels), 1) for _, labels in groups]
+    combined = np.zeros(len(rows), dtype='int64')
+    for (codes, _), size in zip(groups, sizes):
+        combined = combined * size + codes
+
+    space = int(np.prod(sizes, dtype='float64'))
+    if space <= MAX_BINCOUNT_KEYS:
+        # 키 공간이 작으면 정렬 없이 bincount 한 번
+        counts = np.bincount(combined, minlength=space)
+        keys = np.flatnonzero(counts)
+        sums = np.bincount(combined, weights=amount, minlength=space)[keys]
+        counts = counts[keys]
+    else:
+        keys, inverse = np.unique(combined, return_inverse=True)
+        sums = np.bincount(inverse.ravel(), weights=amount, minlength=len(keys))
+        counts = np.bincount(inverse.ravel(), minlength=len(keys))
+
+    order = np.argsort(-sums, kind='stable')
+    key_codes = np.unravel_index(keys[order], sizes)
+    result = {spec: labels[codes] for spec, (_, labels), codes in zip(by, groups, key_codes)}
+    result['amount'] = sums[order]
+    result['rows'] = counts[order]
+    result['blocks'] = blocks
+    return result
+
+
+def brand_month_total(store, brand_code, month):
+    """브랜드 × 월 비용 합계 (존 맵으로 해당 구간 블록만 읽음)"""
+    result = query(store, [('BRD_CD', [brand_code]), ('YYYYMM', [month])])
+    return float(result['amount'][0])
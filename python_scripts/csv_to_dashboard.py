@@ -4,14 +4,26 @@ CSV 파일을 대시보드용 JSON으로 변환하는 스크립트
 
 사용법:
     python csv_to_dashboard.py --cost cost_data.csv --sales sales_data.csv --output ./public/data
+
+    # 대용량 비용 CSV는 청크 단위 스트리밍 처리 (메모리 사용량 제한)
+    python csv_to_dashboard.py --cost cost_data.csv --chunksize 200000
 """
 
 import os
 import sys
 import json
 import argparse
+import tempfile
 from datetime import datetime
-import pandas as pd
+
+from lazy_imports import lazy_import
+
+from dashboard_rollup import (aggregate_rollup_part, build_brand_rollups, build_rollups,
+                              detail_filename, write_detail_json)
+from kpi_engine import aggregate_kpi_part, compute_kpi_table, kpi_for, kpi_history
+from run_report import finish_run, report_file, span, start_run
+
+pd = lazy_import('pandas')
 
 # 브랜드 코드 매핑
 BRAND_CODES = {
@@ -45,7 +57,9 @@ CATEGORY_MAPPING = {
 def load_csv(file_path, name):
     """CSV 파일 로드"""
     try:
-        df = pd.read_csv(file_path, encoding='utf-8-sig')
+        with span('load_csv', table=name) as record:
+            df = pd.read_csv(file_path, encoding='utf-8-sig')
+            record['rows_out'] = len(df)
         print(f"✓ {name} 로드 완료: {len(df):,}건")
         return df
     except Exception as e:
@@ -108,36 +122,115 @@ def merge_data(cost_df, sales_df=None, headcount_df=None, store_df=None):
     return merged
 
 
-def calculate_kpi(df, current_month):
-    """KPI 계산"""
-    current_data = df[df['month'] == current_month]
-    
-    if len(current_data) == 0:
-        return {
-            'total_cost': 0,
-            'cost_ratio': 0,
-            'cost_per_person': 0,
-            'cost_per_store': 0,
-            'yoy': 0,
-        }
-    
-    prev_year_month = str(int(current_month) - 10000)
-    prev_data = df[df['month'] == prev_year_month]
-    
-    total_cost = current_data['cost_amt'].sum()
-    total_sale = current_data['sale_amt'].sum()
-    avg_headcount = current_data['headcount'].mean()
-    avg_stores = current_data['store_cnt'].mean()
-    
-    prev_total_cost = prev_data['cost_amt'].sum() if len(prev_data) > 0 else total_cost
+def to_builtin(value):
+    """numpy 스칼라를 JSON 직렬화 가능한 파이썬 기본형으로 변환"""
+    return value.item() if hasattr(value, 'item') else value
+
+
+def run_streaming(args, sales_df, headcount_df, store_df):
+    """
+    비용 CSV를 청크 단위로 읽어 브랜드별 출력 누적
+    - 청크마다 process_cost_data 매핑과 월/브랜드 병합 수행
+    - KPI와 롤업은 청크별 부분 집계로 누적
+    - --detail 지정 시 상세 행은 임시 JSON Lines 파일에 기록 후 상세 파일로 저장
+    - 최대 메모리 사용량은 청크 크기로 제한됨
+    """
+    kpi_parts = []
+    brand_parts = {}
+    all_months = set()
+    total_rows = 0
     
-    return {
-        'total_cost': round(total_cost),
-        'cost_ratio': round((total_cost / total_sale * 100), 1) if total_sale > 0 else 0,
-        'cost_per_person': round((total_cost / avg_headcount / 1_000_000), 1) if avg_headcount > 0 else 0,
-        'cost_per_store': round((total_cost / avg_stores / 1_000_000), 1) if avg_stores > 0 else 0,
-        'yoy': round(((total_cost - prev_total_cost) / prev_total_cost * 100), 1) if prev_total_cost > 0 else 0,
-    }
+    with tempfile.TemporaryDirectory(prefix='csv_to_dashboard_') as spool_dir:
+        spool_files = {}
+        
+        try:
+            # 청크 단위 span은 CSV 파싱 시간을 제외하므로 전체 읽기/처리 시간은 stream_cost로 기록
+            with span('stream_cost', chunksize=args.chunksize) as stream:
+                try:
+                    reader = pd.read_csv(args.cost, encoding='utf-8-sig', chunksize=args.chunksize)
+                except pd.errors.EmptyDataError:
+                    # 0바이트 파일은 헤더만 있는 파일과 같이 처리 (아래에서 오류 종료)
+                    reader = []
+                for chunk_no, chunk in enumerate(reader, start=1):
+                    with span('chunk', chunk=chunk_no) as report:
+                        report['rows_in'] = len(chunk)
+                        chunk = process_cost_data(chunk)
+                        if chunk is None:
+                            sys.exit(1)
+                        
+                        merged = merge_data(chunk, sales_df, headcount_df, store_df)
+                        all_months.update(merged['month'].dropna().unique())
+                        total_rows += len(merged)
+                        kpi_parts.append(aggregate_kpi_part(merged))
+                        
+                        for brand_code, brand_chunk in merged.groupby('brand_code', sort=False):
+                            cost_part, month_part = aggregate_rollup_part(brand_chunk)
+                            parts = brand_parts.setdefault(brand_code, ([], []))
+                            parts[0].append(cost_part)
+                            parts[1].append(month_part)
+                            
+                            if not args.detail:
+                                continue
+                            if brand_code not in spool_files:
+                                spool_path = os.path.join(spool_dir, f'{len(spool_files)}.jsonl')
+                                spool_files[brand_code] = open(spool_path, 'w+', encoding='utf-8')
+                            spool = spool_files[brand_code]
+                            for record in brand_chunk.to_dict(orient='records'):
+                                spool.write(json.dumps(record, ensure_ascii=False))
+                                spool.write('\n')
+                        report['rows_out'] = len(merged)
+                    
+                    print(f"  청크 {chunk_no}: 누적 {total_rows:,}건")
+                stream['rows_out'] = total_rows
+            
+            print(f"✓ 전처리 완료: {total_rows:,}건")
+            if not all_months:
+                print(f"✗ 비용 데이터 없음 (빈 CSV 또는 헤더만 있음): {args.cost}")
+                sys.exit(1)
+            
+            # 기준월 결정
+            current_month = args.month if args.month else to_builtin(max(all_months))
+            print(f"\n기준월: {current_month}")
+            
+            os.makedirs(args.output, exist_ok=True)
+            
+            with span('kpi') as report:
+                kpi_table = compute_kpi_table(kpi_parts)
+                report['rows_out'] = len(kpi_table)
+            
+            print("\nJSON 파일 생성 중...")
+            with span('write_json', files=len(brand_parts), detail=bool(args.detail)):
+                for brand_code, (cost_parts, month_parts) in brand_parts.items():
+                    monthly_data, rollups = build_rollups(cost_parts, month_parts)
+                    
+                    detail_file = None
+                    if args.detail:
+                        spool = spool_files[brand_code]
+                        spool.flush()
+                        spool.seek(0)
+                        detail_file = detail_filename(args.output, brand_code, current_month)
+                        write_detail_json(detail_file, (json.loads(line) for line in spool))
+                    
+                    dashboard_data = {
+                        'brand_code': brand_code,
+                        'brand_name': brand_code,
+                        'current_month': current_month,
+                        'kpi': kpi_for(kpi_table, brand_code, current_month),
+                        'kpi_history': kpi_history(kpi_table, brand_code),
+                        'monthly_data': monthly_data,
+                        'rollups': rollups,
+                        'detail_file': os.path.basename(detail_file) if detail_file else None,
+                        'generated_at': datetime.now().isoformat(),
+                    }
+                    
+                    filename = f"{args.output}/{brand_code}_{current_month}.json"
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        json.dump(dashboard_data, f, ensure_ascii=False, indent=2)
+                    
+                    print(f"✓ {brand_code}: {filename}")
+        finally:
+            for spool in spool_files.values():
+                spool.close()
 
 
 def main():
@@ -148,63 +241,107 @@ def main():
     parser.add_argument('--stores', help='매장수 데이터 CSV 파일 (선택)')
     parser.add_argument('--output', default='./public/data', help='출력 디렉토리')
     parser.add_argument('--month', help='기준월 (YYYYMM, 지정하지 않으면 최신월)')
+    parser.add_argument('--chunksize', type=int,
+                        help='비용 CSV를 지정한 행 수 단위로 스트리밍 처리 (대용량 파일용)')
+    parser.add_argument('--detail', action='store_true',
+                        help='코스트센터 × 계정 단위 상세 행을 별도 파일(<브랜드>_<월>_detail.json)로 저장')
     
     args = parser.parse_args()
     
+    # 단계별 시간/메모리 기록 (.cache/run_reports/csv_to_dashboard.run.jsonl)
+    start_run(report_file('csv_to_dashboard'), 'csv_to_dashboard',
+              chunksize=args.chunksize, detail=args.detail)
+    
     print(f"\n{'='*60}")
     print(f"CSV → Dashboard JSON 변환")
     print(f"{'='*60}\n")
     
-    # CSV 로드
-    cost_df = load_csv(args.cost, '비용 데이터')
-    if cost_df is None:
-        sys.exit(1)
-    
+    # 보조 테이블 로드
     sales_df = load_csv(args.sales, '매출 데이터') if args.sales else None
     headcount_df = load_csv(args.headcount, '인원수 데이터') if args.headcount else None
     store_df = load_csv(args.stores, '매장수 데이터') if args.stores else None
     
-    # 데이터 전처리
-    print("\n데이터 전처리 중...")
-    cost_df = process_cost_data(cost_df)
+    if args.chunksize:
+        print(f"\n비용 데이터 스트리밍 처리 중 (청크 {args.chunksize:,}행)...")
+        run_streaming(args, sales_df, headcount_df, store_df)
+        finish_run()
+        
+        print(f"\n{'='*60}")
+        print("✓ 모든 작업 완료!")
+        print(f"{'='*60}\n")
+        return
+    
+    # CSV 로드
+    cost_df = load_csv(args.cost, '비용 데이터')
     if cost_df is None:
         sys.exit(1)
     
-    merged_df = merge_data(cost_df, sales_df, headcount_df, store_df)
+    # 데이터 전처리
+    print("\n데이터 전처리 중...")
+    with span('merge_data') as record:
+        record['rows_in'] = len(cost_df)
+        cost_df = process_cost_data(cost_df)
+        if cost_df is None:
+            sys.exit(1)
+        
+        merged_df = merge_data(cost_df, sales_df, headcount_df, store_df)
+        record['rows_out'] = len(merged_df)
     print(f"✓ 전처리 완료: {len(merged_df):,}건")
+    if merged_df['month'].dropna().empty:
+        print(f"✗ 비용 데이터 없음 (빈 CSV 또는 헤더만 있음): {args.cost}")
+        sys.exit(1)
     
     # 기준월 결정
     if args.month:
         current_month = args.month
     else:
-        current_month = merged_df['month'].max()
+        current_month = to_builtin(merged_df['month'].max())
     
     print(f"\n기준월: {current_month}")
     
     # 출력 디렉토리 생성
     os.makedirs(args.output, exist_ok=True)
     
+    # 전체 (브랜드, 월) KPI 한 번에 계산
+    with span('kpi') as record:
+        record['rows_in'] = len(merged_df)
+        kpi_table = compute_kpi_table(merged_df)
+        record['rows_out'] = len(kpi_table)
+    
     # 브랜드별 JSON 생성
     print("\nJSON 파일 생성 중...")
-    for brand_code in merged_df['brand_code'].unique():
-        brand_data = merged_df[merged_df['brand_code'] == brand_code]
-        
-        kpi = calculate_kpi(brand_data, current_month)
-        
-        dashboard_data = {
-            'brand_code': brand_code,
-            'brand_name': brand_code,
-            'current_month': current_month,
-            'kpi': kpi,
-            'monthly_data': brand_data.to_dict(orient='records'),
-            'generated_at': datetime.now().isoformat(),
-        }
-        
-        filename = f"{args.output}/{brand_code}_{current_month}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(dashboard_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"✓ {brand_code}: {filename}")
+    with span('write_json', detail=bool(args.detail)) as record:
+        record['rows_in'] = len(merged_df)
+        for brand_code, brand_data in merged_df.groupby('brand_code', sort=False):
+            kpi = kpi_for(kpi_table, brand_code, current_month)
+            monthly_data, rollups = build_brand_rollups(brand_data)
+            
+            # 상세 행은 요청 시에만 별도 파일로 저장 (대시보드에서 지연 로딩)
+            detail_file = None
+            if args.detail:
+                detail_file = detail_filename(args.output, brand_code, current_month)
+                write_detail_json(detail_file, brand_data.to_dict(orient='records'))
+            
+            dashboard_data = {
+                'brand_code': brand_code,
+                'brand_name': brand_code,
+                'current_month': current_month,
+                'kpi': kpi,
+                'kpi_history': kpi_history(kpi_table, brand_code),
+                'monthly_data': monthly_data,
+                'rollups': rollups,
+                'detail_file': os.path.basename(detail_file) if detail_file else None,
+                'generated_at': datetime.now().isoformat(),
+            }
+            
+            filename = f"{args.output}/{brand_code}_{current_month}.json"
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(dashboard_data, f, ensure_ascii=False, indent=2)
+            
+            print(f"✓ {brand_code}: {filename}")
+        record['files'] = merged_df['brand_code'].nunique()
+    
+    finish_run()
     
     print(f"\n{'='*60}")
     print("✓ 모든 작업 완료!")
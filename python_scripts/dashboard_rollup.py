@@ -0,0 +1,84 @@
+"""
+대시보드 JSON용 롤업(사전 집계) 모듈
+- 병합된 비용 행(코스트센터 × 계정 × 월)을 월 × 카테고리 / 월 × 코스트센터타입 큐브로 집계
+- 청크 단위 부분 집계를 합산할 수 있어 스트리밍 처리에도 사용 가능
+- 상세 행은 필요할 때만 별도 파일(지연 로딩용)로 저장
+"""
+
+import json
+
+from lazy_imports import lazy_import
+
+pd = lazy_import('pandas')
+
+# 최소 집계 단위 (모든 롤업은 이 단위에서 재집계)
+ROLLUP_GRAIN = ['month', 'category_l1', 'category_l2', 'category_l3', 'cctr_type']
+
+# 월 단위로 동일한 값이 반복되는 지표 (합산하지 않고 월별 값 하나 사용)
+MONTH_MEASURES = ['sale_amt', 'headcount', 'store_cnt']
+
+
+def aggregate_rollup_part(df):
+    """
+    병합된 비용 데이터(한 브랜드, 전체 또는 청크)를 최소 집계 단위로 부분 집계
+
+    Returns:
+        (비용 부분 집계, 월별 지표 부분 집계)
+    """
+    cost_part = df.groupby(ROLLUP_GRAIN, dropna=False, sort=False).agg(
+        cost_amt=('cost_amt', 'sum'),
+    ).reset_index()
+    month_part = df.groupby('month', sort=False)[MONTH_MEASURES].first().reset_index()
+    return cost_part, month_part
+
+
+def build_rollups(cost_parts, month_parts):
+    """
+    부분 집계를 합산해 대시보드 롤업 생성
+
+    Returns:
+        (monthly_data, rollups)
+        - monthly_data: 월 × 대분류 행 (MonthlyCostData 형식: month, category_l1,
+          cost_amt, sale_amt, headcount, store_cnt)
+        - rollups: {'by_month', 'by_category', 'by_cctr_type'} 레코드 목록
+    """
+    base = pd.concat(cost_parts, ignore_index=True)
+    base = base.groupby(ROLLUP_GRAIN, dropna=False).agg(cost_amt=('cost_amt', 'sum')).reset_index()
+    months = pd.concat(month_parts, ignore_index=True).groupby('month')[MONTH_MEASURES].first()
+
+    def rollup(keys):
+        return base.groupby(keys, dropna=False)['cost_amt'].sum().reset_index()
+
+    by_month = rollup(['month']).join(months, on='month')
+    monthly_data = rollup(['month', 'category_l1']).join(months, on='month')
+
+    rollups = {
+        'by_month': by_month.to_dict(orient='records'),
+        'by_category': rollup(['month', 'category_l1', 'category_l2', 'category_l3']).to_dict(orient='records'),
+        'by_cctr_type': rollup(['month', 'cctr_type']).to_dict(orient='records'),
+    }
+    return monthly_data.to_dict(orient='records'), rollups
+
+
+def build_brand_rollups(brand_data):
+    """브랜드 전체 데이터로 롤업 생성 (build_rollups 단일 부분 버전)"""
+    cost_part, month_part = aggregate_rollup_part(brand_data)
+    return build_rollups([cost_part], [month_part])
+
+
+def detail_filename(output_path, brand_code, month):
+    """상세 데이터 파일 경로"""
+    return f"{output_path}/{brand_code}_{month}_detail.json"
+
+
+def write_detail_json(filename, records):
+    """
+    상세 행을 JSON 배열로 저장 (레코드를 하나씩 스트리밍, 공백 없는 형식)
+    """
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for i, record in enumerate(records):
+            if i:
+                f.write(',\n')
+            f.write(json.dumps(record, ensure_ascii=False))
+        f.write(']')
@@ -3,11 +3,15 @@
 pandas, openai, snowflake 사용 예제
 """
 
-import pandas as pd
 import json
 import sys
 
-def main():
+from lazy_imports import lazy_import
+
+pd = lazy_import('pandas')
+
+def run():
+    """예제 실행 결과를 dict로 반환 (python_worker.py에서 직접 호출)"""
     # pandas 예제: 간단한 데이터프레임 생성
     data = {
         '이름': ['홍길동', '김철수', '이영희'],
@@ -28,8 +32,11 @@ def main():
         }
     }
     
+    return result
+
+def main():
     # JSON 형태로 출력 (Next.js API에서 읽을 수 있도록)
-    print(json.dumps(result, ensure_ascii=False))
+    print(json.dumps(run(), ensure_ascii=False))
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,156 @@
+"""
+OpenAI Chat Completions 호환 로컬 가짜 서버
+(insight_generator.py 등을 API 키/비용 없이 테스트)
+
+- POST .../chat/completions: 프롬프트 해시 기반의 고정 인사이트 JSON 응답
+- --rate-limit-every N: N번째 요청마다 429 (Retry-After 헤더 포함)
+- --error-every N: N번째 요청마다 500
+- --latency: 응답 지연 (초)
+- GET /stats: 요청/응답 건수
+
+사용법:
+    python fake_openai_server.py --port 8765 --latency 0.5 --rate-limit-every 7
+    python insight_generator.py --months 202510 --base-url http://127.0.0.1:8765/v1
+"""
+
+import json
+import time
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.0, rate_limit_every=0, error_every=0, retry_after=1.0):
+        super().__init__(address, FakeOpenAIHandler)
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.error_every = error_every
+        self.retry_after = retry_after
+        self.stats = {'requests': 0, 'completed': 0, 'rate_limited': 0, 'errors': 0}
+        self._lock = threading.Lock()
+
+    def next_request(self):
+        """요청 번호 증가 후 응답 종류 결정 ('ok', 'rate_limited', 'errors')"""
+        with self._lock:
+            self.stats['requests'] += 1
+            n = self.stats['requests']
+            if self.rate_limit_every and n % self.rate_limit_every == 0:
+                outcome = 'rate_limited'
+            elif self.error_every and n % self.error_every == 0:
+                outcome = 'errors'
+            else:
+                outcome = 'completed'
+            self.stats[outcome] += 1
+            return n, outcome
+
+
+def fake_insight(prompt):
+    """프롬프트 해시로 만든 고정 인사이트 (같은 프롬프트 → 같은 응답)"""
+    digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:8]
+    return {
+        'summary': f'테스트 요약 {digest}',
+        'key_findings': [f'발견사항 {i} ({digest})' for i in range(1, 4)],
+        'risks': [f'리스크 {i} ({digest})' for i in range(1, 3)],
+        'action_items': [f'액션 {i} ({digest})' for i in range(1, 4)],
+    }
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip('/').endswith('/stats'):
+            self._send_json(200, self.server.stats)
+        else:
+            self._send_json(404, {'error': {'message': 'not found'}})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send_json(404, {'error': {'message': 'not found'}})
+            return
+
+        n, outcome = self.server.next_request()
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if outcome == 'rate_limited':
+            self._send_json(429, {'error': {'message': 'Rate limit reached', 'type': 'requests',
+                                            'code': 'rate_limit_exceeded'}},
+                            {'retry-after': str(self.server.retry_after)})
+            return
+        if outcome == 'errors':
+            self._send_json(500, {'error': {'message': 'Internal server error', 'type': 'server_error'}})
+            return
+
+        prompt = '\n'.join(message.get('content', '') for message in request.get('messages', []))
+        content = json.dumps(fake_insight(prompt), ensure_ascii=False)
+        self._send_json(200, {
+            'id': f'chatcmpl-fake-{n}',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'fake'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop',
+            }],
+            'usage': {
+                'prompt_tokens': len(prompt),
+                'completion_tokens': len(content),
+                'total_tokens': len(prompt) + len(content),
+            },
+        })
+
+
+def start_server(host='127.0.0.1', port=0, **options):
+    """백그라운드 스레드로 서버 시작 → (server, base_url) (port=0이면 빈 포트 사용)"""
+    server = FakeOpenAIServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://{host}:{server.server_address[1]}/v1'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI Chat Completions 호환 로컬 가짜 서버')
+    parser.add_argument('--host', default='127.0.0.1', help='바인딩 주소')
+    parser.add_argument('--port', type=int, default=8765, help='포트 (기본 8765)')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 초')
+    parser.add_argument('--rate-limit-every', type=int, default=0, help='N번째 요청마다 429 응답')
+    parser.add_argument('--error-every', type=int, default=0, help='N번째 요청마다 500 응답')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='429 응답의 Retry-After 초')
+
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer((args.host, args.port), latency=args.latency,
+                              rate_limit_every=args.rate_limit_every, error_every=args.error_every,
+                              retry_after=args.retry_after)
+    print(f"✓ 가짜 OpenAI 서버 실행: http://{args.host}:{args.port}/v1 (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"요청 통계: {server.stats}")
+
+
+if __name__ == '__main__':
+    main()
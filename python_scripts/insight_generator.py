@@ -0,0 +1,507 @@
+"""
+AI 인사이트 일괄 생성 스크립트
+(scripts/generate-ai-insights.js의 Python 버전 - 브랜드 × 월 인사이트를 동시에 생성)
+
+- asyncio 워커 풀로 여러 요청을 동시에 처리 (--concurrency)
+- 분당 요청 수 제한 (--rpm) + 429 응답 시 Retry-After 동안 전체 워커 일시 정지
+- 일시적 오류(429/5xx/연결/타임아웃)는 지수 백오프 + 지터로 재시도
+- 응답 캐시: 요청 내용(입력 데이터가 포함된 프롬프트) 해시를 키로 저장
+  → 브랜드/카테고리 데이터가 바뀌지 않으면 API를 다시 호출하지 않음
+
+사용법:
+    python insight_generator.py --months 202510
+    python insight_generator.py --months 202509 202510 --brands MLB DISCOVERY --concurrency 8
+
+    # 로컬 가짜 엔드포인트로 테스트 (API 키/비용 없음)
+    python fake_openai_server.py --port 8765
+    python insight_generator.py --months 202510 --base-url http://127.0.0.1:8765/v1
+
+환경변수 필요:
+    OPENAI_API_KEY (--base-url로 로컬 엔드포인트를 지정하면 생략 가능)
+"""
+
+import os
+import sys
+import json
+import random
+import asyncio
+import hashlib
+import argparse
+from pathlib import Path
+
+from lazy_imports import lazy_import
+from month_utils import shift_month
+
+pd = lazy_import('pandas')
+openai = lazy_import('openai')
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'public' / 'data'
+OUTPUT_DIR = DATA_DIR / 'ai_insights'
+CACHE_DIR = BASE_DIR / '.cache' / 'insights'
+
+BRANDS = ['MLB', 'MLB_KIDS', 'DISCOVERY', 'DUVETICA', 'SERGIO_TACCHINI']
+
+# 대시보드 브랜드 코드 → Snowflake 브랜드 코드
+BRAND_CODE_MAP = {
+    'MLB': 'M',
+    'MLB_KIDS': 'I',
+    'DISCOVERY': 'X',
+    'DUVETICA': 'V',
+    'SERGIO_TACCHINI': 'ST',
+}
+
+# 대시보드 브랜드 코드 → ledger_insights 파일명 브랜드
+LEDGER_BRAND_NAMES = {
+    'MLB': 'MLB',
+    'MLB_KIDS': 'MLB_KIDS',
+    'DISCOVERY': 'Discovery',
+    'DUVETICA': 'Duvetica',
+    'SERGIO_TACCHINI': 'SERGIO_TACCHINI',
+}
+
+# 요청 설정
+MODEL = 'gpt-4o'
+TEMPERATURE = 0.3
+MAX_TOKENS = 3000
+SYSTEM_PROMPT = '당신은 패션 브랜드의 재무 및 비용 분석 전문가입니다. 데이터를 깊이 있게 분석하여 실용적이고 구체적인 인사이트를 제공합니다.'
+
+# 응답 필드 (CSV 저장 순서)
+INSIGHT_FIELDS = ['summary', 'key_findings', 'risks', 'action_items']
+
+# 재시도 설정 (초)
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+# 재시도 대상 오류 이름 (요청 내용 문제가 아닌 일시적 오류, openai 모듈의 예외 클래스)
+RETRYABLE_ERRORS = ('RateLimitError', 'APIConnectionError', 'APITimeoutError', 'InternalServerError')
+
+
+# ---------------------------------------------------------------------------
+# 입력 데이터
+# ---------------------------------------------------------------------------
+
+def load_source_tables(data_dir=DATA_DIR):
+    """
+    매출/비용/매장 CSV를 한 번만 읽어 (브랜드, 월) 단위로 집계 (금액은 백만원)
+    - 비용은 공통비 제외
+    """
+    def read(name):
+        return pd.read_csv(Path(data_dir) / name, encoding='utf-8-sig',
+                           dtype={'YYYYMM': str, 'PST_YYYYMM': str, 'BRD_CD': str})
+
+    sales = read('snowflake_sales.csv')
+    costs = read('snowflake_costs.csv')
+    stores = read('snowflake_stores.csv')
+
+    costs = costs[costs['CATEGORY_L1'] != '공통비']
+    costs = costs.assign(
+        CATEGORY_L1=costs['CATEGORY_L1'].fillna('기타'),
+        COST_AMT=pd.to_numeric(costs['COST_AMT'], errors='coerce').fillna(0),
+    )
+    cost_by_category = costs.groupby(['BRD_CD', 'YYYYMM', 'CATEGORY_L1'])['COST_AMT'].sum() / 1_000_000
+
+    return {
+        'sales': pd.to_numeric(sales['TOTAL_SALES'], errors='coerce').fillna(0)
+                   .groupby([sales['BRD_CD'], sales['YYYYMM']]).sum() / 1_000_000,
+        'cost': cost_by_category.groupby(level=['BRD_CD', 'YYYYMM']).sum(),
+        'cost_by_category': cost_by_category,
+        'stores': pd.to_numeric(stores['STORE_COUNT'], errors='coerce').fillna(0)
+                    .groupby([stores['BRD_CD'], stores['PST_YYYYMM']]).sum(),
+        'headcount': {},
+    }
+
+
+def _headcount(tables, data_dir, brand, month):
+    """월별 인원수 파일(headcount/headcount_YYYYMM.csv)에서 브랜드 인원수 (월별 1회 로드)"""
+    if month not in tables['headcount']:
+        df = pd.read_csv(Path(data_dir) / 'headcount' / f'headcount_{month}.csv')
+        tables['headcount'][month] = dict(zip(df['brand_code'], df['headcount']))
+    return int(tables['headcount'][month].get(brand, 0) or 0)
+
+
+def _category_costs(tables, code, month):
+    key = (code, month)
+    if key not in tables['cost'].index:
+        return {}
+    return tables['cost_by_category'].loc[key].to_dict()
+
+
+def brand_month_payload(tables, brand, month, data_dir=DATA_DIR):
+    """
+    브랜드 × 월 프롬프트 입력 데이터 (KPI, 최근 6개월 추이, 카테고리별 비용)
+    """
+    code = BRAND_CODE_MAP[brand]
+    cost = tables['cost']
+
+    def month_cost(target):
+        return float(cost.get((code, target), 0.0))
+
+    total_sales = float(tables['sales'].get((code, month), 0.0))
+    total_cost = month_cost(month)
+    headcount = _headcount(tables, data_dir, brand, month)
+    store_count = int(tables['stores'].get((code, month), 0))
+    prev_total_cost = month_cost(shift_month(month, -12))
+
+    kpi = {
+        'total_cost': round(total_cost),
+        'cost_ratio': round(total_cost / total_sales * 100, 1) if total_sales > 0 else 0,
+        'cost_per_person': round(total_cost / headcount, 1) if headcount > 0 else 0,
+        'cost_per_store': round(total_cost / store_count, 1) if store_count > 0 else 0,
+        'yoy': round((total_cost - prev_total_cost) / prev_total_cost * 100, 1) if prev_total_cost > 0 else 0,
+    }
+
+    trend = []
+    for offset in range(-5, 1):
+        target = shift_month(month, offset)
+        target_cost = month_cost(target)
+        prev_cost = month_cost(shift_month(target, -12))
+        trend.append({
+            'month': target,
+            'total_cost': round(target_cost),
+            'yoy': (target_cost - prev_cost) / prev_cost * 100 if prev_cost > 0 else 0,
+        })
+
+    current = _category_costs(tables, code, month)
+    previous = _category_costs(tables, code, shift_month(month, -12))
+    categories = sorted(
+        ({'category': name, 'current': round(amount), 'previous': round(previous.get(name, 0))}
+         for name, amount in current.items()),
+        key=lambda cat: cat['current'],
+        reverse=True,
+    )
+
+    return {'kpi': kpi, 'trend': trend, 'categories': categories}
+
+
+def load_ledger_insights(brand, month, data_dir=DATA_DIR, limit=20):
+    """ledger_insights의 L3 계정 인사이트 (금액 절대값 큰 순 상위 limit개)"""
+    path = Path(data_dir) / 'ledger_insights' / f'{LEDGER_BRAND_NAMES[brand]}_{month}_insights.csv'
+    if not path.exists():
+        return []
+
+    df = pd.read_csv(path, encoding='utf-8-sig', dtype=str).fillna('')
+    df = df[df['level'] == 'L3']
+    for col in ['current_amount', 'prev_amount', 'diff', 'yoy']:
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    df = df.reindex(df['current_amount'].abs().sort_values(ascending=False).index).head(limit)
+    return df.to_dict(orient='records')
+
+
+def build_prompt(brand, month, payload, ledger_items):
+    """인사이트 요청 프롬프트 (generate-ai-insights.js와 같은 구성)"""
+    kpi = payload['kpi']
+
+    trend_summary = '\n'.join(
+        f"{d['month'][4:6]}월: {d['total_cost']:,}백만원 (YOY {d['yoy']:.1f}%)" for d in payload['trend']
+    ) or '데이터 없음'
+
+    category_lines = []
+    for cat in payload['categories'][:10]:
+        diff = cat['current'] - cat['previous']
+        yoy = f"{diff / cat['previous'] * 100:.1f}" if cat['previous'] > 0 else 0
+        ratio = cat['current'] / kpi['total_cost'] * 100 if kpi['total_cost'] else 0
+        category_lines.append(
+            f"- {cat['category']}: {cat['current']:,}백만원 (비중 {ratio:.1f}%, YOY {yoy}%, "
+            f"증감 {'+' if diff >= 0 else ''}{diff:,}백만원)"
+        )
+
+    ledger_summary = '\n'.join(
+        f"- {item['category_l1']} > {item['category_l3']}: {item['current_amount'] / 1_000_000:.0f}백만원 "
+        f"(YOY {item['yoy']:.1f}%, {'+' if item['diff'] >= 0 else ''}{item['diff'] / 1_000_000:.0f}백만원) - {item['insight']}"
+        for item in ledger_items
+    ) or '상세 데이터 없음'
+
+    return f"""당신은 패션 브랜드의 재무 및 비용 분석 전문가입니다. 다음 데이터를 **깊이 있게 분석**하여 실용적이고 구체적인 인사이트를 제공해주세요.
+
+## 📊 브랜드 정보
+- 브랜드: {brand}
+- 기준월: {month[:4]}년 {month[4:6]}월
+
+## 💰 핵심 KPI 지표
+- 총비용: {kpi['total_cost']:,}백만원
+- 매출대비 비용률: {kpi['cost_ratio']}%
+- 인당 비용: {kpi['cost_per_person']}백만원
+- 전년 대비 증감률(YOY): {kpi['yoy']}%
+
+**참고**: 매장 운영비는 직접비로 분류되어 이 대시보드에는 포함되지 않습니다.
+
+## 📈 월별 비용 추이 (최근 12개월)
+{trend_summary}
+
+## 🎯 주요 비용 카테고리 (TOP 10)
+{chr(10).join(category_lines)}
+
+## 📋 계정별 상세 내역 (금액 큰 순 TOP 20)
+{ledger_summary}
+
+## 🔍 분석 요구사항
+1. **트렌드 분석**: 12개월 추이에서 패턴(계절성, 증가/감소 추세, 변곡점)을 식별하세요
+2. **카테고리 심층 분석**: 계정별 상세 내역을 참고하여 주목할 만한 변동(급증/급감)과 구체적 원인을 파악하세요
+3. **효율성 평가**: 매출대비 비용률, 인당 비용의 적정성을 평가하세요
+4. **리스크 식별**: 비용 증가 리스크, 비효율 요인, 관리 포인트를 찾으세요
+5. **실행 가능한 제안**: 구체적이고 즉시 실행 가능한 액션 아이템을 제시하세요 (부서명 제외)
+
+## 📝 출력 형식 (JSON)
+{{
+  "summary": "전체 요약 (3-4문장, 핵심 수치와 트렌드 포함)",
+  "key_findings": ["주요 발견사항 1 (구체적 수치와 계정명 포함)", "주요 발견사항 2 (구체적 수치와 계정명 포함)", "주요 발견사항 3 (구체적 수치와 계정명 포함)"],
+  "risks": ["리스크 요인 1 (영향도 포함)", "리스크 요인 2 (영향도 포함)"],
+  "action_items": ["실행 가능한 액션 1", "실행 가능한 액션 2", "실행 가능한 액션 3"]
+}}"""
+
+
+def build_request(prompt, model=MODEL):
+    """chat.completions.create 인자 (캐시 키 계산에도 그대로 사용)"""
+    return {
+        'model': model,
+        'messages': [
+            {'role': 'system', 'content': SYSTEM_PROMPT},
+            {'role': 'user', 'content': prompt},
+        ],
+        'response_format': {'type': 'json_object'},
+        'temperature': TEMPERATURE,
+        'max_tokens': MAX_TOKENS,
+    }
+
+
+def build_jobs(brands, months, data_dir=DATA_DIR, output_dir=OUTPUT_DIR, model=MODEL):
+    """브랜드 × 월 작업 목록 (입력 데이터가 없는 조합은 건너뜀)"""
+    tables = load_source_tables(data_dir)
+    jobs = []
+    for brand in brands:
+        for month in months:
+            try:
+                payload = brand_month_payload(tables, brand, month, data_dir)
+            except FileNotFoundError as e:
+                print(f"⚠ 데이터 없음, 스킵 [{brand} {month}]: {e.filename}")
+                continue
+            prompt = build_prompt(brand, month, payload, load_ledger_insights(brand, month, data_dir))
+            jobs.append({
+                'label': f'{brand} {month}',
+                'request': build_request(prompt, model),
+                'output': Path(output_dir) / f'insights_{brand}_{month}.csv',
+            })
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+# 응답 캐시 / 저장
+# ---------------------------------------------------------------------------
+
+def request_key(request):
+    """요청 내용 SHA-256 (모델, 프롬프트, 생성 옵션이 모두 같으면 같은 키)"""
+    canonical = json.dumps(request, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _cache_file(key):
+    return CACHE_DIR / key[:2] / f'{key}.json'
+
+
+def load_cached(key):
+    path = _cache_file(key)
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def store_cached(key, insights):
+    path = _cache_file(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(insights, f, ensure_ascii=False)
+    tmp_path.replace(path)
+
+
+def parse_insights(content):
+    """응답 JSON 검증 (필수 필드 누락 시 ValueError)"""
+    insights = json.loads(content)
+    missing = [field for field in INSIGHT_FIELDS if field not in insights]
+    if missing:
+        raise ValueError(f"응답에 필드 누락: {missing}")
+    return insights
+
+
+def save_insight_csv(path, insights):
+    """인사이트 CSV 저장 (field,value 형식, 목록은 '|'로 연결, UTF-8 BOM)"""
+    def quote(value):
+        if isinstance(value, list):
+            value = '|'.join(str(item) for item in value)
+        return '"' + str(value).replace('"', '""') + '"'
+
+    lines = ['field,value'] + [f'{field},{quote(insights[field])}' for field in INSIGHT_FIELDS]
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write('\ufeff' + '\n'.join(lines))
+
+
+# ---------------------------------------------------------------------------
+# 동시 요청 / 재시도
+# ---------------------------------------------------------------------------
+
+class RateLimiter:
+    """
+    워커 간 공유하는 요청 속도 제한
+    - 요청 시작 간격을 60 / requests_per_minute 초 이상으로 유지
+    - pause(): 429 응답 시 모든 워커의 다음 요청을 지정 시간 동안 보류
+    """
+
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._next_slot = 0.0
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            start = max(now, self._next_slot, self._resume_at)
+            self._next_slot = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def pause(self, seconds):
+        resume_at = asyncio.get_running_loop().time() + seconds
+        self._resume_at = max(self._resume_at, resume_at)
+
+
+def _retry_after(error):
+    """429 응답의 Retry-After 헤더 (초, 없으면 None)"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if 'retry-after-ms' in headers:
+            return float(headers['retry-after-ms']) / 1000
+        if 'retry-after' in headers:
+            return float(headers['retry-after'])
+    except ValueError:
+        pass
+    return None
+
+
+def _backoff(attempt):
+    """지수 백오프 + 지터 (BACKOFF_BASE * 2^attempt, 최대 BACKOFF_MAX)"""
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+async def complete(client, request, limiter, max_retries=5):
+    """요청 1건 실행 (일시적 오류는 백오프 후 재시도) → 인사이트 dict"""
+    retryable = tuple(getattr(openai, name) for name in RETRYABLE_ERRORS)
+    for attempt in range(max_retries + 1):
+        await limiter.wait()
+        try:
+            response = await client.chat.completions.create(**request)
+            return parse_insights(response.choices[0].message.content)
+        except retryable as e:
+            if attempt == max_retries:
+                raise
+            delay = _backoff(attempt)
+            if isinstance(e, openai.RateLimitError):
+                delay = max(delay, _retry_after(e) or 0)
+                limiter.pause(delay)
+            print(f"  ↻ {type(e).__name__}, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            await asyncio.sleep(delay)
+
+
+async def generate_all(jobs, client, concurrency=4, requests_per_minute=60, max_retries=5, refresh=False):
+    """
+    작업 목록을 워커 풀로 처리하고 결과 CSV 저장
+
+    Args:
+        refresh: True면 캐시를 읽지 않고 다시 생성 (결과는 캐시에 저장)
+
+    Returns:
+        {'cached': n, 'generated': n, 'failed': n}
+    """
+    limiter = RateLimiter(requests_per_minute)
+    pending = asyncio.Queue()
+    for job in jobs:
+        pending.put_nowait(job)
+    stats = {'cached': 0, 'generated': 0, 'failed': 0}
+
+    async def worker():
+        while True:
+            try:
+                job = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            key = request_key(job['request'])
+            try:
+                insights = None if refresh else load_cached(key)
+                if insights is not None:
+                    source = 'cached'
+                else:
+                    insights = await complete(client, job['request'], limiter, max_retries)
+                    store_cached(key, insights)
+                    source = 'generated'
+                save_insight_csv(job['output'], insights)
+                stats[source] += 1
+                print(f"✓ {job['label']} ({'캐시' if source == 'cached' else '생성'})")
+            except Exception as e:
+                stats['failed'] += 1
+                print(f"✗ {job['label']}: {e}")
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(jobs))))))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='브랜드 × 월 AI 인사이트 일괄 생성')
+    parser.add_argument('--months', nargs='+', required=True, help='생성할 월 목록 (YYYYMM)')
+    parser.add_argument('--brands', nargs='+', default=BRANDS, choices=BRANDS, help='생성할 브랜드 (기본: 전체)')
+    parser.add_argument('--data-dir', default=str(DATA_DIR), help='입력 데이터 디렉토리')
+    parser.add_argument('--output', default=str(OUTPUT_DIR), help='출력 디렉토리')
+    parser.add_argument('--model', default=MODEL, help=f'모델 (기본 {MODEL})')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 요청 수 (기본 4)')
+    parser.add_argument('--rpm', type=int, default=60, help='분당 최대 요청 수 (0이면 제한 없음, 기본 60)')
+    parser.add_argument('--max-retries', type=int, default=5, help='일시적 오류 재시도 횟수 (기본 5)')
+    parser.add_argument('--timeout', type=float, default=120, help='요청 타임아웃 초 (기본 120)')
+    parser.add_argument('--base-url', help='OpenAI 호환 엔드포인트 (테스트용 로컬 서버 등)')
+    parser.add_argument('--refresh', action='store_true', help='캐시를 무시하고 다시 생성')
+
+    args = parser.parse_args()
+
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        if not args.base_url:
+            print("✗ OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
+            sys.exit(1)
+        api_key = 'local'
+
+    print(f"\n{'='*60}")
+    print("AI 인사이트 생성")
+    print(f"브랜드: {', '.join(args.brands)} / 월: {', '.join(args.months)}")
+    print(f"{'='*60}\n")
+
+    jobs = build_jobs(args.brands, args.months, args.data_dir, args.output, args.model)
+    print(f"작업 {len(jobs)}건 (동시 {args.concurrency}, 분당 {args.rpm or '무제한'})\n")
+
+    # 재시도는 generate_all에서 직접 처리 (클라이언트 자체 재시도 비활성화)
+    client = openai.AsyncOpenAI(api_key=api_key, base_url=args.base_url, max_retries=0, timeout=args.timeout)
+
+    async def run():
+        async with client:
+            return await generate_all(jobs, client, args.concurrency, args.rpm, args.max_retries, args.refresh)
+
+    stats = asyncio.run(run())
+
+    print(f"\n{'='*60}")
+    print(f"✓ 생성 {stats['generated']}건 / 캐시 {stats['cached']}건 / ✗ 실패 {stats['failed']}건")
+    print(f"저장 위치: {args.output}")
+    print(f"{'='*60}\n")
+
+    if stats['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
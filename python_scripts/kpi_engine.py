@@ -0,0 +1,111 @@
+"""
+대시보드 KPI 계산 모듈
+- 병합된 비용 데이터에서 모든 (브랜드, 월)의 KPI를 한 번의 groupby로 계산
+- 합계 기반 부분 집계를 사용하므로 청크 단위 스트리밍 처리에도 사용 가능
+"""
+
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+KPI_KEYS = ['brand_code', 'month']
+
+# KPI 계산에 필요한 (합산 가능한) 부분 집계 컬럼
+KPI_SUM_COLUMNS = ['cost', 'sale', 'headcount', 'store_cnt', 'rows']
+
+KPI_COLUMNS = ['total_cost', 'cost_ratio', 'cost_per_person', 'cost_per_store', 'yoy']
+
+EMPTY_KPI = dict.fromkeys(KPI_COLUMNS, 0)
+
+
+def _month_key(months):
+    """월 컬럼을 'YYYYMM' 문자열 키로 통일 (정수/문자열 혼용 대응)"""
+    if pd.api.types.is_numeric_dtype(months):
+        return months.astype('int64').astype(str)
+    return months.astype(str).str.strip()
+
+
+def aggregate_kpi_part(df):
+    """
+    병합된 비용 데이터(전체 또는 청크)를 (브랜드, 월)별 합계로 부분 집계
+
+    인원수/매장수는 행마다 반복되므로 합계와 행수를 함께 보관해 평균을 계산한다.
+    """
+    keyed = df.assign(month=_month_key(df['month']))
+    return keyed.groupby(KPI_KEYS).agg(
+        cost=('cost_amt', 'sum'),
+        sale=('sale_amt', 'sum'),
+        headcount=('headcount', 'sum'),
+        store_cnt=('store_cnt', 'sum'),
+        rows=('cost_amt', 'size'),
+    )
+
+
+def compute_kpi_table(parts):
+    """
+    부분 집계를 합산해 (브랜드, 월)별 KPI 테이블 생성
+
+    Args:
+        parts: aggregate_kpi_part 결과 목록 (또는 병합된 데이터프레임 하나)
+
+    Returns:
+        (brand_code, month) 인덱스의 KPI 데이터프레임
+    """
+    if isinstance(parts, pd.DataFrame):
+        parts = [aggregate_kpi_part(parts)]
+
+    totals = pd.concat(parts).groupby(level=KPI_KEYS)[KPI_SUM_COLUMNS].sum()
+    totals = totals[totals['rows'] > 0]
+
+    cost = totals['cost'].astype(float)
+    sale = totals['sale'].astype(float)
+    avg_headcount = totals['headcount'] / totals['rows']
+    avg_stores = totals['store_cnt'] / totals['rows']
+
+    # 전년 동월 비용 (YYYYMM - 100, 없으면 당월 비용 → YoY 0)
+    brands = totals.index.get_level_values('brand_code')
+    prev_months = (totals.index.get_level_values('month').astype('int64') - 100).astype(str)
+    prev_index = pd.MultiIndex.from_arrays([brands, prev_months], names=KPI_KEYS)
+    prev_cost = pd.Series(cost.reindex(prev_index).to_numpy(), index=totals.index).fillna(cost)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        table = pd.DataFrame({
+            'total_cost': cost.round(),
+            'total_sale': sale,
+            'avg_headcount': avg_headcount,
+            'avg_stores': avg_stores,
+            'prev_total_cost': prev_cost,
+            'cost_ratio': np.where(sale > 0, (cost / sale * 100).round(1), 0),
+            'cost_per_person': np.where(avg_headcount > 0, (cost / avg_headcount / 1_000_000).round(1), 0),
+            'cost_per_store': np.where(avg_stores > 0, (cost / avg_stores / 1_000_000).round(1), 0),
+            'yoy': np.where(prev_cost > 0, ((cost - prev_cost) / prev_cost * 100).round(1), 0),
+        }, index=totals.index)
+
+    return table
+
+
+def _kpi_record(row):
+    return {
+        'total_cost': int(row['total_cost']),
+        'cost_ratio': float(row['cost_ratio']),
+        'cost_per_person': float(row['cost_per_person']),
+        'cost_per_store': float(row['cost_per_store']),
+        'yoy': float(row['yoy']),
+    }
+
+
+def kpi_for(kpi_table, brand_code, month):
+    """KPI 테이블에서 (브랜드, 월) KPI 조회 (데이터가 없으면 0)"""
+    key = (brand_code, _month_key(pd.Series([month])).iloc[0])
+    if key not in kpi_table.index:
+        return dict(EMPTY_KPI)
+    return _kpi_record(kpi_table.loc[key])
+
+
+def kpi_history(kpi_table, brand_code):
+    """브랜드의 전체 월별 KPI 이력 (월 오름차순)"""
+    if brand_code not in kpi_table.index.get_level_values('brand_code'):
+        return []
+    brand_table = kpi_table.xs(brand_code, level='brand_code').sort_index()
+    return [{'month': month, **_kpi_record(row)} for month, row in brand_table.iterrows()]
@@ -0,0 +1,57 @@
+"""
+지연 import 유틸리티
+- 웹 계층에서 호출되는 스크립트의 시작 시간을 줄이기 위해 pandas 등 무거운 모듈을
+  처음 속성에 접근할 때 로드 (설정 오류/도움말처럼 모듈이 필요 없는 경로는 import 비용 없음)
+- 시작 시간 예산은 startup_benchmark.py로 확인
+"""
+
+import sys
+import threading
+import importlib
+import importlib.util
+from types import ModuleType
+
+
+def module_available(name):
+    """모듈 설치 여부 (import하지 않고 확인)"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+class LazyModule(ModuleType):
+    """
+    첫 속성 접근 시 실제 모듈을 import하는 대리 모듈
+    - import는 잠금 안에서 한 번만 수행 (여러 스레드가 동시에 처음 접근해도 안전)
+    - 로드 후에는 실제 모듈의 속성을 복사해 이후 접근은 일반 모듈과 같은 속도
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self._lazy_lock = threading.Lock()
+        self._lazy_module = None
+
+    def _load(self):
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                module = importlib.import_module(self.__name__)
+                self.__dict__.update(
+                    (key, value) for key, value in module.__dict__.items() if key != '__name__'
+                )
+                self._lazy_module = module
+        return self._lazy_module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name):
+    """지연 로드 모듈 반환 (이미 import된 모듈은 그대로 반환)"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
@@ -0,0 +1,20 @@
+"""
+연월(YYYYMM 문자열) 계산 모듈
+- 표준 라이브러리만 사용 (캐시/DB 모듈과 무관하게 어디서나 import)
+"""
+
+
+def shift_month(yyyymm, delta):
+    """YYYYMM 문자열을 delta개월 이동"""
+    index = int(yyyymm[:4]) * 12 + int(yyyymm[4:]) - 1 + delta
+    return f"{index // 12}{index % 12 + 1:02d}"
+
+
+def month_range(start_month, end_month):
+    """start_month ~ end_month (포함) 월 목록"""
+    months = []
+    month = start_month
+    while month <= end_month:
+        months.append(month)
+        month = shift_month(month, 1)
+    return months
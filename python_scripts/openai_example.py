@@ -6,24 +6,34 @@ OpenAI API 사용 예제
 import os
 import json
 import sys
-from openai import OpenAI
 
-def main():
+def create_client(api_key):
+    """OpenAI 클라이언트 생성 (python_worker.py는 생성한 클라이언트를 재사용)"""
+    # SDK import는 API 키 확인 후에만 (키가 없는 경우 빠르게 오류 응답)
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+def run(client=None):
+    """
+    예제 실행 결과를 dict로 반환
+
+    Args:
+        client: 재사용할 OpenAI 클라이언트 (없으면 새로 생성)
+    """
     try:
         # 환경변수에서 API 키 읽기
         api_key = os.getenv('OPENAI_API_KEY')
-        
+
         if not api_key:
-            result = {
+            return {
                 'success': False,
                 'error': 'OPENAI_API_KEY 환경변수가 설정되지 않았습니다.'
             }
-            print(json.dumps(result, ensure_ascii=False))
-            return
-        
+
         # OpenAI 클라이언트 초기화
-        client = OpenAI(api_key=api_key)
-        
+        if client is None:
+            client = create_client(api_key)
+
         # 간단한 채팅 완성 예제
         response = client.chat.completions.create(
             model="gpt-3.5-turbo",
@@ -33,8 +43,8 @@ def main():
             ],
             max_tokens=100
         )
-        
-        result = {
+
+        return {
             'success': True,
             'response': response.choices[0].message.content,
             'model': response.model,
@@ -44,16 +54,15 @@ def main():
                 'total_tokens': response.usage.total_tokens
             }
         }
-        
-        print(json.dumps(result, ensure_ascii=False))
-        
+
     except Exception as e:
-        result = {
+        return {
             'success': False,
             'error': str(e)
         }
-        print(json.dumps(result, ensure_ascii=False))
+
+def main():
+    print(json.dumps(run(), ensure_ascii=False))
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,207 @@
+"""
+상주 Python 워커 (app/api/python/route.js에서 사용)
+- 요청마다 인터프리터를 새로 띄우지 않고, 한 번 띄운 프로세스가 stdin/stdout JSON-RPC로 요청 처리
+- pandas 등 무거운 모듈은 시작 시 한 번만 import
+- OpenAI 클라이언트 / Snowflake 연결은 처음 사용할 때 만들어 재사용
+- 각 예제 스크립트의 run()을 핸들러로 호출 (스크립트 단독 실행 결과와 동일한 JSON)
+
+프로토콜 (한 줄에 JSON 하나):
+    요청: {"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"script": "example"}}
+    응답: {"jsonrpc": "2.0", "id": 1, "result": {...}}
+          {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "..."}}
+    메서드: run (스크립트 실행), ping (상태 확인), shutdown (종료)
+
+사용법:
+    python python_worker.py
+    echo '{"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"script": "example"}}' | python python_worker.py
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd  # noqa: F401 - 시작 시 미리 로드 (요청마다 import 비용 제거)
+
+import example
+import openai_example
+import snowflake_example
+
+# 동시에 처리할 요청 수
+WORKER_THREADS = 4
+
+# JSON-RPC 오류 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class WarmClients:
+    """
+    재사용하는 외부 클라이언트
+    - OpenAI: API 키별 클라이언트 1개 (스레드 간 공유 가능)
+    - Snowflake: 연결 1개 (잠금으로 한 번에 한 요청만 사용, 끊기면 다시 연결)
+    """
+
+    def __init__(self):
+        self._openai = {}
+        self._snowflake = None
+        self._snowflake_params = None
+        self._lock = threading.Lock()
+        self.snowflake_lock = threading.Lock()
+
+    def openai_client(self):
+        api_key = os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            return None
+        with self._lock:
+            if api_key not in self._openai:
+                self._openai[api_key] = openai_example.create_client(api_key)
+            return self._openai[api_key]
+
+    def snowflake_connection(self):
+        """snowflake_lock을 잡은 상태에서 호출"""
+        params = snowflake_example.connection_params()
+        if params is None:
+            return None
+        conn = self._snowflake
+        if conn is not None and (params != self._snowflake_params or conn.is_closed()):
+            self.drop_snowflake()
+            conn = None
+        if conn is None:
+            conn = snowflake_example.connect(params)
+            self._snowflake, self._snowflake_params = conn, params
+        return conn
+
+    def drop_snowflake(self):
+        if self._snowflake is not None:
+            with contextlib.suppress(Exception):
+                self._snowflake.close()
+        self._snowflake = None
+        self._snowflake_params = None
+
+    def close(self):
+        self.drop_snowflake()
+        for client in self._openai.values():
+            with contextlib.suppress(Exception):
+                client.close()
+        self._openai = {}
+
+
+def run_openai_example(clients):
+    return openai_example.run(client=clients.openai_client())
+
+
+def run_snowflake_example(clients):
+    with clients.snowflake_lock:
+        try:
+            conn = clients.snowflake_connection()
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+        result = snowflake_example.run(conn=conn)
+        if not result.get('success') and conn is not None:
+            clients.drop_snowflake()  # 오류 후에는 다음 요청에서 새로 연결
+        return result
+
+
+# 스크립트 이름 → 핸들러 (route.js의 허용 목록과 동일)
+SCRIPTS = {
+    'example': lambda clients: example.run(),
+    'openai_example': run_openai_example,
+    'snowflake_example': run_snowflake_example,
+}
+
+
+class Worker:
+    """stdin 요청을 스레드 풀에서 처리하고 stdout에 응답 기록"""
+
+    def __init__(self, output, threads=WORKER_THREADS):
+        self.output = output
+        self.clients = WarmClients()
+        self.started_at = time.time()
+        self.handled = 0
+        self._write_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+
+    def respond(self, request_id, result=None, error=None):
+        message = {'jsonrpc': '2.0', 'id': request_id}
+        if error is not None:
+            message['error'] = error
+        else:
+            message['result'] = result
+        line = json.dumps(message, ensure_ascii=False, default=str)
+        with self._write_lock:
+            self.output.write(line + '\n')
+            self.output.flush()
+
+    def dispatch(self, method, params):
+        """메서드 실행 → (result, error)"""
+        if method == 'ping':
+            return {'pid': os.getpid(), 'uptime': round(time.time() - self.started_at, 1),
+                    'handled': self.handled, 'scripts': list(SCRIPTS)}, None
+        if method != 'run':
+            return None, {'code': METHOD_NOT_FOUND, 'message': f'알 수 없는 메서드: {method}'}
+
+        script = params.get('script') if isinstance(params, dict) else None
+        handler = SCRIPTS.get(script)
+        if handler is None:
+            return None, {'code': INVALID_PARAMS, 'message': f'허용되지 않은 스크립트입니다: {script}'}
+        try:
+            return handler(self.clients), None
+        except Exception as e:
+            return None, {'code': INTERNAL_ERROR, 'message': str(e)}
+
+    def handle(self, request):
+        result, error = self.dispatch(request.get('method'), request.get('params') or {})
+        self.handled += 1
+        if 'id' in request:
+            self.respond(request['id'], result, error)
+
+    def serve(self, lines):
+        """요청 줄을 읽어 처리 (shutdown 또는 입력 종료 시 반환)"""
+        shutdown_request = None
+        try:
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    self.respond(None, error={'code': PARSE_ERROR, 'message': str(e)})
+                    continue
+                if not isinstance(request, dict) or 'method' not in request:
+                    self.respond(request.get('id') if isinstance(request, dict) else None,
+                                 error={'code': INVALID_REQUEST, 'message': '잘못된 요청'})
+                    continue
+                if request['method'] == 'shutdown':
+                    shutdown_request = request
+                    break
+                self._executor.submit(self.handle, request)
+        finally:
+            # 처리 중인 요청 응답을 모두 보낸 뒤 종료
+            self._executor.shutdown(wait=True)
+            self.clients.close()
+        if shutdown_request is not None and 'id' in shutdown_request:
+            self.respond(shutdown_request['id'], {'success': True})
+
+
+def main():
+    # 응답 전용 stdout 확보 - 핸들러/라이브러리의 print 출력은 stderr로 보냄
+    output = sys.stdout
+    sys.stdout = sys.stderr
+    if hasattr(sys.stdin, 'reconfigure'):
+        sys.stdin.reconfigure(encoding='utf-8')
+    if hasattr(output, 'reconfigure'):
+        output.reconfigure(encoding='utf-8')
+
+    Worker(output).serve(sys.stdin)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""
+실행 보고서 (단계별 계측) 모듈
+- with span('aggregate_costs', year_month=...) as record: 블록의 경과 시간, CPU 시간, 입출력 행 수, 최대 RSS 기록
+  (record['rows_in'], record['rows_out']에 행 수, 그 밖의 키는 그대로 기록)
+- start_run으로 보고서 파일(.cache/run_reports/<스크립트>.run.jsonl)을 열면 이후 span이 한 줄씩 추가되고,
+  finish_run이 실행 전체 요약 줄을 추가한 뒤 단계별 소요 시간을 출력
+  보고서를 열지 않았으면 span은 기록하지 않음 (계측 코드가 있는 함수를 다른 곳에서 호출해도 무해)
+- 호스트 경로/행 수가 담기므로 웹으로 제공되는 public/data가 아닌 .cache 아래에 저장
+- 보고서 경로는 환경변수로 자식 프로세스에 전달 (프로세스 풀 워커의 span도 같은 파일에 기록)
+- CPU 시간은 프로세스 전체 기준 (스레드 병렬 단계는 다른 스레드 사용량 포함),
+  최대 RSS는 프로세스 시작 이후 최댓값 (단계가 끝난 시점까지의 최고치)
+- 표준 라이브러리만 사용 (진입점 시작 시간에 영향 없도록)
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+REPORT_DIR = BASE_DIR / '.cache' / 'run_reports'
+
+# 자식 프로세스로 전달하는 환경변수
+REPORT_ENV = 'RUN_REPORT_FILE'
+RUN_ID_ENV = 'RUN_REPORT_ID'
+
+REPORT_SUFFIX = '.run.jsonl'
+
+_lock = threading.Lock()
+_run = {}
+_prepared = set()
+
+
+def report_file(script):
+    """스크립트 실행 보고서 경로 (.cache/run_reports/<스크립트>.run.jsonl)"""
+    return REPORT_DIR / f'{script}{REPORT_SUFFIX}'
+
+
+def _windows_peak_rss():
+    """Windows 최대 작업 집합 크기 (bytes)"""
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD)] + [
+            (name, ctypes.c_size_t) for name in (
+                'PeakWorkingSetSize', 'WorkingSetSize', 'QuotaPeakPagedPoolUsage', 'QuotaPagedPoolUsage',
+                'QuotaPeakNonPagedPoolUsage', 'QuotaNonPagedPoolUsage', 'PagefileUsage', 'PeakPagefileUsage')
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return None
+    return counters.PeakWorkingSetSize
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if os.name == 'nt':
+        peak = _windows_peak_rss()
+        return None if peak is None else round(peak / 1024 ** 2, 1)
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 KB
+    return round(peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+def count_rows(value):
+    """
+    단계 입출력 행 수
+    - 데이터프레임: 행 수, 리스트: 항목 수, 딕셔너리: 값이 데이터프레임이면 행 수 합계 (아니면 항목 수)
+    - None 또는 그 밖의 값: None
+    """
+    if value is None:
+        return None
+    if hasattr(value, 'shape'):
+        return int(value.shape[0])
+    if isinstance(value, dict):
+        frames = [item for item in value.values() if hasattr(item, 'shape')]
+        return sum(int(frame.shape[0]) for frame in frames) if frames else len(value)
+    if isinstance(value, (list, tuple)):
+        return len(value)
+    return None
+
+
+def _to_builtin(value):
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+def write_record(record):
+    """보고서에 한 줄 추가 (보고서가 없으면 무시)"""
+    path = os.environ.get(REPORT_ENV)
+    if not path:
+        return
+    line = json.dumps({'run_id': os.environ.get(RUN_ID_ENV), **record},
+                      ensure_ascii=False, default=_to_builtin) + '\n'
+    # 한 줄을 한 번에 추가 모드로 기록 (스레드는 잠금, 프로세스 간에는 O_APPEND)
+    with _lock:
+        if path not in _prepared:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            _prepared.add(path)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line)
+
+
+def start_run(path, script, **fields):
+    """
+    실행 보고서 시작 (기존 보고서는 삭제, 파일은 첫 기록 때 생성)
+
+    Args:
+        path: 보고서 파일 (report_file 결과)
+        script: 스크립트 이름
+        fields: 실행 요약 줄에 함께 기록할 값 (옵션 등)
+    """
+    path = Path(path)
+    path.unlink(missing_ok=True)
+
+    run_id = f"{datetime.now():%Y%m%d-%H%M%S}-{os.urandom(3).hex()}"
+    os.environ[REPORT_ENV] = str(path)
+    os.environ[RUN_ID_ENV] = run_id
+    _run.clear()
+    _run.update({
+        'path': path,
+        'script': script,
+        'fields': fields,
+        'start': datetime.now().isoformat(timespec='seconds'),
+        'wall': time.perf_counter(),
+        'cpu': time.process_time(),
+    })
+    return run_id
+
+
+@contextmanager
+def span(stage, **fields):
+    """
+    단계 계측 블록
+
+    Yields:
+        기록할 딕셔너리 (rows_in/rows_out 등 블록 안에서 채움)
+    """
+    record = {'rows_in': None, 'rows_out': None, **fields}
+    start = datetime.now().isoformat(timespec='milliseconds')
+    wall, cpu = time.perf_counter(), time.process_time()
+    status = 'ok'
+    try:
+        yield record
+    except SystemExit:
+        # 입력/설정 오류로 인한 종료는 기록하지 않음 (오류 메시지는 스크립트가 이미 출력)
+        status = None
+        raise
+    except BaseException:
+        status = 'error'
+        raise
+    finally:
+        if status is not None:
+            write_record({
+                'event': 'span',
+                'stage': stage,
+                **record,
+                'start': start,
+                'wall_ms': round((time.perf_counter() - wall) * 1000, 1),
+                'cpu_ms': round((time.process_time() - cpu) * 1000, 1),
+                'peak_rss_mb': peak_rss_mb(),
+                'pid': os.getpid(),
+                'thread': threading.current_thread().name,
+                'status': status,
+            })
+
+
+def read_report(path):
+    """보고서 파일 → 기록 목록"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def print_timings(records, limit=10):
+    """단계별 소요 시간 합계 출력 (오래 걸린 순)"""
+    totals = {}
+    for record in records:
+        if record.get('event') != 'span':
+            continue
+        total = totals.setdefault(record['stage'], {'count': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0, 'peak_rss_mb': 0})
+        total['count'] += 1
+        total['wall_ms'] += record['wall_ms']
+        total['cpu_ms'] += record['cpu_ms']
+        total['peak_rss_mb'] = max(total['peak_rss_mb'], record['peak_rss_mb'] or 0)
+
+    print(f"\n[TIMING] {'stage':<28} {'count':>6} {'wall s':>9} {'cpu s':>9} {'peak MB':>9}")
+    for stage, total in sorted(totals.items(), key=lambda item: item[1]['wall_ms'], reverse=True)[:limit]:
+        print(f"  {stage:<35} {total['count']:>6} {total['wall_ms'] / 1000:>9.2f} "
+              f"{total['cpu_ms'] / 1000:>9.2f} {total['peak_rss_mb']:>9.1f}")
+
+
+def finish_run(status='ok'):
+    """실행 요약 줄 추가, 단계별 소요 시간 출력 후 보고서 닫기"""
+    if not _run:
+        return
+    write_record({
+        'event': 'run',
+        'script': _run['script'],
+        **_run['fields'],
+        'start': _run['start'],
+        'wall_ms': round((time.perf_counter() - _run['wall']) * 1000, 1),
+        'cpu_ms': round((time.process_time() - _run['cpu']) * 1000, 1),
+        'peak_rss_mb': peak_rss_mb(),
+        'pid': os.getpid(),
+        'status': status,
+    })
+    print_timings(read_report(_run['path']))
+    print(f"[OK] Run report: {_run['path']}")
+
+    os.environ.pop(REPORT_ENV, None)
+    os.environ.pop(RUN_ID_ENV, None)
+    _run.clear()
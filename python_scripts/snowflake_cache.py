@@ -0,0 +1,118 @@
+"""
+Snowflake 추출 결과 로컬 캐시 모듈
+- 테이블 × 월(YYYYMM) 단위 파티션으로 저장 (Parquet, pyarrow가 없으면 pickle)
+- 마감된 월은 디스크에서 읽고, 열린 월(기준월과 전월)과 캐시에 없는 월만 다시 조회
+- 연속된 조회 대상 월은 BETWEEN 쿼리 한 번으로 묶어서 조회
+- 쿼리 문장/데이터 원천이 바뀌면 캐시 키가 달라져 자동으로 분리됨
+"""
+
+from pathlib import Path
+import hashlib
+
+from lazy_imports import lazy_import, module_available
+from month_utils import month_range, shift_month
+
+pd = lazy_import('pandas')
+
+CACHE_FORMAT = 'parquet' if module_available('pyarrow') else 'pickle'
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = BASE_DIR / '.cache' / 'snowflake'
+
+# 캐시 스키마 버전 (저장 형식이 바뀌면 올려서 기존 캐시 무효화)
+CACHE_VERSION = 1
+
+# 항상 다시 조회하는 열린 월 수 (기준월 포함, 기본: 기준월 + 전월)
+OPEN_MONTHS = 2
+
+# 파티션 기준 컬럼
+MONTH_COLUMN = 'month'
+
+
+def open_months(current_month, count=OPEN_MONTHS):
+    """아직 마감되지 않은 것으로 보는 월 목록 (기준월부터 과거로 count개월)"""
+    return [shift_month(current_month, -i) for i in range(count)]
+
+
+def cache_key(source, query):
+    """데이터 원천 + 쿼리 문장 해시 (캐시 디렉토리 이름)"""
+    return hashlib.sha256(f'{source}\n{query}'.encode('utf-8')).hexdigest()[:16]
+
+
+def _partition_file(name, key, month):
+    suffix = 'parquet' if CACHE_FORMAT == 'parquet' else 'pkl'
+    return CACHE_DIR / f'{name}_v{CACHE_VERSION}_{key}' / f'{month}.{suffix}'
+
+
+def _read_partition(path):
+    if CACHE_FORMAT == 'parquet':
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _write_partition(df, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if CACHE_FORMAT == 'parquet':
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_pickle(tmp_path)
+    tmp_path.replace(path)
+
+
+def _contiguous_ranges(months):
+    """정렬된 월 목록을 연속 구간 [(시작월, 종료월), ...]으로 묶음"""
+    ranges = []
+    for month in months:
+        if ranges and shift_month(ranges[-1][1], 1) == month:
+            ranges[-1][1] = month
+        else:
+            ranges.append([month, month])
+    return [tuple(r) for r in ranges]
+
+
+def load_partitioned(name, key, months, fetch, open_months=(), refresh_months=()):
+    """
+    월 파티션 캐시를 사용해 months 전체 데이터 로드
+
+    Args:
+        name: 테이블 이름 (캐시 디렉토리 접두어)
+        key: cache_key 결과 (원천/쿼리별 캐시 분리)
+        months: 필요한 월 목록 (YYYYMM 문자열)
+        fetch: fetch(시작월, 종료월) → 해당 기간 데이터프레임 (month 컬럼 포함)
+        open_months: 항상 다시 조회하고 캐시에 저장하지 않는 월
+        refresh_months: 캐시를 무시하고 다시 조회해 덮어쓸 월
+
+    Returns:
+        (월 오름차순으로 합친 데이터프레임, 조회한 월 목록)
+    """
+    months = sorted(months)
+    open_months = set(open_months)
+    refresh_months = set(refresh_months)
+
+    frames = {}
+    for month in months:
+        path = _partition_file(name, key, month)
+        if month in open_months or month in refresh_months or not path.exists():
+            continue
+        frames[month] = _read_partition(path)
+
+    missing = [month for month in months if month not in frames]
+    for first, last in _contiguous_ranges(missing):
+        fetched = fetch(first, last)
+        month_keys = fetched[MONTH_COLUMN].astype(str)
+        for month in month_range(first, last):
+            part = fetched[month_keys == month].reset_index(drop=True)
+            frames[month] = part
+            if month not in open_months:
+                _write_partition(part, _partition_file(name, key, month))
+
+    parts = [frames[month] for month in months]
+    non_empty = [part for part in parts if len(part)]
+    if non_empty:
+        df = pd.concat(non_empty, ignore_index=True)
+    else:
+        df = parts[0] if parts else pd.DataFrame()
+
+    return df, missing
@@ -6,60 +6,73 @@ Snowflake 연결 예제
 import os
 import json
 import sys
-import pandas as pd
-import snowflake.connector
 
-def main():
+def connection_params():
+    """환경변수 Snowflake 연결 정보 (필수 값이 없으면 None)"""
+    params = {
+        'account': os.getenv('SNOWFLAKE_ACCOUNT'),
+        'user': os.getenv('SNOWFLAKE_USER'),
+        'password': os.getenv('SNOWFLAKE_PASSWORD'),
+        'warehouse': os.getenv('SNOWFLAKE_WAREHOUSE'),
+        'database': os.getenv('SNOWFLAKE_DATABASE'),
+        'schema': os.getenv('SNOWFLAKE_SCHEMA'),
+    }
+    if not all([params['account'], params['user'], params['password']]):
+        return None
+    return params
+
+def connect(params):
+    """Snowflake 연결 (python_worker.py는 생성한 연결을 재사용)"""
+    # 커넥터 import는 연결 정보 확인 후에만 (설정 오류 시 빠르게 응답)
+    import snowflake.connector
+    return snowflake.connector.connect(**params)
+
+def run(conn=None):
+    """
+    예제 실행 결과를 dict로 반환
+
+    Args:
+        conn: 재사용할 Snowflake 연결 (없으면 새로 연결하고 실행 후 종료)
+    """
     try:
         # 환경변수에서 Snowflake 연결 정보 읽기
-        account = os.getenv('SNOWFLAKE_ACCOUNT')
-        user = os.getenv('SNOWFLAKE_USER')
-        password = os.getenv('SNOWFLAKE_PASSWORD')
-        warehouse = os.getenv('SNOWFLAKE_WAREHOUSE')
-        database = os.getenv('SNOWFLAKE_DATABASE')
-        schema = os.getenv('SNOWFLAKE_SCHEMA')
-        
-        if not all([account, user, password]):
-            result = {
+        params = connection_params()
+
+        if params is None:
+            return {
                 'success': False,
                 'error': 'Snowflake 연결 정보가 환경변수에 설정되지 않았습니다.'
             }
-            print(json.dumps(result, ensure_ascii=False))
-            return
-        
+
         # Snowflake 연결
-        conn = snowflake.connector.connect(
-            account=account,
-            user=user,
-            password=password,
-            warehouse=warehouse,
-            database=database,
-            schema=schema
-        )
-        
+        own_conn = conn is None
+        if own_conn:
+            conn = connect(params)
+
         # 쿼리 실행 예제
         cursor = conn.cursor()
-        cursor.execute("SELECT CURRENT_VERSION()")
-        version = cursor.fetchone()[0]
-        
-        result = {
+        try:
+            cursor.execute("SELECT CURRENT_VERSION()")
+            version = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+            if own_conn:
+                conn.close()
+
+        return {
             'success': True,
             'message': 'Snowflake 연결 성공',
             'version': version
         }
-        
-        cursor.close()
-        conn.close()
-        
-        print(json.dumps(result, ensure_ascii=False))
-        
+
     except Exception as e:
-        result = {
+        return {
             'success': False,
             'error': str(e)
         }
-        print(json.dumps(result, ensure_ascii=False))
+
+def main():
+    print(json.dumps(run(), ensure_ascii=False))
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,94 @@
+"""
+Snowflake 대체용 로컬 SQLite 픽스처 생성 스크립트
+(snowflake_to_dashboard.py --sqlite 옵션으로 오프라인 테스트)
+
+사용법:
+    python snowflake_fixture.py --output fixture.db --start 202401 --months 24
+    python snowflake_to_dashboard.py --month 202412 --sqlite fixture.db
+"""
+
+import os
+import sys
+import random
+import sqlite3
+import argparse
+
+from month_utils import month_range, shift_month
+
+# 원천 브랜드 코드 (snowflake_to_dashboard.BRAND_CODES의 키)
+BRANDS = ['MLB', 'MLB KIDS', 'DISCOVERY', 'DUVETICA', 'SERGIO TACCHINI']
+
+# 계정 (코드, 계정명)
+GL_ACCOUNTS = [
+    ('5101', '급여'), ('5102', '상여'), ('5103', '퇴직급여'), ('5104', '복리후생비'),
+    ('5201', '광고선전비'), ('5202', '판촉비'), ('5301', '임차료'), ('5302', '관리비'),
+    ('5401', '운반비'), ('5402', '보관비'), ('5501', '전산비'), ('5502', '통신비'),
+    ('5601', '소모품비'), ('5602', '수선비'), ('5901', '기타'),
+]
+
+SCHEMA = """
+CREATE TABLE COST_TABLE (
+    YYYYMM TEXT, BRAND_CODE TEXT, BRAND_NAME TEXT, GL_ACCOUNT TEXT, GL_NAME TEXT,
+    CCTR_CODE TEXT, CCTR_NAME TEXT, CCTR_TYPE TEXT, COST_AMT INTEGER
+);
+CREATE TABLE SALES_TABLE (YYYYMM TEXT, BRAND_CODE TEXT, SALE_AMT INTEGER);
+CREATE TABLE EMPLOYEE_TABLE (YYYYMM TEXT, BRAND_CODE TEXT, EMP_ID TEXT);
+CREATE TABLE STORE_TABLE (YYYYMM TEXT, BRAND_CODE TEXT, STORE_CODE TEXT, STATUS TEXT);
+"""
+
+
+def build_fixture(db_path, start_month, months, cctr_per_brand=20, seed=0):
+    """픽스처 DB 생성 (기존 파일은 덮어씀)"""
+    rng = random.Random(seed)
+
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+
+    cost_rows, sales_rows, employee_rows, store_rows = [], [], [], []
+    for yyyymm in month_range(start_month, shift_month(start_month, months - 1)):
+        for brand in BRANDS:
+            for i in range(cctr_per_brand):
+                cctr_type = '부서' if i % 4 == 0 else '매장'
+                cctr_code = f"{'F' if cctr_type == '부서' else 'Z'}{brand[:2]}{i:03d}"
+                for gl_account, gl_name in GL_ACCOUNTS:
+                    cost_rows.append((yyyymm, brand, brand, gl_account, gl_name, cctr_code,
+                                      f"{brand} {cctr_type} {i}", cctr_type, rng.randint(100_000, 50_000_000)))
+
+            sales_rows.append((yyyymm, brand, rng.randint(1_000_000_000, 30_000_000_000)))
+            employee_rows.extend((yyyymm, brand, f"{brand[:2]}{e:04d}") for e in range(rng.randint(50, 300)))
+            store_rows.extend((yyyymm, brand, f"{brand[:2]}S{s:03d}", 'ACTIVE' if s % 10 else 'CLOSED')
+                              for s in range(rng.randint(20, 120)))
+
+    conn.executemany("INSERT INTO COST_TABLE VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", cost_rows)
+    conn.executemany("INSERT INTO SALES_TABLE VALUES (?, ?, ?)", sales_rows)
+    conn.executemany("INSERT INTO EMPLOYEE_TABLE VALUES (?, ?, ?)", employee_rows)
+    conn.executemany("INSERT INTO STORE_TABLE VALUES (?, ?, ?, ?)", store_rows)
+    conn.commit()
+    conn.close()
+
+    return len(cost_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Snowflake 대체용 SQLite 픽스처 생성')
+    parser.add_argument('--output', default='fixture.db', help='생성할 SQLite 파일')
+    parser.add_argument('--start', default='202401', help='시작월 (YYYYMM)')
+    parser.add_argument('--months', type=int, default=24, help='생성할 개월 수')
+    parser.add_argument('--cctr-per-brand', type=int, default=20, help='브랜드당 코스트센터 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+
+    args = parser.parse_args()
+
+    if len(args.start) != 6 or not args.start.isdigit():
+        print(f"✗ 시작월 형식 오류: {args.start} (YYYYMM)")
+        sys.exit(1)
+
+    cost_count = build_fixture(args.output, args.start, args.months, args.cctr_per_brand, args.seed)
+    print(f"✓ 픽스처 생성 완료: {args.output} (비용 {cost_count:,}건)")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,16 @@ Snowflake 데이터 추출 및 대시보드용 JSON 생성 스크립트
 사용법:
     python snowflake_to_dashboard.py --month 202412 --output ./public/data
 
+    # 마감월은 로컬 캐시(.cache/snowflake) 사용, 특정 월만 다시 조회
+    python snowflake_to_dashboard.py --month 202412 --refresh-month 202410
+
+    # 추출 결과를 Parquet로 바로 기록 (대용량 추출 시 메모리 절약)
+    python snowflake_to_dashboard.py --month 202412 --extract-dir ./extract
+
+    # 오프라인 테스트 (Snowflake 대신 로컬 SQLite 픽스처 사용)
+    python snowflake_fixture.py --output fixture.db
+    python snowflake_to_dashboard.py --month 202412 --sqlite fixture.db
+
 환경변수 필요:
     SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, SNOWFLAKE_PASSWORD,
     SNOWFLAKE_WAREHOUSE, SNOWFLAKE_DATABASE, SNOWFLAKE_SCHEMA
@@ -13,9 +23,22 @@ import os
 import sys
 import json
 import argparse
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pandas as pd
-import snowflake.connector
+
+from lazy_imports import lazy_import, module_available
+from dashboard_rollup import build_brand_rollups, detail_filename, write_detail_json
+from kpi_engine import compute_kpi_table, kpi_for, kpi_history
+from run_report import count_rows, finish_run, report_file, span, start_run
+from month_utils import month_range, shift_month
+from snowflake_cache import cache_key, load_partitioned, open_months
+
+# 무거운 모듈은 처음 사용할 때 로드 (도움말/설정 오류 경로의 시작 시간 단축)
+pd = lazy_import('pandas')
+pa = lazy_import('pyarrow') if module_available('pyarrow') else None
 
 # 브랜드 코드 매핑
 BRAND_CODES = {
@@ -26,6 +49,9 @@ BRAND_CODES = {
     'SERGIO TACCHINI': 'SERGIO_TACCHINI',
 }
 
+# Arrow 변환 시 fetchmany 배치 크기 (Snowflake 외 DB-API 연결)
+FETCH_BATCH_ROWS = 100_000
+
 # 비용 대분류 매핑 (실제 계정과목 → 대시보드 카테고리)
 CATEGORY_MAPPING = {
     '급여': '인건비',
@@ -48,6 +74,8 @@ CATEGORY_MAPPING = {
 
 def connect_snowflake():
     """Snowflake 연결"""
+    import snowflake.connector
+    
     try:
         conn = snowflake.connector.connect(
             account=os.getenv('SNOWFLAKE_ACCOUNT'),
@@ -64,13 +92,198 @@ def connect_snowflake():
         sys.exit(1)
 
 
-def extract_cost_data(conn, start_month, end_month):
+def connect_sqlite(db_path):
+    """로컬 SQLite 연결 (Snowflake 대체 - 오프라인 테스트용, snowflake_fixture.py로 생성)"""
+    if not os.path.exists(db_path):
+        print(f"✗ SQLite 파일 없음: {db_path}")
+        sys.exit(1)
+    return sqlite3.connect(db_path, check_same_thread=False)
+
+
+class ConnectionPool:
+    """
+    스레드 간 공유하는 간단한 연결 풀
+    - 최대 size개까지 필요할 때 생성하고, 사용이 끝난 연결은 재사용
+    """
+    
+    def __init__(self, connect, size):
+        self.connect = connect
+        self.size = size
+        self._idle = queue.Queue()
+        self._created = []
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._created) < self.size:
+                conn = self.connect()
+                self._created.append(conn)
+                return conn
+        return self._idle.get()
+    
+    def release(self, conn):
+        self._idle.put(conn)
+    
+    def run(self, func, *args):
+        """풀에서 연결을 빌려 func(conn, *args) 실행"""
+        conn = self.acquire()
+        try:
+            return func(conn, *args)
+        finally:
+            self.release(conn)
+    
+    def close(self):
+        for conn in self._created:
+            conn.close()
+        if self._created:
+            print("Snowflake 연결 종료")
+        self._created = []
+
+
+def _iter_arrow_batches(cursor, columns):
+    """
+    실행된 커서 결과를 Arrow 테이블 배치로 반환 (컬럼명 소문자)
+    - Snowflake: fetch_arrow_batches (서버 Arrow 결과를 변환 없이 그대로 수신)
+    - 그 외 DB-API 연결: fetchmany 배치를 Arrow 테이블로 변환
+      (타입은 배치마다 값으로 추정하므로 배치 간 타입이 다를 수 있음 - 전부 NULL, 정수 → 실수 등,
+       합칠 때 unify_batch_schema로 넓힘)
     """
-    비용 데이터 추출
+    if hasattr(cursor, 'fetch_arrow_batches'):
+        for table in cursor.fetch_arrow_batches():
+            yield table.rename_columns(columns)
+        return
+    
+    while True:
+        rows = cursor.fetchmany(FETCH_BATCH_ROWS)
+        if not rows:
+            break
+        yield pa.table(dict(zip(columns, map(list, zip(*rows)))))
+
+
+def unify_batch_schema(schema, table):
+    """기존 스키마와 새 배치 스키마를 손실 없는 방향으로 합침 (null → 실제 타입, int64 → double)"""
+    return pa.unify_schemas([schema, table.schema], promote_options='permissive')
+
+
+def _rewrite_parquet(path, schema):
+    """기록 중인 Parquet 파일을 넓힌 스키마로 다시 기록하고, 이어서 기록할 writer 반환"""
+    import pyarrow.parquet as pq
+    
+    old_path = f"{path}.old"
+    os.replace(path, old_path)
+    try:
+        writer = pq.ParquetWriter(path, schema)
+        with pq.ParquetFile(old_path) as source:
+            for batch in source.iter_batches():
+                writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+    finally:
+        os.remove(old_path)
+    return writer
+
+
+def read_query(conn, query):
+    """
+    쿼리 실행 후 데이터프레임으로 반환
+    - pyarrow 사용 가능: Arrow 배치 → 하나의 Arrow 테이블 → pandas 한 번 변환
+      (split_blocks/self_destruct로 변환 중 메모리 사본 최소화)
+    - pyarrow 없음: Snowflake는 fetch_pandas_batches, 그 외 DB-API 연결(SQLite 등)은 fetchall
+    - 컬럼명은 소문자로 통일 (Snowflake는 별칭을 대문자로 반환)
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(query)
+        columns = [col[0].lower() for col in cursor.description]
+        
+        if pa is not None:
+            batches = list(_iter_arrow_batches(cursor, columns))
+            if not batches:
+                return pd.DataFrame(columns=columns)
+            table = pa.concat_tables(batches, promote_options='permissive')
+            del batches
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        
+        batches = None
+        if hasattr(cursor, 'fetch_pandas_batches'):
+            from snowflake.connector.errors import NotSupportedError, ProgrammingError
+            
+            try:
+                batches = list(cursor.fetch_pandas_batches())
+            except (NotSupportedError, ProgrammingError):
+                batches = None  # pyarrow 미설치 등 - fetchall로 대체
+        
+        if batches:
+            df = pd.concat(batches, ignore_index=True)
+            df.columns = [str(col).lower() for col in df.columns]
+        elif batches is not None:
+            df = pd.DataFrame(columns=columns)
+        else:
+            df = pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+    finally:
+        cursor.close()
+    
+    return df
+
+
+def write_query_parquet(conn, query, path):
+    """
+    쿼리 결과를 Arrow 배치 단위로 Parquet 파일에 바로 기록 (pyarrow 필요)
+    - 전체 결과를 메모리에 올리지 않으므로 대용량 추출에 사용
+    - 임시 파일에 기록 후 교체 (중단 시 불완전한 파일이 남지 않음)
+    
+    Returns:
+        기록한 행 수
+    """
+    if pa is None:
+        raise RuntimeError("Parquet 직접 기록에는 pyarrow가 필요합니다 (pip install pyarrow)")
+    import pyarrow.parquet as pq
+    
+    tmp_path = f"{path}.tmp"
+    cursor = conn.cursor()
+    writer = None
+    rows = 0
+    try:
+        cursor.execute(query)
+        columns = [col[0].lower() for col in cursor.description]
+        
+        for table in _iter_arrow_batches(cursor, columns):
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, table.schema)
+            else:
+                schema = unify_batch_schema(writer.schema, table)
+                if not schema.equals(writer.schema):
+                    # 앞 배치에서 추정한 타입보다 넓어진 경우 (드묾) 지금까지 기록한 행을 새 스키마로 다시 기록
+                    writer.close()
+                    writer = _rewrite_parquet(tmp_path, schema)
+            writer.write_table(table.cast(writer.schema))
+            rows += table.num_rows
+        
+        if writer is None:
+            # 결과 없음 - 컬럼만 있는 빈 파일
+            writer = pq.ParquetWriter(tmp_path, pa.schema([(col, pa.null()) for col in columns]))
+        writer.close()
+        writer = None
+        os.replace(tmp_path, path)
+    finally:
+        cursor.close()
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return rows
+
+
+def cost_query(start_month, end_month):
+    """
+    비용 데이터 쿼리
     
     실제 쿼리는 테이블 구조에 맞게 수정 필요
     """
-    query = f"""
+    return f"""
     SELECT 
         YYYYMM as month,
         BRAND_CODE as brand_code,
@@ -86,16 +299,11 @@ def extract_cost_data(conn, start_month, end_month):
     GROUP BY 1,2,3,4,5,6,7,8
     ORDER BY 1,2
     """
-    
-    print(f"데이터 추출 중: {start_month} ~ {end_month}")
-    df = pd.read_sql(query, conn)
-    print(f"✓ {len(df):,}건 추출 완료")
-    return df
 
 
-def extract_sales_data(conn, start_month, end_month):
-    """매출 데이터 추출"""
-    query = f"""
+def sales_query(start_month, end_month):
+    """매출 데이터 쿼리"""
+    return f"""
     SELECT 
         YYYYMM as month,
         BRAND_CODE as brand_code,
@@ -104,15 +312,11 @@ def extract_sales_data(conn, start_month, end_month):
     WHERE YYYYMM BETWEEN '{start_month}' AND '{end_month}'
     GROUP BY 1,2
     """
-    
-    df = pd.read_sql(query, conn)
-    print(f"✓ 매출 데이터 {len(df):,}건 추출")
-    return df
 
 
-def extract_headcount_data(conn, start_month, end_month):
-    """인원수 데이터 추출"""
-    query = f"""
+def headcount_query(start_month, end_month):
+    """인원수 데이터 쿼리"""
+    return f"""
     SELECT 
         YYYYMM as month,
         BRAND_CODE as brand_code,
@@ -121,15 +325,11 @@ def extract_headcount_data(conn, start_month, end_month):
     WHERE YYYYMM BETWEEN '{start_month}' AND '{end_month}'
     GROUP BY 1,2
     """
-    
-    df = pd.read_sql(query, conn)
-    print(f"✓ 인원수 데이터 {len(df):,}건 추출")
-    return df
 
 
-def extract_store_data(conn, start_month, end_month):
-    """매장수 데이터 추출"""
-    query = f"""
+def store_query(start_month, end_month):
+    """매장수 데이터 쿼리"""
+    return f"""
     SELECT 
         YYYYMM as month,
         BRAND_CODE as brand_code,
@@ -139,12 +339,130 @@ def extract_store_data(conn, start_month, end_month):
         AND STATUS = 'ACTIVE'
     GROUP BY 1,2
     """
-    
-    df = pd.read_sql(query, conn)
+
+
+def extract_cost_data(conn, start_month, end_month):
+    """비용 데이터 추출"""
+    print(f"데이터 추출 중: {start_month} ~ {end_month}")
+    df = read_query(conn, cost_query(start_month, end_month))
+    print(f"✓ {len(df):,}건 추출 완료")
+    return df
+
+
+def extract_sales_data(conn, start_month, end_month):
+    """매출 데이터 추출"""
+    df = read_query(conn, sales_query(start_month, end_month))
+    print(f"✓ 매출 데이터 {len(df):,}건 추출")
+    return df
+
+
+def extract_headcount_data(conn, start_month, end_month):
+    """인원수 데이터 추출"""
+    df = read_query(conn, headcount_query(start_month, end_month))
+    print(f"✓ 인원수 데이터 {len(df):,}건 추출")
+    return df
+
+
+def extract_store_data(conn, start_month, end_month):
+    """매장수 데이터 추출"""
+    df = read_query(conn, store_query(start_month, end_month))
     print(f"✓ 매장수 데이터 {len(df):,}건 추출")
     return df
 
 
+# 추출 대상 (이름 → 추출 함수)
+EXTRACTORS = {
+    'cost': extract_cost_data,
+    'sales': extract_sales_data,
+    'headcount': extract_headcount_data,
+    'store': extract_store_data,
+}
+
+# 추출 대상 (이름 → 쿼리 생성 함수, Parquet 직접 기록용)
+QUERIES = {
+    'cost': cost_query,
+    'sales': sales_query,
+    'headcount': headcount_query,
+    'store': store_query,
+}
+
+
+def extract_to_parquet(conn, name, start_month, end_month, extract_dir):
+    """추출 결과를 <extract_dir>/<name>.parquet로 스트리밍 기록 후 경로 반환"""
+    path = os.path.join(extract_dir, f'{name}.parquet')
+    rows = write_query_parquet(conn, QUERIES[name](start_month, end_month), path)
+    print(f"✓ {name}: {rows:,}건 → {path}")
+    return path
+
+
+def extract_cached(conn, name, start_month, end_month, source, refresh_months=()):
+    """
+    월 파티션 캐시를 거쳐 추출 (마감월은 캐시, 열린 월/캐시 없는 월만 조회)
+    
+    Args:
+        source: 데이터 원천 식별자 (캐시 키에 포함)
+        refresh_months: 캐시를 무시하고 다시 조회할 월 목록
+    """
+    query = QUERIES[name]
+    months = month_range(start_month, end_month)
+    df, fetched = load_partitioned(
+        name,
+        cache_key(source, query('{start}', '{end}')),
+        months,
+        lambda first, last: read_query(conn, query(first, last)),
+        open_months=open_months(end_month),
+        refresh_months=refresh_months,
+    )
+    print(f"✓ {name}: {len(df):,}건 (조회 {len(fetched)}개월, 캐시 {len(months) - len(fetched)}개월)")
+    return df
+
+
+def extract_all(connect, start_month, end_month, workers=4, extract_dir=None,
+                cache_source=None, refresh_months=()):
+    """
+    네 가지 데이터 추출
+    - workers > 1: 연결 풀 + 스레드 풀로 쿼리 병렬 실행 (가장 느린 쿼리 시간에 수렴)
+    - workers == 1: 단일 연결로 순차 실행
+    - extract_dir 지정: 결과를 Arrow 배치 단위로 Parquet에 바로 기록한 뒤 파일에서 로드
+      (추출 중 결과 전체를 파이썬 객체로 보관하지 않음, 추출 파일은 재사용 가능)
+    - cache_source 지정: 테이블 × 월 파티션 캐시 사용 (extract_dir와 함께 쓰면 캐시는 사용하지 않음)
+    
+    Returns:
+        {'cost': df, 'sales': df, 'headcount': df, 'store': df}
+    """
+    if extract_dir:
+        os.makedirs(extract_dir, exist_ok=True)
+        tasks = {name: (extract_to_parquet, name, start_month, end_month, extract_dir) for name in QUERIES}
+    elif cache_source:
+        tasks = {name: (extract_cached, name, start_month, end_month, cache_source, refresh_months)
+                 for name in QUERIES}
+    else:
+        tasks = {name: (func, start_month, end_month) for name, func in EXTRACTORS.items()}
+    
+    pool = ConnectionPool(connect, size=max(1, min(workers, len(tasks))))
+    
+    def run_extract(name, task):
+        with span('extract', table=name) as record:
+            result = pool.run(*task)
+            record['rows_out'] = count_rows(result)
+        return result
+    
+    try:
+        if pool.size == 1:
+            results = {name: run_extract(name, task) for name, task in tasks.items()}
+        else:
+            print(f"병렬 추출 ({pool.size}개 연결)")
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                futures = {name: executor.submit(run_extract, name, task) for name, task in tasks.items()}
+                results = {name: future.result() for name, future in futures.items()}
+    finally:
+        pool.close()
+    
+    if extract_dir:
+        results = {name: pd.read_parquet(path) for name, path in results.items()}
+    return results
+
+
 def process_data(cost_df, sales_df, headcount_df, store_df):
     """데이터 전처리 및 통합"""
     print("\n데이터 전처리 중...")
@@ -175,30 +493,6 @@ def process_data(cost_df, sales_df, headcount_df, store_df):
     return merged
 
 
-def calculate_kpi(df, current_month):
-    """KPI 계산"""
-    current_data = df[df['month'] == current_month]
-    prev_year_month = str(int(current_month) - 10000)  # 전년 동월
-    prev_data = df[df['month'] == prev_year_month]
-    
-    total_cost = current_data['cost_amt'].sum()
-    total_sale = current_data['sale_amt'].sum()
-    avg_headcount = current_data['headcount'].mean()
-    avg_stores = current_data['store_cnt'].mean()
-    
-    prev_total_cost = prev_data['cost_amt'].sum() if len(prev_data) > 0 else total_cost
-    
-    kpi = {
-        'total_cost': round(total_cost),
-        'cost_ratio': round((total_cost / total_sale * 100), 1) if total_sale > 0 else 0,
-        'cost_per_person': round((total_cost / avg_headcount / 1_000_000), 1) if avg_headcount > 0 else 0,
-        'cost_per_store': round((total_cost / avg_stores / 1_000_000), 1) if avg_stores > 0 else 0,
-        'yoy': round(((total_cost - prev_total_cost) / prev_total_cost * 100), 1) if prev_total_cost > 0 else 0,
-    }
-    
-    return kpi
-
-
 def save_json(data, output_path, brand_code, month):
     """JSON 파일 저장"""
     os.makedirs(output_path, exist_ok=True)
@@ -215,11 +509,30 @@ def main():
     parser.add_argument('--month', required=True, help='기준월 (YYYYMM)')
     parser.add_argument('--output', default='./public/data', help='출력 디렉토리')
     parser.add_argument('--months-back', type=int, default=24, help='과거 몇 개월 데이터 추출 (기본 24개월)')
+    parser.add_argument('--detail', action='store_true',
+                        help='코스트센터 × 계정 단위 상세 행을 별도 파일(<브랜드>_<월>_detail.json)로 저장')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='동시 추출 쿼리 수 (1이면 순차 추출, 기본 4)')
+    parser.add_argument('--sqlite', help='Snowflake 대신 사용할 로컬 SQLite 파일 (오프라인 테스트용)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='월 파티션 캐시를 사용하지 않고 전체 기간 다시 조회')
+    parser.add_argument('--refresh-month', action='append', default=[], metavar='YYYYMM',
+                        help='캐시를 무시하고 다시 조회할 월 (여러 번 지정 가능)')
+    parser.add_argument('--extract-dir',
+                        help='추출 결과를 Arrow 배치 단위로 Parquet 파일(<이름>.parquet)에 바로 기록 (pyarrow 필요)')
     
     args = parser.parse_args()
     
+    if args.extract_dir and pa is None:
+        print("✗ --extract-dir 옵션에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        sys.exit(1)
+    
     current_month = args.month
-    start_month = str(int(current_month) - (args.months_back * 100))  # 간단한 계산 (실제는 날짜 계산 필요)
+    start_month = shift_month(current_month, -args.months_back)
+    
+    # 단계별 시간/메모리 기록 (.cache/run_reports/snowflake_to_dashboard.run.jsonl)
+    start_run(report_file('snowflake_to_dashboard'), 'snowflake_to_dashboard',
+              month=current_month, months_back=args.months_back, workers=args.workers)
     
     print(f"\n{'='*60}")
     print(f"F&F 비용 대시보드 데이터 추출")
@@ -227,48 +540,80 @@ def main():
     print(f"추출 기간: {start_month} ~ {current_month}")
     print(f"{'='*60}\n")
     
-    # Snowflake 연결
-    conn = connect_snowflake()
+    # 연결 방법 (Snowflake 또는 로컬 SQLite 대체) 및 캐시 원천 식별자
+    if args.sqlite:
+        connect = lambda: connect_sqlite(args.sqlite)
+        cache_source = f"sqlite:{os.path.abspath(args.sqlite)}"
+    else:
+        connect = connect_snowflake
+        cache_source = "snowflake:{}/{}/{}".format(
+            os.getenv('SNOWFLAKE_ACCOUNT'), os.getenv('SNOWFLAKE_DATABASE'), os.getenv('SNOWFLAKE_SCHEMA'))
+    if args.no_cache:
+        cache_source = None
     
-    try:
-        # 데이터 추출
-        cost_df = extract_cost_data(conn, start_month, current_month)
-        sales_df = extract_sales_data(conn, start_month, current_month)
-        headcount_df = extract_headcount_data(conn, start_month, current_month)
-        store_df = extract_store_data(conn, start_month, current_month)
-        
-        # 데이터 전처리
+    # 데이터 추출
+    extracted = extract_all(connect, start_month, current_month, workers=args.workers,
+                            extract_dir=args.extract_dir, cache_source=cache_source,
+                            refresh_months=args.refresh_month)
+    cost_df = extracted['cost']
+    sales_df = extracted['sales']
+    headcount_df = extracted['headcount']
+    store_df = extracted['store']
+    
+    # 데이터 전처리
+    with span('process_data') as record:
+        record['rows_in'] = len(cost_df)
         merged_df = process_data(cost_df, sales_df, headcount_df, store_df)
-        
-        # 브랜드별로 JSON 생성
-        print("\nJSON 파일 생성 중...")
+        record['rows_out'] = len(merged_df)
+    
+    # 전체 (브랜드, 월) KPI 한 번에 계산
+    with span('kpi') as record:
+        record['rows_in'] = len(merged_df)
+        kpi_table = compute_kpi_table(merged_df)
+        record['rows_out'] = len(kpi_table)
+    brand_groups = dict(tuple(merged_df.groupby('brand_code', sort=False)))
+    
+    # 브랜드별로 JSON 생성
+    print("\nJSON 파일 생성 중...")
+    with span('write_json', detail=bool(args.detail)) as record:
+        record['rows_in'] = len(merged_df)
         for brand_code in BRAND_CODES.values():
-            brand_data = merged_df[merged_df['brand_code'] == brand_code]
+            brand_data = brand_groups.get(brand_code)
             
-            if len(brand_data) == 0:
+            if brand_data is None or len(brand_data) == 0:
                 print(f"⚠ {brand_code}: 데이터 없음")
                 continue
             
-            kpi = calculate_kpi(brand_data, current_month)
+            kpi = kpi_for(kpi_table, brand_code, current_month)
+            monthly_data, rollups = build_brand_rollups(brand_data)
+            
+            # 상세 행은 요청 시에만 별도 파일로 저장 (대시보드에서 지연 로딩)
+            detail_file = None
+            if args.detail:
+                os.makedirs(args.output, exist_ok=True)
+                detail_file = detail_filename(args.output, brand_code, current_month)
+                write_detail_json(detail_file, brand_data.to_dict(orient='records'))
             
             dashboard_data = {
                 'brand_code': brand_code,
                 'brand_name': brand_data['brand_name'].iloc[0] if 'brand_name' in brand_data.columns else brand_code,
                 'current_month': current_month,
                 'kpi': kpi,
-                'monthly_data': brand_data.to_dict(orient='records'),
+                'kpi_history': kpi_history(kpi_table, brand_code),
+                'monthly_data': monthly_data,
+                'rollups': rollups,
+                'detail_file': os.path.basename(detail_file) if detail_file else None,
                 'generated_at': datetime.now().isoformat(),
             }
             
             save_json(dashboard_data, args.output, brand_code, current_month)
-        
-        print(f"\n{'='*60}")
-        print("✓ 모든 작업 완료!")
-        print(f"{'='*60}\n")
-        
-    finally:
-        conn.close()
-        print("Snowflake 연결 종료")
+        record['files'] = sum(1 for brand_code in BRAND_CODES.values() if brand_code in brand_groups)
+    
+    finish_run()
+    
+    print(f"\n{'='*60}")
+    print("✓ 모든 작업 완료!")
+    print(f"{'='*60}\n")
 
 
 if __name__ == '__main__':
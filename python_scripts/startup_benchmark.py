@@ -0,0 +1,102 @@
+"""
+python_scripts 진입점 시작 시간 벤치마크
+- 웹 계층에서 호출되는 오류/상태 확인 경로를 실제 프로세스로 실행해 소요 시간 측정
+- 경로별 시작 시간 예산(ms)을 넘으면 종료 코드 1 (CI 확인용)
+- --importtime: python -X importtime 결과로 가장 오래 걸린 최상위 import 표시
+
+사용법:
+    python startup_benchmark.py
+    python startup_benchmark.py --repeat 10 --importtime
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+
+# 환경변수 제거 목록 (설정 오류 경로를 재현)
+OPENAI_ENV = ['OPENAI_API_KEY']
+SNOWFLAKE_ENV = ['SNOWFLAKE_ACCOUNT', 'SNOWFLAKE_USER', 'SNOWFLAKE_PASSWORD']
+
+# (이름, 인자, 제거할 환경변수, 표준입력, 예산 ms)
+# 예산은 인터프리터 기동 시간을 포함한 전체 프로세스 시간
+CASES = [
+    ('openai_example: API 키 없음', ['openai_example.py'], OPENAI_ENV, None, 150),
+    ('snowflake_example: 연결 정보 없음', ['snowflake_example.py'], SNOWFLAKE_ENV, None, 150),
+    ('snowflake_to_dashboard --help', ['snowflake_to_dashboard.py', '--help'], [], None, 200),
+    ('snowflake_to_dashboard: SQLite 없음',
+     ['snowflake_to_dashboard.py', '--month', '202412', '--sqlite', 'missing.db', '--workers', '1'], [], None, 200),
+    ('csv_to_dashboard --help', ['csv_to_dashboard.py', '--help'], [], None, 200),
+    # 상주 워커는 pandas를 시작 시 미리 로드 (서버 수명 동안 한 번)
+    ('python_worker: ping', ['python_worker.py'], [],
+     '{"jsonrpc": "2.0", "id": 1, "method": "ping"}\n{"jsonrpc": "2.0", "id": 2, "method": "shutdown"}\n', 2000),
+]
+
+
+def run_once(args, drop_env, stdin, importtime=False):
+    """프로세스 1회 실행 → (소요 ms, stderr)"""
+    env = {key: value for key, value in os.environ.items() if key not in drop_env}
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + args
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=SCRIPT_DIR, env=env, input=stdin, capture_output=True, text=True)
+    return (time.perf_counter() - start) * 1000, result.stderr
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 → 최상위 import (이름, 누적 ms) 목록"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name.startswith('  '):
+            continue  # 중첩 import
+        imports.append((name.strip(), int(cumulative) / 1000))
+    return imports
+
+
+def top_imports(stderr, exclude, limit=5):
+    """인터프리터 기본 import(exclude)를 제외한 최상위 import를 누적 시간 순으로"""
+    imports = [item for item in parse_importtime(stderr) if item[0] not in exclude]
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='python_scripts 진입점 시작 시간 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='경로별 반복 횟수 (기본 5, 중앙값 사용)')
+    parser.add_argument('--importtime', action='store_true', help='최상위 import 소요 시간 표시')
+
+    args = parser.parse_args()
+
+    baseline = statistics.median(run_once(['-c', 'pass'], [], None)[0] for _ in range(args.repeat))
+    baseline_imports = {name for name, _ in parse_importtime(run_once(['-c', 'pass'], [], None, importtime=True)[1])}
+    print(f"인터프리터 기동 (python -c pass): {baseline:.0f}ms\n")
+    print(f"{'경로':<40} {'중앙값':>8} {'최소':>8} {'예산':>8}")
+
+    over_budget = []
+    for name, case_args, drop_env, stdin, budget in CASES:
+        timings = [run_once(case_args, drop_env, stdin)[0] for _ in range(args.repeat)]
+        median = statistics.median(timings)
+        status = '✓' if median <= budget else '✗'
+        print(f"{name:<40} {median:>6.0f}ms {min(timings):>6.0f}ms {budget:>6}ms {status}")
+        if median > budget:
+            over_budget.append(name)
+
+        if args.importtime:
+            _, stderr = run_once(case_args, drop_env, stdin, importtime=True)
+            for module, ms in top_imports(stderr, baseline_imports):
+                print(f"    {module:<36} {ms:>6.1f}ms")
+
+    if over_budget:
+        print(f"\n✗ 예산 초과: {', '.join(over_budget)}")
+        sys.exit(1)
+    print("\n✓ 모든 경로가 예산 이내")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,13 +5,15 @@ Excel 파일 헤더 확인
 import pandas as pd
 from pathlib import Path
 
+from ledger_cache import read_ledger_excel
+
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / 'public' / 'data'
 
 file_path = DATA_DIR / '2410원장.xlsx'
 
 print("Reading Excel file with header...")
-df = pd.read_excel(file_path)
+df = read_ledger_excel(file_path)
 
 print(f"\nTotal rows: {len(df)}")
 print(f"Total columns: {len(df.columns)}")
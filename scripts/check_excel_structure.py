@@ -25,7 +25,7 @@ for filename in files:
     print(f"File: {filename}")
     print(f"{'='*60}")
     
-    # Excel 파일 읽기 (헤더 없이)
+    # Excel 파일 읽기 (헤더 없이, 원본 구조 그대로 확인하므로 타입 변환 캐시는 사용하지 않음)
     df = pd.read_excel(file_path, header=None)
     
     print(f"Total rows: {len(df)}")
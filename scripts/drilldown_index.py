@@ -0,0 +1,174 @@
+"""
+GL계정 드릴다운 인덱스 생성 모듈
+- 전체 월의 costs_YYYYMM.csv를 (브랜드, GL계정, 연월) 순으로 정렬해 하나의 CSV로 저장
+  (같은 브랜드 × GL계정의 행은 월 순서로 연속된 바이트 구간)
+- 인덱스 JSON: 브랜드 → GL계정 → [시작 오프셋, [[연월, 바이트 길이, 행 수], ...]]
+  웹 계층(lib/drilldownIndex.js)은 인덱스로 필요한 구간만 읽음 (파일명 추측/디렉토리 탐색 없음)
+- file_size: 드릴다운 파일 크기 (읽는 쪽에서 인덱스와 파일이 같은 실행에서 생성됐는지 확인)
+- gl_account 컬럼이 없는 월(피벗 원장 파이프라인 출력)은 인덱스에서 제외
+
+사용법:
+    python drilldown_index.py [--compare yoy] [--base-month 202510]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+
+from period_comparison import COMPARISONS, available_months, comparison_periods, load_costs
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'public' / 'data'
+COSTS_DIR = DATA_DIR / 'costs'
+GL_ANALYSIS_DIR = DATA_DIR / 'gl_analysis'
+DRILLDOWN_FILE = GL_ANALYSIS_DIR / 'drilldown.csv'
+INDEX_FILE = GL_ANALYSIS_DIR / 'drilldown_index.json'
+
+INDEX_VERSION = 1
+
+# 드릴다운 파일 컬럼 (costs_YYYYMM.csv와 동일)
+COLUMNS = ['brand', 'category_l1', 'category_l2', 'category_l3', 'gl_account', 'amount', 'year_month']
+
+
+def comparison_months(months, comparison='yoy', base_month=None):
+    """combined 조회에 사용할 비교 대상 월 (데이터가 있는 월만)"""
+    if not months:
+        return []
+    periods = comparison_periods(comparison, base_month or months[-1])
+    return [month for _, period in periods for month in period if month in months]
+
+
+def build_drilldown_index(costs_dir=COSTS_DIR, drilldown_file=DRILLDOWN_FILE, index_file=INDEX_FILE,
+                          comparison='yoy', base_month=None):
+    """
+    드릴다운 CSV와 인덱스 JSON 생성
+
+    드릴다운 파일은 UTF-8 (BOM 없음), 행 구분자 '\\n'
+    값 안의 줄바꿈은 공백으로 바꿔 한 행 = 한 줄을 보장 (바이트 구간 계산용)
+
+    Returns:
+        인덱스 dict (GL계정 비용 데이터가 없으면 None)
+    """
+    all_months = available_months(costs_dir)
+    df, _ = load_costs(costs_dir, all_months)
+    if df is not None:
+        df = df.reindex(columns=COLUMNS)
+        df = df[df['brand'].notna() & df['gl_account'].notna()].copy()
+    if df is None or df.empty:
+        print("  [WARN] No cost data found")
+        return None
+
+    df['year_month'] = df['year_month'].astype(str)
+    indexed = set(df['year_month'])
+    months = [month for month in all_months if month in indexed]
+    skipped = [month for month in all_months if month not in indexed]
+    if skipped:
+        print(f"  [WARN] Skipped months without gl_account: {', '.join(skipped)}")
+    for col in ['brand', 'category_l1', 'category_l2', 'category_l3', 'gl_account']:
+        df[col] = df[col].where(df[col].isna(), df[col].astype(str).str.replace(r'[\r\n]+', ' ', regex=True))
+    df = df.sort_values(['brand', 'gl_account', 'year_month'], kind='stable').reset_index(drop=True)
+
+    # 전체를 한 번에 CSV 텍스트로 만든 뒤 행별 바이트 길이 계산
+    header = ','.join(COLUMNS) + '\n'
+    body = df.to_csv(index=False, header=False, lineterminator='\n')
+    lines = body.split('\n')[:-1]
+    if len(lines) != len(df):
+        raise ValueError(f"Unexpected line count in drilldown CSV: {len(lines)} != {len(df)}")
+
+    row_bytes = np.fromiter((len(line.encode('utf-8')) + 1 for line in lines), dtype=np.int64, count=len(lines))
+    row_offsets = len(header.encode('utf-8')) + np.concatenate(([0], np.cumsum(row_bytes)[:-1]))
+
+    # (브랜드, GL계정, 연월) 구간: 정렬되어 있으므로 첫 행 오프셋 + 바이트 합계
+    slices = df[['brand', 'gl_account', 'year_month']].assign(offset=row_offsets, length=row_bytes)
+    slices = slices.groupby(['brand', 'gl_account', 'year_month'], sort=False).agg(
+        offset=('offset', 'first'), length=('length', 'sum'), rows=('length', 'size')).reset_index()
+
+    entries = {}
+    for row in slices.itertuples(index=False):
+        account = entries.setdefault(row.brand, {}).setdefault(row.gl_account, [int(row.offset), []])
+        account[1].append([row.year_month, int(row.length), int(row.rows)])
+
+    index = {
+        'version': INDEX_VERSION,
+        'file': Path(drilldown_file).name,
+        'file_size': int(len(header.encode('utf-8')) + row_bytes.sum()),
+        'columns': COLUMNS,
+        'months': months,
+        'combined_months': comparison_months(months, comparison, base_month or all_months[-1]),
+        'entries': entries,
+    }
+
+    Path(drilldown_file).parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = Path(drilldown_file).with_name(Path(drilldown_file).name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8', newline='') as f:
+        f.write(header)
+        f.write(body)
+    tmp_file.replace(drilldown_file)
+
+    tmp_index = Path(index_file).with_name(Path(index_file).name + '.tmp')
+    with open(tmp_index, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    tmp_index.replace(index_file)
+
+    accounts = sum(len(gl_accounts) for gl_accounts in entries.values())
+    print(f"  [OK] Saved: {Path(drilldown_file).name} ({len(df):,} rows), "
+          f"{Path(index_file).name} ({len(entries)} brands, {accounts:,} GL accounts)")
+    return index
+
+
+def remove_drilldown_index(drilldown_file=DRILLDOWN_FILE, index_file=INDEX_FILE):
+    """
+    드릴다운 인덱스/파일 삭제 (인덱스로 다룰 수 없는 costs를 저장한 뒤 웹 계층이 기존 파일을 읽도록)
+
+    Returns:
+        인덱스가 있었는지 여부
+    """
+    existed = Path(index_file).exists()
+    # 웹 계층은 인덱스 유무로 판단하므로 인덱스를 먼저 삭제
+    Path(index_file).unlink(missing_ok=True)
+    Path(drilldown_file).unlink(missing_ok=True)
+    return existed
+
+
+def read_drilldown(brand, gl_account, months=None, index_file=INDEX_FILE):
+    """
+    인덱스로 브랜드 × GL계정 구간만 읽어 CSV 텍스트 반환 (헤더 포함, 연월 순)
+
+    Args:
+        months: 읽을 연월 목록 (None이면 전체)
+    """
+    index_file = Path(index_file)
+    with open(index_file, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+
+    lines = [','.join(index['columns']) + '\n']
+    account = index['entries'].get(brand, {}).get(gl_account)
+    if account is None:
+        return lines[0]
+
+    offset, slices = account
+    with open(index_file.parent / index['file'], 'rb') as f:
+        for year_month, length, _ in slices:
+            if months is None or year_month in months:
+                f.seek(offset)
+                lines.append(f.read(length).decode('utf-8'))
+            offset += length
+    return ''.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GL계정 드릴다운 인덱스 생성')
+    parser.add_argument('--compare', choices=COMPARISONS, default='yoy',
+                        help='combined 조회 비교 방식 (기본 yoy)')
+    parser.add_argument('--base-month', metavar='YYYYMM', help='비교 기준월 (기본: 가장 최근 월)')
+    args = parser.parse_args()
+
+    print(f"\n[DRILLDOWN] Building drilldown index...")
+    build_drilldown_index(comparison=args.compare, base_month=args.base_month)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+"""
+GL계정 분석 데이터 저장소 (파티션 컬럼형)
+- 브랜드 × GL계정마다 CSV 파일을 만드는 대신 브랜드/연월 파티션 하나에 GL계정 순으로 정렬해 저장
+  gl_store/brand=<브랜드>/year_month=<YYYYMM>/part.parquet (pyarrow가 없으면 part.pkl)
+- 연월별 인덱스 (_index/YYYYMM.csv): 브랜드, GL계정 → 파티션 파일, 시작 행, 행 수, 금액 합계
+- 기존 gl_analysis/[Brand]/[GL_Account]_YYYYMM.csv, _combined.csv는 export로 필요할 때 생성
+
+사용법:
+    python gl_store.py                                  # 인덱스 현황
+    python gl_store.py --brand MLB --gl-account 광고선전비_매체광고
+    python gl_store.py --export [--months 202410 202510] [--combined]
+"""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+from partitioned_writer import write_partitions
+
+try:
+    import pyarrow  # noqa: F401
+    STORE_FORMAT = 'parquet'
+except ImportError:
+    STORE_FORMAT = 'pickle'
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'public' / 'data'
+STORE_DIR = DATA_DIR / 'gl_store'
+INDEX_DIR = STORE_DIR / '_index'
+GL_ANALYSIS_DIR = DATA_DIR / 'gl_analysis'
+COSTS_DIR = DATA_DIR / 'costs'
+
+# 파티션/정렬 기준 컬럼
+BRAND_COLUMN = '사업 영역 내역'
+GL_COLUMN = 'G/L 계정 설명'
+AMOUNT_COLUMN = '금액(현지 통화)'
+
+INDEX_COLUMNS = ['brand', 'year_month', 'gl_account', 'file', 'row_start', 'row_count', 'amount']
+
+
+def legacy_gl_file(gl_analysis_dir, brand, gl_account, suffix):
+    """
+    기존 gl_analysis CSV 경로 ([Brand]/[GL_Account]_{suffix}.csv)
+    브랜드/GL계정이 비어 있으면 None
+    """
+    if not brand or not gl_account:
+        return None
+
+    # 파일명 정제
+    safe_brand_name = str(brand).replace('/', '_').replace('\\', '_').strip()
+    safe_gl_name = str(gl_account).replace('/', '_').replace('\\', '_').replace(':', '').replace('(', '').replace(')', '').strip()
+    safe_gl_name = safe_gl_name[:100]  # 파일명 길이 제한
+
+    return Path(gl_analysis_dir) / safe_brand_name / f'{safe_gl_name}_{suffix}.csv'
+
+
+def partition_file(brand, year_month):
+    """브랜드/연월 파티션 파일 경로"""
+    safe_brand_name = str(brand).replace('/', '_').replace('\\', '_').strip()
+    suffix = 'parquet' if STORE_FORMAT == 'parquet' else 'pkl'
+    return STORE_DIR / f'brand={safe_brand_name}' / f'year_month={year_month}' / f'part.{suffix}'
+
+
+def index_file(year_month):
+    return INDEX_DIR / f'{year_month}.csv'
+
+
+def _write_frame(df, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if STORE_FORMAT == 'parquet':
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_pickle(tmp_path)
+    tmp_path.replace(path)
+
+
+def read_partition(path):
+    """파티션 파일 로드"""
+    if Path(path).suffix == '.parquet':
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def write_month(df, year_month):
+    """
+    한 달 거래 데이터를 브랜드 파티션으로 저장하고 연월 인덱스 생성
+
+    - 브랜드별로 GL계정 순 안정 정렬 (GL계정 안에서는 원래 행 순서 유지)
+    - 이번에 생성되지 않은 같은 연월의 기존 파티션은 삭제
+
+    Returns:
+        생성한 파일 목록 (파티션 + 인덱스)
+    """
+    written = []
+    index_parts = []
+
+    brand_key = df[BRAND_COLUMN].astype(object)
+    for brand, brand_df in df.groupby(brand_key, sort=False):
+        if not brand:
+            continue
+
+        brand_df = brand_df.sort_values(GL_COLUMN, kind='stable',
+                                        key=lambda column: column.astype(str)).reset_index(drop=True)
+        output_file = partition_file(brand, year_month)
+        _write_frame(brand_df, output_file)
+        written.append(output_file)
+
+        # GL계정별 행 범위 (정렬되어 있으므로 연속 구간)
+        gl_key = brand_df[GL_COLUMN].astype(object)
+        groups = brand_df.assign(_gl=gl_key, _row=brand_df.index).groupby('_gl', sort=False)
+        ranges = groups.agg(row_start=('_row', 'min'), row_count=('_row', 'size'),
+                            amount=(AMOUNT_COLUMN, 'sum')).reset_index()
+        ranges = ranges[ranges['_gl'] != '']
+        index_parts.append(pd.DataFrame({
+            'brand': brand,
+            'year_month': year_month,
+            'gl_account': ranges['_gl'],
+            'file': output_file.relative_to(STORE_DIR).as_posix(),
+            'row_start': ranges['row_start'],
+            'row_count': ranges['row_count'],
+            'amount': ranges['amount'],
+        }, columns=INDEX_COLUMNS))
+
+    # 같은 연월의 이전 파티션 정리
+    for old_file in STORE_DIR.glob(f'brand=*/year_month={year_month}/part.*'):
+        if old_file not in written:
+            old_file.unlink(missing_ok=True)
+
+    index = pd.concat(index_parts, ignore_index=True) if index_parts else pd.DataFrame(columns=INDEX_COLUMNS)
+    INDEX_DIR.mkdir(parents=True, exist_ok=True)
+    index.to_csv(index_file(year_month), index=False, encoding='utf-8-sig')
+    written.append(index_file(year_month))
+
+    print(f"[OK] Stored {len(index_parts)} brand partitions, {len(index):,} GL accounts ({STORE_FORMAT})")
+    return written
+
+
+def stored_months():
+    """인덱스가 있는 연월 목록 (오름차순)"""
+    return sorted(path.stem for path in INDEX_DIR.glob('*.csv'))
+
+
+def load_index(months=None):
+    """연월별 인덱스를 합친 데이터프레임 (months=None이면 전체)"""
+    months = stored_months() if months is None else [str(month) for month in months]
+    dtypes = {'brand': str, 'year_month': str, 'gl_account': str, 'file': str}
+    frames = [pd.read_csv(index_file(month), encoding='utf-8-sig', dtype=dtypes, keep_default_na=False)
+              for month in months if index_file(month).exists()]
+    if not frames:
+        return pd.DataFrame(columns=INDEX_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_slice(brand, gl_account, months=None, index=None):
+    """
+    브랜드 × GL계정 거래 데이터 (인덱스의 행 범위만 사용, 연월 순)
+
+    Args:
+        index: load_index 결과 (여러 번 조회할 때 재사용)
+    """
+    index = load_index(months) if index is None else index
+    entries = index[(index['brand'] == brand) & (index['gl_account'] == gl_account)]
+    frames = []
+    for entry in entries.sort_values('year_month').itertuples(index=False):
+        partition = read_partition(STORE_DIR / entry.file)
+        frames.append(partition.iloc[entry.row_start:entry.row_start + entry.row_count])
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def export_legacy(gl_analysis_dir=GL_ANALYSIS_DIR, months=None, max_workers=None):
+    """
+    저장소에서 기존 형식 [Brand]/[GL_Account]_YYYYMM.csv 파일 생성
+
+    Returns:
+        생성한 파일 목록
+    """
+    months = stored_months() if months is None else [str(month) for month in months]
+    written = []
+    for year_month in months:
+        partitions = sorted(STORE_DIR.glob(f'brand=*/year_month={year_month}/part.*'))
+        for path in partitions:
+            df = read_partition(path)
+            files = write_partitions(
+                df, [BRAND_COLUMN, GL_COLUMN],
+                lambda key: legacy_gl_file(gl_analysis_dir, key[0], key[1], year_month),
+                max_workers=max_workers)
+            written.extend(files.values())
+        print(f"  [OK] {year_month}: {len(partitions)} brands exported")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GL계정 분석 데이터 저장소 조회/내보내기')
+    parser.add_argument('--months', nargs='+', metavar='YYYYMM', help='대상 연월 (기본: 전체)')
+    parser.add_argument('--brand', help='조회할 브랜드 (사업 영역 내역)')
+    parser.add_argument('--gl-account', help='조회할 GL계정 설명')
+    parser.add_argument('--export', action='store_true',
+                        help='기존 gl_analysis/[Brand]/[GL_Account]_YYYYMM.csv 생성')
+    parser.add_argument('--combined', action='store_true',
+                        help='--export와 함께: [Brand]/[GL_Account]_combined.csv도 생성 (costs 파일 기준)')
+    args = parser.parse_args()
+
+    if args.export:
+        print(f"\n[EXPORT] Exporting legacy CSV files to {GL_ANALYSIS_DIR.relative_to(BASE_DIR)}...")
+        written = export_legacy(months=args.months)
+        print(f"[OK] Exported {len(written):,} files")
+        if args.combined:
+            from period_comparison import create_comparison
+            create_comparison(COSTS_DIR, ['brand', 'gl_account'],
+                              lambda key: legacy_gl_file(GL_ANALYSIS_DIR, key[0], key[1], 'combined'))
+        return
+
+    index = load_index(args.months)
+    if args.brand and args.gl_account:
+        df = read_slice(args.brand, args.gl_account, index=index)
+        print(f"[SLICE] {args.brand} / {args.gl_account}: {len(df):,} rows")
+        if not df.empty:
+            print(df.groupby('연월')[AMOUNT_COLUMN].agg(['sum', 'count']).to_string())
+        return
+
+    print(f"[STORE] {STORE_DIR.relative_to(BASE_DIR)} ({STORE_FORMAT})")
+    if index.empty:
+        print("  [WARN] No stored months")
+        return
+    summary = index.groupby('year_month').agg(brands=('brand', 'nunique'), gl_accounts=('gl_account', 'size'),
+                                              rows=('row_count', 'sum'), amount=('amount', 'sum'))
+    for year_month, row in summary.iterrows():
+        print(f"  {year_month}: {row['brands']} brands, {row['gl_accounts']:,} GL accounts, "
+              f"{row['rows']:,} rows, {row['amount']:,.0f} KRW")
+
+
+if __name__ == '__main__':
+    main()
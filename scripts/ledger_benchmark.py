@@ -0,0 +1,277 @@
+"""
+원장 처리 단계 벤치마크 (합성 데이터, synthetic_ledger.py)
+- 규모별(기본 10k/100k/1M행)로 합성 원본을 만들고 단계별 소요 시간과 최대 메모리 측정
+  parse_v4: 피벗 원장 CSV 로드 + v4 계층 파싱 (ledger_pipeline.parse_v4)
+  read_excel: 거래 원장 xlsx 로드 (--excel 지정 시, xlsx 생성이 오래 걸림)
+  load_transactions: 거래 원장 스키마 적용 + 코스트센터 타입 분류 (process_ledger_file의 변환 부분)
+  create_aggregated_costs / create_brand_gl_analysis: process_ledger_transactions.py 단계
+  merge_data: Snowflake 비용 전처리 + 매출/인원/매장 병합 (csv_to_dashboard.py)
+  calculate_kpi: (브랜드, 월) KPI 테이블 (kpi_engine.compute_kpi_table)
+- 시간: 반복 실행 중앙값 (time.perf_counter), 메모리: 별도 1회 실행의 tracemalloc 최대 할당량
+  (numpy/pandas 버퍼 포함, 인터프리터/라이브러리 기본 메모리는 제외)
+- 단계 출력 파일은 임시 폴더에 저장 (public/data는 변경하지 않음)
+- --save로 결과를 JSON으로 저장하고 --compare로 이전 결과와 비교, 허용 배수를 넘으면 종료 코드 1
+
+사용법:
+    python ledger_benchmark.py
+    python ledger_benchmark.py --sizes 10000 100000 --repeat 3 --save ../.cache/benchmark.json
+    python ledger_benchmark.py --compare ../.cache/benchmark.json --tolerance 1.5
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+import process_ledger_transactions as transactions
+from ledger_pipeline import parse_v4, read_pivot
+from ledger_rules import classify_cost_centers
+from ledger_schema import DERIVED_SCHEMA, apply_ledger_schema, apply_schema
+from synthetic_ledger import (DEFAULT_SPEC, generate_pivot, generate_snowflake_costs,
+                              generate_snowflake_tables, generate_transactions)
+
+# python_scripts 모듈 (대시보드 변환)
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / 'python_scripts'))
+
+from csv_to_dashboard import merge_data, process_cost_data  # noqa: E402
+from kpi_engine import compute_kpi_table  # noqa: E402
+
+# 기본 규모 (원본 하나의 행 수)
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+YEAR_MONTH = '202510'
+SNOWFLAKE_MONTHS = ['202409', '202410', '202509', '202510']
+
+
+@contextlib.contextmanager
+def _redirect_outputs(work_dir):
+    """process_ledger_transactions 출력 폴더를 임시 폴더로 교체"""
+    saved = transactions.COSTS_DIR, transactions.GL_ANALYSIS_DIR
+    transactions.COSTS_DIR = work_dir / 'costs'
+    transactions.GL_ANALYSIS_DIR = work_dir / 'gl_analysis'
+    transactions.COSTS_DIR.mkdir(parents=True, exist_ok=True)
+    transactions.GL_ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        yield
+    finally:
+        transactions.COSTS_DIR, transactions.GL_ANALYSIS_DIR = saved
+
+
+def prepare_inputs(rows, work_dir, excel=False, spec=DEFAULT_SPEC, seed=0):
+    """규모별 합성 원본 준비 (피벗 CSV/거래 원장 xlsx는 파일, 나머지는 메모리)"""
+    inputs = {'rows': rows, 'work_dir': work_dir}
+
+    inputs['pivot_file'] = work_dir / f'ledger_{YEAR_MONTH}.csv'
+    generate_pivot(rows, YEAR_MONTH, spec, seed).to_csv(inputs['pivot_file'], index=False, encoding='utf-8-sig')
+
+    inputs['transactions'] = generate_transactions(rows, spec, seed)
+    if excel:
+        inputs['excel_file'] = work_dir / f'{YEAR_MONTH[2:]}원장.xlsx'
+        inputs['transactions'].to_excel(inputs['excel_file'], index=False)
+
+    inputs['cost'] = generate_snowflake_costs(rows, SNOWFLAKE_MONTHS, spec, seed)
+    inputs['sales'], inputs['headcount'], inputs['stores'] = generate_snowflake_tables(SNOWFLAKE_MONTHS, spec, seed)
+    return inputs
+
+
+# ---------------------------------------------------------------------------
+# 단계: stage(state) → 결과 (state = prepare_inputs 결과 + 앞 단계 결과)
+# 입력을 변경하지 않으므로 같은 state로 반복 실행 가능
+# ---------------------------------------------------------------------------
+
+def stage_parse_v4(state):
+    return parse_v4(read_pivot(state['pivot_file']), YEAR_MONTH)
+
+
+def stage_read_excel(state):
+    return pd.read_excel(state['excel_file'])
+
+
+def stage_load_transactions(state):
+    df = apply_ledger_schema(state['transactions'])
+    df['연월'] = YEAR_MONTH
+    df['코스트센터타입'] = classify_cost_centers(df['코스트 센터'])
+    return apply_schema(df, DERIVED_SCHEMA)
+
+
+def stage_aggregated_costs(state):
+    return transactions.create_aggregated_costs(state['load_transactions'], YEAR_MONTH)
+
+
+def stage_brand_gl_analysis(state):
+    return transactions.create_brand_gl_analysis(state['load_transactions'], YEAR_MONTH)
+
+
+def stage_merge_data(state):
+    # process_cost_data/merge_data는 입력 프레임에 컬럼을 추가하므로 복사본 사용
+    cost = process_cost_data(state['cost'].copy())
+    return merge_data(cost, state['sales'].copy(), state['headcount'].copy(), state['stores'].copy())
+
+
+def stage_calculate_kpi(state):
+    return compute_kpi_table(state['merge_data'])
+
+
+# (이름, 함수, 입력 행 수 키) - 선언 순서대로 실행, 결과는 state[이름]
+BENCH_STAGES = [
+    ('parse_v4', stage_parse_v4, 'rows'),
+    ('read_excel', stage_read_excel, 'rows'),
+    ('load_transactions', stage_load_transactions, 'transactions'),
+    ('create_aggregated_costs', stage_aggregated_costs, 'load_transactions'),
+    ('create_brand_gl_analysis', stage_brand_gl_analysis, 'load_transactions'),
+    ('merge_data', stage_merge_data, 'cost'),
+    ('calculate_kpi', stage_calculate_kpi, 'merge_data'),
+]
+
+
+def _row_count(value):
+    """단계 결과 행 수 (데이터프레임 행, 파일 목록 길이)"""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    return len(value)
+
+
+def measure(func, state, repeat=1, memory=True):
+    """
+    단계 1개 측정 (출력 억제)
+
+    Returns:
+        (결과, 소요 시간 중앙값 ms, 최대 메모리 MB 또는 None)
+    """
+    times = []
+    result = None
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = func(state)
+            times.append((time.perf_counter() - started) * 1000)
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                func(state)
+            peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+        finally:
+            tracemalloc.stop()
+
+    return result, statistics.median(times), peak
+
+
+def run_benchmark(sizes, stages=None, repeat=1, memory=True, excel=False, seed=0):
+    """
+    규모별 단계 측정
+
+    Returns:
+        [{'stage', 'size', 'rows_in', 'rows_out', 'ms', 'peak_mb'}, ...]
+    """
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix='ledger_benchmark_') as tmp:
+            work_dir = Path(tmp)
+            print(f"\n[PREPARE] {size:,} rows...")
+            state = prepare_inputs(size, work_dir, excel=excel, seed=seed)
+            print(f"  {'stage':<26} {'size':>10} {'rows_in':>10} {'rows_out':>10} {'ms':>10} {'peak MB':>10}")
+
+            with _redirect_outputs(work_dir):
+                for name, func, input_key in BENCH_STAGES:
+                    if name == 'read_excel' and not excel:
+                        continue
+                    # 선택하지 않은 단계도 뒤 단계 입력이 필요하면 측정 없이 1회 실행
+                    if stages and name not in stages:
+                        if any(key == name for _, _, key in BENCH_STAGES):
+                            with contextlib.redirect_stdout(io.StringIO()):
+                                state[name] = func(state)
+                        continue
+
+                    state[name], elapsed, peak = measure(func, state, repeat, memory)
+                    row = {
+                        'stage': name,
+                        'size': size,
+                        'rows_in': _row_count(state[input_key]),
+                        'rows_out': _row_count(state[name]),
+                        'ms': round(elapsed, 1),
+                        'peak_mb': None if peak is None else round(peak, 1),
+                    }
+                    results.append(row)
+                    print_row(row)
+    return results
+
+
+def print_row(row):
+    peak = '-' if row['peak_mb'] is None else f"{row['peak_mb']:,.1f}"
+    print(f"  {row['stage']:<26} {row['size']:>10,} {row['rows_in']:>10,} {row['rows_out']:>10,} "
+          f"{row['ms']:>10,.1f} {peak:>10}")
+
+
+def compare_results(results, baseline, tolerance):
+    """
+    이전 결과(baseline)와 단계별 소요 시간 비교
+
+    Returns:
+        허용 배수를 넘은 [(단계, 규모, 이전 ms, 현재 ms)]
+    """
+    previous = {(row['stage'], row['size']): row['ms'] for row in baseline}
+    regressions = []
+    print(f"\n[COMPARE] tolerance {tolerance:.2f}x")
+    for row in results:
+        before = previous.get((row['stage'], row['size']))
+        if not before:
+            continue
+        ratio = row['ms'] / before
+        status = 'REGRESSION' if ratio > tolerance else 'ok'
+        print(f"  {row['stage']:<26} {row['size']:>10,} {before:>10,.1f} -> {row['ms']:>10,.1f} ms "
+              f"({ratio:.2f}x) {status}")
+        if ratio > tolerance:
+            regressions.append((row['stage'], row['size'], before, row['ms']))
+    return regressions
+
+
+def main():
+    stage_names = [name for name, _, _ in BENCH_STAGES]
+    parser = argparse.ArgumentParser(description='원장 처리 단계 벤치마크 (합성 데이터)')
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES,
+                        help='원본 행 수 목록 (기본 10000 100000 1000000)')
+    parser.add_argument('--stages', nargs='+', choices=stage_names, help='측정할 단계 (기본 전체)')
+    parser.add_argument('--repeat', type=int, default=1, help='단계별 반복 횟수 (중앙값 사용, 기본 1)')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 메모리 측정 생략')
+    parser.add_argument('--excel', action='store_true', help='거래 원장 xlsx 생성 후 read_excel 단계 포함')
+    parser.add_argument('--seed', type=int, default=0, help='합성 데이터 난수 시드')
+    parser.add_argument('--save', type=Path, metavar='FILE', help='결과 JSON 저장')
+    parser.add_argument('--compare', type=Path, metavar='FILE', help='이전 결과 JSON과 비교')
+    parser.add_argument('--tolerance', type=float, default=1.5,
+                        help='--compare 허용 배수 (기본 1.5, 넘으면 종료 코드 1)')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.stages, args.repeat, not args.no_memory, args.excel, args.seed)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'results': results}, f, indent=2)
+        print(f"\n[OK] Saved: {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        if compare_results(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+원장 Excel 캐시 모듈
+- 원장.xlsx를 한 번만 파싱해 컬럼형 캐시(Parquet, pyarrow가 없으면 pickle)로 저장
+- 캐시는 원본 파일 해시로 구분되어 내용이 바뀌면 자동으로 다시 생성
+- 캐시 생성 시 ledger_schema 스키마 적용 (금액 → int64, 반복되는 문자열 컬럼 → category)
+"""
+
+from pathlib import Path
+import hashlib
+
+import pandas as pd
+
+from ledger_schema import apply_ledger_schema
+
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    CACHE_FORMAT = 'pickle'
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = BASE_DIR / '.cache' / 'ledger'
+
+# 캐시 스키마 버전 (정규화 규칙이 바뀌면 올려서 기존 캐시 무효화)
+CACHE_VERSION = 2
+
+
+def _file_hash(file_path, chunk_size=1024 * 1024):
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_file(file_path, digest):
+    suffix = 'parquet' if CACHE_FORMAT == 'parquet' else 'pkl'
+    return CACHE_DIR / f'{Path(file_path).stem}_v{CACHE_VERSION}_{digest[:16]}.{suffix}'
+
+
+def read_ledger_excel(file_path, refresh=False):
+    """
+    원장 Excel 파일 로드 (캐시 우선)
+
+    Args:
+        file_path: 원장 Excel 파일 경로
+        refresh: True면 캐시를 무시하고 Excel에서 다시 파싱
+
+    Returns:
+        정규화된 데이터프레임
+    """
+    file_path = Path(file_path)
+    cache_file = _cache_file(file_path, _file_hash(file_path))
+
+    if cache_file.exists() and not refresh:
+        if CACHE_FORMAT == 'parquet':
+            df = pd.read_parquet(cache_file)
+        else:
+            df = pd.read_pickle(cache_file)
+        print(f"[CACHE] Loaded {file_path.name} from {cache_file.name}")
+        return df
+
+    df = apply_ledger_schema(pd.read_excel(file_path))
+
+    # 같은 원본의 이전 캐시 정리 후 저장
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for old_cache in CACHE_DIR.glob(f'{file_path.stem}_v*_*.*'):
+        old_cache.unlink(missing_ok=True)
+    if CACHE_FORMAT == 'parquet':
+        df.to_parquet(cache_file, index=False)
+    else:
+        df.to_pickle(cache_file)
+    print(f"[CACHE] Cached {file_path.name} -> {cache_file.name}")
+
+    return df
@@ -0,0 +1,118 @@
+"""
+원장 처리 매니페스트 모듈
+- 월별 원본 파일의 해시/수정시각/행수와 생성된 출력 파일 목록을 기록
+- 원본이 바뀐 월만 다시 처리할 수 있도록 변경 여부 판단
+- GL계정 분석 저장 방식(layout)이 바뀐 월도 다시 처리 (이전 매니페스트에 없으면 csv)
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+MANIFEST_VERSION = 1
+
+# 원장 파일명 패턴 (예: 2410원장.xlsx → 202410)
+LEDGER_FILE_PATTERN = re.compile(r'^(\d{2})(\d{2})원장\.xlsx$')
+
+
+def discover_ledger_files(data_dir):
+    """
+    data_dir에서 YYMM원장.xlsx 파일 탐색
+
+    Returns:
+        [(파일명, 연월)] 연월 오름차순
+    """
+    files = []
+    for file_path in Path(data_dir).glob('*원장.xlsx'):
+        match = LEDGER_FILE_PATTERN.match(file_path.name)
+        if match:
+            files.append((file_path.name, f'20{match.group(1)}{match.group(2)}'))
+    return sorted(files, key=lambda item: item[1])
+
+
+def file_hash(file_path, chunk_size=1024 * 1024):
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_file):
+    """매니페스트 로드 (없거나 버전이 다르면 빈 매니페스트)"""
+    manifest_file = Path(manifest_file)
+    if manifest_file.exists():
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+    return {'version': MANIFEST_VERSION, 'months': {}}
+
+
+def save_manifest(manifest, manifest_file):
+    """매니페스트 저장"""
+    manifest['updated_at'] = datetime.now().isoformat()
+    Path(manifest_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def is_month_current(manifest, year_month, source_file, base_dir, layout='csv'):
+    """
+    해당 월 원본이 마지막 처리 이후 변경되지 않았고, 같은 저장 방식(layout)으로 생성한 출력 파일이 모두 남아 있는지 확인
+
+    크기/수정시각이 같으면 해시 계산 없이 변경 없음으로 판단하고,
+    수정시각만 바뀐 경우 해시를 비교해 내용이 같으면 매니페스트의 수정시각만 갱신한다.
+    """
+    entry = manifest['months'].get(year_month)
+    if not entry or entry.get('layout', 'csv') != layout:
+        return False
+
+    if not all((Path(base_dir) / output).exists() for output in entry.get('outputs', [])):
+        return False
+
+    stat = Path(source_file).stat()
+    if entry.get('size') == stat.st_size and entry.get('mtime') == stat.st_mtime:
+        return True
+
+    if entry.get('sha256') == file_hash(source_file):
+        entry['mtime'] = stat.st_mtime
+        entry['size'] = stat.st_size
+        return True
+
+    return False
+
+
+def record_month(manifest, year_month, source_file, rows, outputs, base_dir, layout='csv'):
+    """
+    처리 결과를 매니페스트에 기록
+
+    Returns:
+        이전 실행에서 생성했지만 이번 실행에서는 생성되지 않은 출력 파일 목록 (상대 경로)
+    """
+    base_dir = Path(base_dir)
+    source_file = Path(source_file)
+    stat = source_file.stat()
+
+    new_outputs = sorted({Path(output).resolve().relative_to(base_dir.resolve()).as_posix()
+                          for output in outputs})
+    previous = manifest['months'].get(year_month, {}).get('outputs', [])
+
+    manifest['months'][year_month] = {
+        'source': source_file.name,
+        'sha256': file_hash(source_file),
+        'mtime': stat.st_mtime,
+        'size': stat.st_size,
+        'rows': rows,
+        'layout': layout,
+        'outputs': new_outputs,
+        'processed_at': datetime.now().isoformat(),
+    }
+
+    return sorted(set(previous) - set(new_outputs))
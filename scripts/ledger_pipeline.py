@@ -0,0 +1,664 @@
+"""
+피벗 원장 데이터 처리 파이프라인
+- process_pivot_ledger*.py 네 가지 버전을 하나로 통합 (계층 파싱 방식만 전략으로 선택)
+- ledger 폴더의 ledger_YYYYMM.csv 전체를 자동 탐색 (--source excel: data 폴더의 YYMM원장.xlsx)
+- 단계 DAG: parse → costs → gl_analysis (월별) → combined (기간 비교), summary, drilldown (전체 월)
+  월별 단계는 월 단위로 워커 풀에서 병렬 실행 (CPU 위주인 parse는 프로세스 풀, 파일 저장 단계는 스레드 풀),
+  전체 월 단계는 모든 월의 선행 단계 완료 후 실행
+
+사용법:
+    python ledger_pipeline.py
+    python ledger_pipeline.py --strategy v3 --months 202410 202510 --workers 4
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+import argparse
+import contextlib
+import io
+import os
+import re
+import sys
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+from drilldown_index import DRILLDOWN_FILE, INDEX_FILE, remove_drilldown_index
+from ledger_manifest import discover_ledger_files
+from ledger_rules import coerce_amount
+from partitioned_writer import write_partitions
+from period_comparison import COMPARISONS, create_comparison
+from summary_cube import ROLLUPS, build_summaries
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'public' / 'data'
+LEDGER_DIR = DATA_DIR / 'ledger'
+COSTS_DIR = DATA_DIR / 'costs'
+GL_ANALYSIS_DIR = DATA_DIR / 'gl_analysis'
+
+# python_scripts 공용 모듈 (실행 보고서)
+sys.path.insert(0, str(BASE_DIR / 'python_scripts'))
+from run_report import count_rows, finish_run, report_file, span, start_run  # noqa: E402
+
+# 브랜드 목록
+BRANDS = ['Discovery', 'Duvetica', 'MLB', 'MLB KIDS', 'SERGIO TACCHINI']
+
+# 건너뛸 레이블
+SKIP_LABELS = ['', '(비어 있음)', '행 레이블', '총합계', 'nan']
+
+# 피벗 CSV 파일명 패턴 (예: ledger_202410.csv → 202410)
+LEDGER_CSV_PATTERN = re.compile(r'^ledger_(\d{6})\.csv$')
+
+# 파싱 결과 컬럼
+COLUMNS = ['brand', 'category_l1', 'category_l2', 'category_l3', 'amount', 'year_month']
+
+# 기본 월 병렬 처리 워커 수
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+def clean_amount_column(values):
+    """금액 컬럼 일괄 정제 (ledger_rules 숫자 변환 규칙, 숫자가 아니면 0)"""
+    return coerce_amount(values, dtype='float64')
+
+def safe_file_name(label):
+    """카테고리명 → 파일명 (경로 구분자/특수문자 정제)"""
+    return str(label).replace('/', '_').replace('\\', '_').replace(':', '').replace('(', '').replace(')', '').strip()
+
+def brand_dir_name(brand):
+    """브랜드명 → 폴더명"""
+    return brand.replace(' ', '_')
+
+def pivot_columns(raw):
+    """피벗 데이터 첫 두 컬럼 → (레이블 Series, 정제된 금액 Series)"""
+    labels = raw.iloc[:, 0]
+    labels = labels.where(labels.notna(), '').astype(str).str.strip()
+    amounts = clean_amount_column(raw.iloc[:, 1])
+    return labels, amounts
+
+# ---------------------------------------------------------------------------
+# 계층 파싱 전략: parse(raw, year_month) → COLUMNS 데이터프레임
+# ---------------------------------------------------------------------------
+
+def parse_v4(raw, year_month):
+    """
+    v4 규칙 (레이블 컬럼 전체에 대한 shift/cumsum 연산)
+
+    1. 브랜드 행 다음부터 해당 브랜드 데이터
+    2. 브랜드 구간 안에서 다시 나온 레이블 = 합계 행 (건너뛰기)
+    3. 다음 행이 같은 레이블 = 상위 카테고리 (첫 번째는 대분류, 이후는 중분류)
+    4. 단일 레이블 = 실제 데이터 행 (금액 0은 제외), 데이터 행마다 중분류 리셋
+    """
+    labels, amounts = pivot_columns(raw)
+    next_labels = labels.shift(-1, fill_value='')
+
+    # 브랜드 경계: 브랜드 행마다 새 구간 시작
+    valid = ~labels.isin(SKIP_LABELS)
+    is_brand = valid & labels.isin(BRANDS)
+    brand_id = is_brand.cumsum()
+
+    # 브랜드 구간 내 처음 나온 레이블만 사용 (중복 = 합계 행)
+    candidate = valid & ~is_brand & (brand_id > 0)
+    first_seen = ~pd.DataFrame({'brand_id': brand_id, 'label': labels})[candidate].duplicated()
+    first_seen = first_seen.reindex(labels.index, fill_value=False)
+
+    # 다음 행이 같은 레이블이면 상위 카테고리, 아니면 데이터 행
+    is_parent = first_seen & (labels == next_labels)
+    is_data = first_seen & ~is_parent & (amounts != 0)
+
+    events = pd.DataFrame({
+        'brand_id': brand_id,
+        'label': labels,
+        'amount': amounts,
+        'is_parent': is_parent,
+    })[is_parent | is_data]
+
+    if events.empty:
+        return pd.DataFrame(columns=COLUMNS)
+
+    brands = labels.where(is_brand).ffill()
+    events['brand'] = brands[events.index]
+
+    # 브랜드 내 첫 번째 상위 카테고리 = 대분류, 이후 브랜드 끝까지 유지
+    parent_rank = events.groupby('brand_id')['is_parent'].cumsum()
+    l1_marker = events['label'].where(events['is_parent'] & (parent_rank == 1))
+    events['l1'] = l1_marker.groupby(events['brand_id']).ffill().fillna('')
+
+    # 중분류: 직전 데이터 행 이후 처음 나온 (대분류가 아닌) 상위 카테고리
+    is_row = ~events['is_parent']
+    events['segment'] = is_row.astype(int).groupby(events['brand_id']).cumsum() - is_row.astype(int)
+    l2_markers = events[events['is_parent'] & (parent_rank > 1)]
+    l2_first = l2_markers.groupby(['brand_id', 'segment'])['label'].first()
+
+    data = events[is_row]
+    l2_key = pd.MultiIndex.from_arrays([data['brand_id'], data['segment']])
+    l2 = pd.Series(l2_first.reindex(l2_key).to_numpy(), index=data.index).fillna('')
+    l1 = data['l1']
+
+    only_l1 = (l1 == '').to_numpy()
+    return pd.DataFrame({
+        'brand': data['brand'].to_numpy(),
+        'category_l1': np.where(only_l1, data['label'], l1),
+        'category_l2': np.where(only_l1, '', l2),
+        'category_l3': np.where(only_l1, '', data['label']),
+        'amount': data['amount'].to_numpy(),
+        'year_month': year_month,
+    }, columns=COLUMNS)
+
+def parse_v4_rows(raw, year_month):
+    """v4 규칙의 행 단위 루프 버전 (parse_v4와 동일한 행 생성, 검증용)"""
+    labels, amounts = pivot_columns(raw)
+    labels, amounts = labels.tolist(), amounts.tolist()
+
+    rows = []
+    current_brand = None
+    last_seen = set()
+    category_l1 = ''
+    category_l2 = ''
+
+    for idx, label in enumerate(labels):
+        if label in SKIP_LABELS:
+            continue
+
+        if label in BRANDS:
+            current_brand = label
+            last_seen = set()
+            category_l1 = ''
+            category_l2 = ''
+            continue
+
+        # 브랜드 이전 행, 중복 레이블(합계 행) 건너뛰기
+        if not current_brand or label in last_seen:
+            continue
+        last_seen.add(label)
+
+        next_label = labels[idx + 1] if idx + 1 < len(labels) else ''
+        if label == next_label:
+            if category_l1 == '':
+                category_l1 = label
+            elif category_l2 == '':
+                category_l2 = label
+            continue
+
+        if amounts[idx] == 0:
+            continue
+
+        if category_l1 == '':
+            rows.append((current_brand, label, '', '', amounts[idx], year_month))
+        else:
+            rows.append((current_brand, category_l1, category_l2, label, amounts[idx], year_month))
+            # 중분류 리셋 (다음 항목은 새로운 중분류일 수 있음)
+            category_l2 = ''
+
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+def parse_v3(raw, year_month):
+    """
+    v3 규칙 (카테고리 스택)
+
+    - 다음 행이 같은 레이블 = 상위 카테고리 (첫 번째는 대분류, 두 번째는 중분류, 이후 유지)
+    - 단일 레이블 = 실제 데이터 행 (금액 0은 제외), 중복 레이블도 데이터 행으로 처리
+    """
+    labels, amounts = pivot_columns(raw)
+    labels, amounts = labels.tolist(), amounts.tolist()
+
+    rows = []
+    current_brand = None
+    category_l1 = ''
+    category_l2 = ''
+
+    for idx, label in enumerate(labels):
+        if label in SKIP_LABELS:
+            continue
+
+        if label in BRANDS:
+            current_brand = label
+            category_l1 = ''
+            category_l2 = ''
+            continue
+
+        if not current_brand:
+            continue
+
+        next_label = labels[idx + 1] if idx + 1 < len(labels) else ''
+        if label == next_label:
+            if category_l1 == '':
+                category_l1 = label
+            elif category_l2 == '':
+                category_l2 = label
+            continue
+
+        if amounts[idx] == 0:
+            continue
+
+        if category_l1 == '':
+            rows.append((current_brand, label, '', '', amounts[idx], year_month))
+        else:
+            rows.append((current_brand, category_l1, category_l2, label, amounts[idx], year_month))
+
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+def parse_final(raw, year_month):
+    """
+    Final 규칙 (연속 레이블 쌍)
+
+    - 같은 레이블이 연속 2번 나오면 대분류: 두 번째 행의 금액을 대분류 금액으로 저장
+    - 단일 레이블 = 현재 대분류의 소분류 (대분류가 없으면 대분류), 금액 0도 저장
+    """
+    labels, amounts = pivot_columns(raw)
+    labels, amounts = labels.tolist(), amounts.tolist()
+
+    rows = []
+    current_brand = None
+    current_category_l1 = None
+    skip_next = False
+
+    for idx, label in enumerate(labels):
+        if skip_next:
+            skip_next = False
+            continue
+
+        if label in SKIP_LABELS:
+            continue
+
+        if label in BRANDS:
+            current_brand = label
+            current_category_l1 = None
+            continue
+
+        if not current_brand:
+            continue
+
+        next_label = labels[idx + 1] if idx + 1 < len(labels) else ''
+        if label == next_label:
+            # 합계 행 - 대분류로 설정하고 다음 행(대분류 실제 금액) 사용
+            current_category_l1 = label
+            skip_next = True
+            rows.append((current_brand, label, '', '', amounts[idx + 1], year_month))
+            continue
+
+        if current_category_l1:
+            rows.append((current_brand, current_category_l1, '', label, amounts[idx], year_month))
+        else:
+            rows.append((current_brand, label, '', '', amounts[idx], year_month))
+
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+def parse_indent(raw, year_month):
+    """
+    들여쓰기 스택 규칙 (원본 Excel 피벗용, process_pivot_ledger.py)
+
+    - 다음 행이 같은 레이블 = 상위 카테고리 (스택에 추가)
+    - 그 외 = 데이터 행 (스택 첫 번째가 대분류, 두 번째가 중분류), 금액 0도 저장
+    """
+    labels, amounts = pivot_columns(raw)
+    labels, amounts = labels.tolist(), amounts.tolist()
+
+    rows = []
+    current_brand = None
+    indent_stack = []
+
+    for idx, label in enumerate(labels):
+        if label in SKIP_LABELS:
+            continue
+
+        if label in BRANDS:
+            current_brand = label
+            indent_stack = []
+            continue
+
+        if not current_brand:
+            continue
+
+        next_label = labels[idx + 1] if idx + 1 < len(labels) else ''
+        if next_label == label:
+            indent_stack.append(label)
+            continue
+
+        category_l1 = indent_stack[0] if len(indent_stack) > 0 else label
+        category_l2 = indent_stack[1] if len(indent_stack) > 1 else ''
+        category_l3 = label if len(indent_stack) > 0 else ''
+
+        # 스택에 있는 레이블이면 해당 레벨까지 스택 정리
+        if label in indent_stack:
+            while indent_stack and indent_stack[-1] != label:
+                indent_stack.pop()
+            if indent_stack:
+                indent_stack.pop()
+
+        rows.append((current_brand, category_l1, category_l2, category_l3, amounts[idx], year_month))
+
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+# 계층 파싱 전략 목록 (--strategy)
+HIERARCHY_STRATEGIES = {
+    'v4': parse_v4,
+    'v4-rows': parse_v4_rows,
+    'v3': parse_v3,
+    'final': parse_final,
+    'indent': parse_indent,
+}
+
+# ---------------------------------------------------------------------------
+# 원본 탐색/로드
+# ---------------------------------------------------------------------------
+
+def discover_ledger_csvs(ledger_dir):
+    """
+    ledger_dir에서 ledger_YYYYMM.csv 파일 탐색
+
+    Returns:
+        [(파일 경로, 연월)] 연월 오름차순
+    """
+    files = []
+    for file_path in Path(ledger_dir).glob('ledger_*.csv'):
+        match = LEDGER_CSV_PATTERN.match(file_path.name)
+        if match:
+            files.append((file_path, match.group(1)))
+    return sorted(files, key=lambda item: item[1])
+
+def discover_sources(source):
+    """원본 종류별 파일 탐색 ('csv': ledger_YYYYMM.csv, 'excel': YYMM원장.xlsx) → {연월: 경로}"""
+    if source == 'excel':
+        return {year_month: DATA_DIR / filename for filename, year_month in discover_ledger_files(DATA_DIR)}
+    return {year_month: file_path for file_path, year_month in discover_ledger_csvs(LEDGER_DIR)}
+
+def read_pivot(file_path):
+    """피벗 원본 로드 (CSV는 첫 행을 헤더로, Excel은 헤더 없이)"""
+    if file_path.suffix == '.xlsx':
+        return pd.read_excel(file_path, header=None)
+    return pd.read_csv(file_path, encoding='utf-8-sig')
+
+# ---------------------------------------------------------------------------
+# 단계
+# 월별 단계: stage(inputs, year_month, config) - inputs = {선행 단계: 같은 월 결과}
+# 전체 월 단계: stage(inputs, config) - inputs = {선행 단계: {연월: 결과}}
+# ---------------------------------------------------------------------------
+
+def stage_parse(inputs, year_month, config):
+    """원본 파일 계층 파싱"""
+    file_path = config['sources'][year_month]
+    print(f"\n[PARSE] Parsing {file_path.name} ({config['strategy']})...")
+
+    with span('read', year_month=year_month, file=file_path.name) as record:
+        raw = read_pivot(file_path)
+        record['rows_out'] = len(raw)
+    df = HIERARCHY_STRATEGIES[config['strategy']](raw, year_month)
+    print(f"[OK] {year_month}: parsed {len(df)} data rows")
+
+    if not df.empty:
+        print(f"     Brands: {df['brand'].nunique()}")
+        print(f"     L1 Categories: {df['category_l1'].nunique()}")
+        print(f"     Total Amount: {df['amount'].sum():,.0f} KRW")
+
+    return df
+
+def stage_costs(inputs, year_month, config):
+    """월별 비용 데이터 저장 (costs_YYYYMM.csv)"""
+    df = inputs['parse']
+    if df.empty:
+        print(f"[WARN] {year_month}: No data parsed")
+        return None
+
+    lines = [f"\n[STATS] {year_month} brand summary:"]
+    brand_summary = df.groupby('brand')['amount'].sum().sort_values(ascending=False)
+    lines += [f"  - {brand}: {amount:,.0f} KRW" for brand, amount in brand_summary.items()]
+
+    lines.append(f"\n[STATS] {year_month} category L1 summary (top 10):")
+    cat_summary = df.groupby('category_l1')['amount'].sum().sort_values(ascending=False).head(10)
+    lines += [f"  - {cat}: {amount:,.0f} KRW" for cat, amount in cat_summary.items()]
+
+    output_file = COSTS_DIR / f'costs_{year_month}.csv'
+    df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    lines.append(f"\n[OK] Saved: {output_file.name}")
+    print('\n'.join(lines))
+
+    return df
+
+def stage_gl_analysis(inputs, year_month, config):
+    """브랜드별 대분류 분석 데이터 생성 ([Brand]/[Category]_YYYYMM.csv)"""
+    df = inputs['costs']
+    if df is None:
+        return {}
+
+    def category_output_file(key):
+        brand, category_l1 = key
+        if not category_l1:
+            return None
+        return GL_ANALYSIS_DIR / brand_dir_name(brand) / f'{safe_file_name(category_l1)}_{year_month}.csv'
+
+    # (브랜드, 대분류) 단일 groupby 패스로 파일 저장
+    written = write_partitions(df, ['brand', 'category_l1'], category_output_file,
+                               max_workers=config['write_workers'])
+
+    lines = [f"\n[ANALYSIS] Brand analysis data for {year_month}:"]
+    for brand in df['brand'].unique():
+        categories = [key for key in written if key[0] == brand]
+        lines.append(f"  [OK] {brand}: {len(categories)} categories")
+    print('\n'.join(lines))
+
+    return written
+
+def stage_combined(inputs, config):
+    """기간 비교 통합 분석 파일 생성 ([Brand]/[Category]_combined.csv, 기본: 최근 월 vs 전년 동월)"""
+    print(f"\n[COMBINE] Creating combined analysis files...")
+
+    def combined_output_file(key):
+        brand, category_l1 = key
+        if not category_l1:
+            return None
+        return GL_ANALYSIS_DIR / brand_dir_name(brand) / f'{safe_file_name(category_l1)}_combined.csv'
+
+    # 이번 실행에서 처리하지 않은 비교 대상 월은 기존 costs_YYYYMM.csv 사용
+    return create_comparison(COSTS_DIR, ['brand', 'category_l1'], combined_output_file,
+                             comparison=config['comparison'], base_month=config['base_month'],
+                             max_workers=config['write_workers'])
+
+def stage_summary(inputs, config):
+    """대시보드용 요약 데이터 생성 (COSTS_DIR 요약 큐브에서 변경된 월만 다시 집계)"""
+    print(f"\n[SUMMARY] Creating dashboard summary...")
+
+    # 브랜드별, 연월별, 카테고리별 요약 + 브랜드별 월별 합계
+    rollups = {file_name: ROLLUPS[file_name]
+               for file_name in ['summary_by_brand_category.csv', 'summary_by_brand_month.csv']}
+    return build_summaries(COSTS_DIR, rollups,
+                           count_columns=[('Brands', 'brand'), ('L1 Categories', 'category_l1')])
+
+def stage_drilldown(inputs, config):
+    """
+    드릴다운 인덱스 삭제 (process_ledger_transactions.py가 만든 drilldown_index.json)
+    피벗 원장 costs에는 gl_account가 없어 인덱스를 만들 수 없으므로, costs를 저장했으면
+    이전 인덱스를 지워 웹 계층이 [Brand]/[Category]_*.csv를 읽도록 함
+    """
+    if all(df is None for df in inputs['costs'].values()):
+        return False
+    removed = remove_drilldown_index(GL_ANALYSIS_DIR / DRILLDOWN_FILE.name, GL_ANALYSIS_DIR / INDEX_FILE.name)
+    if removed:
+        print(f"\n[DRILLDOWN] Removed stale {INDEX_FILE.name} (pivot costs have no gl_account)")
+    return removed
+
+# 단계 DAG: (이름, 선행 단계, 월별 여부, 함수)
+STAGES = [
+    ('parse', [], True, stage_parse),
+    ('costs', ['parse'], True, stage_costs),
+    ('gl_analysis', ['costs'], True, stage_gl_analysis),
+    ('combined', ['costs'], False, stage_combined),
+    ('summary', ['costs'], False, stage_summary),
+    ('drilldown', ['costs'], False, stage_drilldown),
+]
+
+# 프로세스 풀에서 실행하는 월별 단계 (계층 파싱은 CPU 위주라 스레드로는 병렬화되지 않음)
+PROCESS_STAGES = {'parse'}
+
+def execute_stage(name, func, inputs, year_month, config):
+    """단계 함수 실행 (실행 보고서에 시간/행 수 기록)"""
+    with span(name, year_month=year_month) as record:
+        if inputs:
+            record['rows_in'] = sum(count_rows(value) or 0 for value in inputs.values())
+        result = func(inputs, config) if year_month is None else func(inputs, year_month, config)
+        record['rows_out'] = count_rows(result)
+    return result
+
+def _execute_stage_in_worker(name, func, inputs, year_month, config):
+    """프로세스 풀 워커: 단계 로그를 모아서 결과와 함께 반환 (여러 월 출력이 섞이지 않도록)"""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = execute_stage(name, func, inputs, year_month, config)
+    return result, log.getvalue()
+
+def run_stages(stages, months, config, workers=1, process_stages=()):
+    """
+    단계 DAG 실행
+
+    - 월별 단계는 (단계, 연월) 작업, 전체 월 단계는 (단계, None) 작업
+    - 선행 작업이 끝난 작업부터 선언 순서(월 → 단계)대로 워커에 배정
+      (workers=1이면 월별로 parse → costs → gl_analysis 후 다음 월, 마지막에 전체 월 단계)
+    - workers > 1이면 process_stages 단계는 프로세스 풀, 나머지는 스레드 풀에서 실행
+      (동시 실행 작업 수는 두 풀 합쳐 workers, 프로세스 작업 로그는 완료 시 한 번에 출력)
+
+    Returns:
+        {(단계, 연월 또는 None): 결과}
+    """
+    per_month = {name: is_per_month for name, _, is_per_month, _ in stages}
+    functions = {name: func for name, _, _, func in stages}
+
+    tasks = []
+    requires = {}
+    for month in months:
+        for name, deps, is_per_month, _ in stages:
+            if is_per_month:
+                tasks.append((name, month))
+                requires[(name, month)] = [(dep, month if per_month[dep] else None) for dep in deps]
+    for name, deps, is_per_month, _ in stages:
+        if not is_per_month:
+            tasks.append((name, None))
+            requires[(name, None)] = [
+                (dep, month) for dep in deps for month in (months if per_month[dep] else [None])
+            ]
+
+    def task_inputs(task):
+        name, month = task
+        if month is not None:
+            return {dep: results[(dep, month)] for dep, _ in requires[task]}
+        inputs = {}
+        for dep, dep_month in requires[task]:
+            if dep_month is None:
+                inputs[dep] = results[(dep, None)]
+            else:
+                inputs.setdefault(dep, {})[dep_month] = results[(dep, dep_month)]
+        return inputs
+
+    workers = max(1, workers)
+    use_processes = workers > 1 and any(name in process_stages for name, _ in tasks)
+    process_pool = ProcessPoolExecutor(max_workers=min(workers, len(months))) if use_processes else contextlib.nullcontext()
+
+    results = {}
+    pending = list(tasks)
+    running = {}
+    in_process = set()
+    with ThreadPoolExecutor(max_workers=workers) as threads, process_pool as processes:
+        while pending or running:
+            for task in list(pending):
+                if len(running) >= workers:
+                    break
+                if all(dep in results for dep in requires[task]):
+                    pending.remove(task)
+                    name, month = task
+                    args = (name, functions[name], task_inputs(task), month, config)
+                    if processes is not None and name in process_stages:
+                        future = processes.submit(_execute_stage_in_worker, *args)
+                        in_process.add(future)
+                    else:
+                        future = threads.submit(execute_stage, *args)
+                    running[future] = task
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if future in in_process:
+                    in_process.discard(future)
+                    result, log = result
+                    print(log, end='', flush=True)
+                results[running.pop(future)] = result
+
+    return results
+
+def run_pipeline(strategy='v4', source='csv', months=None, workers=DEFAULT_WORKERS,
+                 comparison='yoy', base_month=None):
+    """
+    원장 파이프라인 실행
+
+    Args:
+        strategy: 계층 파싱 전략 (HIERARCHY_STRATEGIES 키)
+        source: 'csv' (ledger/ledger_YYYYMM.csv) 또는 'excel' (data/YYMM원장.xlsx)
+        months: 처리할 연월 목록 (None이면 탐색된 전체)
+        workers: 월 병렬 처리 워커 수 (1이면 순차 처리, parse 단계는 워커 프로세스에서 실행)
+        comparison: combined 단계 비교 방식 (period_comparison.COMPARISONS)
+        base_month: 비교 기준월 (None이면 가장 최근 월)
+    """
+    COSTS_DIR.mkdir(parents=True, exist_ok=True)
+    GL_ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
+
+    sources = discover_sources(source)
+    if months:
+        for year_month in months:
+            if year_month not in sources:
+                print(f"[WARN] File not found for {year_month}")
+        sources = {year_month: path for year_month, path in sources.items() if year_month in months}
+
+    if not sources:
+        print(f"[WARN] No ledger files found ({source})")
+        return {}
+
+    print(f"[INFO] {len(sources)} months: {', '.join(sources)} (workers={workers})")
+
+    # 월 병렬 실행 시 파일 저장은 월별 순차 (워커 수 곱으로 스레드가 늘지 않도록)
+    config = {
+        'strategy': strategy,
+        'sources': sources,
+        'write_workers': None if workers <= 1 else 1,
+        'comparison': comparison,
+        'base_month': base_month,
+    }
+    return run_stages(STAGES, list(sources), config, workers=workers, process_stages=PROCESS_STAGES)
+
+def main(argv=None):
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='피벗 원장 데이터 처리 파이프라인')
+    parser.add_argument('--strategy', choices=sorted(HIERARCHY_STRATEGIES), default='v4',
+                        help='계층 파싱 방식 (기본 v4)')
+    parser.add_argument('--source', choices=['csv', 'excel'], default='csv',
+                        help='원본 종류 (csv: ledger/ledger_YYYYMM.csv, excel: YYMM원장.xlsx)')
+    parser.add_argument('--months', nargs='+', metavar='YYYYMM',
+                        help='처리할 연월 (기본: 탐색된 전체)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'월 병렬 처리 워커 수 (기본 {DEFAULT_WORKERS}, 1이면 순차)')
+    parser.add_argument('--compare', choices=COMPARISONS, default='yoy',
+                        help='통합 분석 비교 방식 (기본 yoy: 전년 동월)')
+    parser.add_argument('--base-month', metavar='YYYYMM',
+                        help='비교 기준월 (기본: 가장 최근 월)')
+    args = parser.parse_args(argv)
+
+    # 단계별 시간/메모리 기록 (.cache/run_reports/ledger_pipeline.run.jsonl)
+    start_run(report_file('ledger_pipeline'), 'ledger_pipeline',
+              strategy=args.strategy, source=args.source, workers=args.workers)
+
+    print(f"\n{'#'*60}")
+    print(f"# Pivot Ledger Data Processing ({args.strategy})")
+    print(f"{'#'*60}")
+
+    run_pipeline(args.strategy, args.source, args.months, args.workers, args.compare, args.base_month)
+    finish_run()
+
+    print(f"\n{'#'*60}")
+    print(f"# [COMPLETE] All processing finished!")
+    print(f"{'#'*60}")
+    print(f"\n[FOLDERS] Created directories:")
+    print(f"  - {COSTS_DIR.relative_to(BASE_DIR)}")
+    print(f"    * costs_YYYYMM.csv: Monthly cost data")
+    print(f"    * summary_*.csv: Summary files")
+    print(f"  - {GL_ANALYSIS_DIR.relative_to(BASE_DIR)}")
+    print(f"    * [Brand]/[Category]_YYYYMM.csv: Monthly data by category")
+    print(f"    * [Brand]/[Category]_combined.csv: Period comparison data (--compare)")
+
+if __name__ == '__main__':
+    main()
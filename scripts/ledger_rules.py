@@ -0,0 +1,130 @@
+"""
+원장 정제 규칙 모듈 (벡터화)
+- 코스트센터 타입 분류: 규칙 테이블(cctr_type_rules.csv)을 위에서부터 적용, 맞는 규칙이 없으면 '기타'
+  규칙 종류: prefix (코드 접두어), regex (코드 앞부분 정규식), exact (코드 일치)
+  테이블이 없으면 기본 규칙 (F → 부서, Z → 매장)
+- 금액 숫자 변환: 정규식으로 쉼표/공백/통화 기호 제거, (1,234) / 1,234- 음수 표기 처리
+- 행 단위 apply 대신 문자열 접근자(str.startswith, str.match)로 처리
+  고유 코드(범주 또는 factorize 결과)만 분류한 뒤 코드 번호로 펼침
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 코스트센터 타입 규칙 테이블 (match, pattern, cctr_type)
+CCTR_RULES_FILE = Path(__file__).parent / 'cctr_type_rules.csv'
+
+# 규칙 테이블이 없을 때 기본 규칙
+DEFAULT_CCTR_RULES = [
+    ('prefix', 'F', '부서'),
+    ('prefix', 'Z', '매장'),
+]
+
+# 어떤 규칙에도 맞지 않는 코스트센터 타입
+DEFAULT_CCTR_TYPE = '기타'
+
+MATCH_KINDS = ['prefix', 'regex', 'exact']
+
+# 금액 문자열에서 제거할 문자 (쉼표, 공백, 통화 기호)
+AMOUNT_STRIP_PATTERN = r'[,\s₩원]'
+
+
+@lru_cache(maxsize=None)
+def load_cctr_rules(rules_file=CCTR_RULES_FILE):
+    """
+    코스트센터 타입 규칙 로드 (파일이 없으면 DEFAULT_CCTR_RULES)
+
+    Returns:
+        [(match, pattern, cctr_type), ...] (적용 순서)
+    """
+    rules_file = Path(rules_file)
+    if not rules_file.exists():
+        return tuple(DEFAULT_CCTR_RULES)
+
+    table = pd.read_csv(rules_file, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    missing = {'match', 'pattern', 'cctr_type'} - set(table.columns)
+    if missing:
+        raise ValueError(f"Missing columns in {rules_file.name}: {sorted(missing)}")
+
+    rules = []
+    for row in table.itertuples(index=False):
+        match = row.match.strip().lower()
+        if match not in MATCH_KINDS:
+            raise ValueError(f"Unknown match kind in {rules_file.name}: {row.match} "
+                             f"(choose from {', '.join(MATCH_KINDS)})")
+        rules.append((match, row.pattern.strip(), row.cctr_type.strip()))
+    return tuple(rules)
+
+
+def _match_rule(codes, match, pattern):
+    if match == 'prefix':
+        return codes.str.startswith(pattern)
+    if match == 'regex':
+        return codes.str.match(pattern)
+    return codes == pattern
+
+
+def _classify_codes(codes, rules, default):
+    """문자열 코드 Series → 타입 배열 (첫 번째로 맞는 규칙)"""
+    if not rules:
+        return np.full(len(codes), default, dtype=object)
+    conditions = [_match_rule(codes, match, pattern).to_numpy(dtype=bool) for match, pattern, _ in rules]
+    labels = [cctr_type for _, _, cctr_type in rules]
+    return np.select(conditions, labels, default=default).astype(object)
+
+
+def classify_cost_centers(values, rules=None, default=DEFAULT_CCTR_TYPE):
+    """
+    코스트센터 코드 → 코스트센터 타입 (category)
+
+    Args:
+        values: 코스트센터 코드 Series (object 또는 category)
+        rules: [(match, pattern, cctr_type), ...] (None이면 load_cctr_rules())
+        default: 맞는 규칙이 없을 때 타입
+
+    결측 코드는 문자열 'nan'으로 분류 (기존 str(x).startswith 규칙과 동일)
+    """
+    rules = load_cctr_rules() if rules is None else rules
+
+    # 고유 코드만 분류한 뒤 코드 번호로 펼침 (category는 범주, 그 외는 factorize 결과 사용)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        positions, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        positions, uniques = pd.factorize(values)
+
+    # 마지막 항목 = 결측 (코드 번호 -1이 가리킴)
+    codes = pd.Series([str(code) for code in uniques] + ['nan'])
+    types = _classify_codes(codes, rules, default)[positions]
+
+    return pd.Series(pd.Categorical(types), index=values.index, name=values.name)
+
+
+def coerce_numeric(values):
+    """
+    금액 컬럼 → float64 (변환 불가/결측 → NaN)
+    - 쉼표, 공백, 통화 기호 제거
+    - (1,234) → -1234, 1,234- → -1234
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.to_numeric(values, errors='coerce').astype('float64')
+
+    text = values.astype(str).str.replace(AMOUNT_STRIP_PATTERN, '', regex=True)
+    text = text.str.replace(r'^\((.+)\)$', r'-\1', regex=True)
+    text = text.str.replace(r'^([^-].*)-$', r'-\1', regex=True)
+    return pd.to_numeric(text, errors='coerce').astype('float64')
+
+
+def coerce_amount(values, dtype='int64'):
+    """
+    금액 컬럼 정제 (변환 불가/결측 → 0)
+
+    Args:
+        dtype: 'int64' (반올림) 또는 'float64'
+    """
+    amounts = coerce_numeric(values).fillna(0)
+    if dtype == 'int64':
+        return amounts.round().astype('int64')
+    return amounts.astype(dtype)
@@ -0,0 +1,175 @@
+"""
+원장 데이터프레임 스키마 모듈
+- 원장 거래 데이터와 집계 비용 데이터(costs_YYYYMM.csv)의 컬럼 타입을 한 곳에서 정의
+- 반복되는 문자열 컬럼(브랜드, 코스트센터, GL계정, 카테고리, 연월) → category, 금액 → int64
+  groupby가 문자열 대신 범주 코드로 수행되고 (observed=True) 프레임 메모리가 수 배 줄어듦
+- 수집 시점(원장 캐시 생성, 파생 컬럼 추가, 비용 CSV 로드)에 한 번만 적용
+
+사용법:
+    python ledger_schema.py                               # public/data/*원장.xlsx 메모리 보고
+    python ledger_schema.py ../public/data/2410원장.xlsx
+"""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+from ledger_rules import coerce_amount
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'public' / 'data'
+
+# 금액 컬럼
+AMOUNT_COLUMN = '금액(현지 통화)'
+
+# 원장 거래 데이터 스키마 (없는 컬럼은 무시)
+LEDGER_SCHEMA = {
+    '사업 영역 내역': 'category',
+    '코스트 센터': 'category',
+    '코스트센터명': 'category',
+    'G/L 계정': 'category',
+    'G/L 계정 설명': 'category',
+    'CATEGORY_L1': 'category',
+    'CATEGORY_L2': 'category',
+    'CATEGORY_L3': 'category',
+    AMOUNT_COLUMN: 'int64',
+}
+
+# 원장 파생 컬럼 스키마 (process_* 스크립트에서 추가)
+DERIVED_SCHEMA = {
+    '코스트센터타입': 'category',
+    '연월': 'category',
+}
+
+# 집계 비용 데이터 스키마 (costs_YYYYMM.csv)
+COSTS_SCHEMA = {
+    'brand': 'category',
+    'category_l1': 'category',
+    'category_l2': 'category',
+    'category_l3': 'category',
+    'gl_account': 'category',
+    'amount': 'int64',
+    'year_month': 'category',
+}
+
+
+def to_category(values):
+    """반복 값 컬럼 → category (숫자/문자 혼합 object 컬럼은 문자열로 통일, 결측은 유지)"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values
+    if values.dtype == object:
+        values = values.where(values.isna(), values.astype(str))
+    return values.astype('category')
+
+
+def apply_schema(df, schema):
+    """
+    스키마의 컬럼 타입 적용 (원본은 변경하지 않음)
+
+    Args:
+        schema: {컬럼명: 'category' | 'int64'}
+    """
+    df = df.copy()
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        df[col] = to_category(df[col]) if dtype == 'category' else coerce_amount(df[col], dtype)
+    return df
+
+
+def apply_ledger_schema(df):
+    """
+    원장 데이터프레임 정규화
+    - 컬럼명 앞뒤 공백 제거
+    - LEDGER_SCHEMA, DERIVED_SCHEMA 컬럼 타입 적용
+    """
+    df = df.rename(columns=lambda col: col.strip() if isinstance(col, str) else col)
+    return apply_schema(df, {**LEDGER_SCHEMA, **DERIVED_SCHEMA})
+
+
+def read_costs_csv(file_path):
+    """costs_YYYYMM.csv 로드 (COSTS_SCHEMA 적용)"""
+    dtypes = {col: str for col, dtype in COSTS_SCHEMA.items() if dtype == 'category'}
+    df = pd.read_csv(file_path, encoding='utf-8-sig', dtype=dtypes)
+    return apply_schema(df, COSTS_SCHEMA)
+
+
+def concat_typed(frames):
+    """
+    같은 스키마의 프레임 연결 (category 컬럼은 범주 합집합으로 맞춰서 category 유지)
+    범주가 다른 category 컬럼을 그대로 concat하면 object로 풀리기 때문
+    """
+    frames = list(frames)
+    if not frames:
+        return pd.DataFrame()
+    aligned = [frame.copy() for frame in frames]
+    for col in frames[0].columns:
+        if not all(col in frame.columns and isinstance(frame[col].dtype, pd.CategoricalDtype) for frame in frames):
+            continue
+        categories = sorted(set().union(*(frame[col].cat.categories for frame in frames)))
+        for frame in aligned:
+            frame[col] = frame[col].cat.set_categories(categories)
+    return pd.concat(aligned, ignore_index=True)
+
+
+def untyped_frame(df):
+    """스키마 적용 전 형태 (범주 → object 문자열, 정수 금액 → float64)로 되돌린 복사본 (메모리 비교용)"""
+    df = df.copy()
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(object)
+        elif pd.api.types.is_integer_dtype(df[col]):
+            df[col] = df[col].astype('float64')
+    return df
+
+
+def frame_memory(df):
+    """데이터프레임 메모리 사용량 (bytes, 문자열 포함 deep)"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def memory_report(before, after, label=''):
+    """
+    스키마 적용 전/후 컬럼별 메모리 비교 출력
+
+    Returns:
+        (전 bytes, 후 bytes)
+    """
+    before_usage = before.memory_usage(deep=True, index=False)
+    after_usage = after.memory_usage(deep=True, index=False)
+
+    print(f"\n[MEMORY] {label}: {len(after):,} rows")
+    print(f"  {'column':<24} {'before':>12} {'after':>12} {'dtype':>10}")
+    for col in after.columns:
+        print(f"  {str(col):<24} {before_usage[col] / 1024 ** 2:>10.2f}MB "
+              f"{after_usage[col] / 1024 ** 2:>10.2f}MB {str(after[col].dtype):>10}")
+
+    before_total, after_total = int(before_usage.sum()), int(after_usage.sum())
+    ratio = before_total / after_total if after_total else 0
+    print(f"  {'TOTAL':<24} {before_total / 1024 ** 2:>10.2f}MB {after_total / 1024 ** 2:>10.2f}MB "
+          f"{ratio:>9.1f}x")
+    return before_total, after_total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='원장 데이터프레임 스키마 메모리 보고')
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='원장 Excel 파일 (기본: public/data/*원장.xlsx)')
+    args = parser.parse_args()
+
+    from ledger_cache import read_ledger_excel
+
+    files = args.files or sorted(DATA_DIR.glob('*원장.xlsx'))
+    if not files:
+        print(f"[WARN] No ledger files found in {DATA_DIR.relative_to(BASE_DIR)}")
+        return
+
+    for file_path in files:
+        typed = read_ledger_excel(file_path)
+        memory_report(untyped_frame(typed), typed, file_path.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+파티션 단위 CSV 저장 모듈
+- 데이터프레임을 키 조합(예: 브랜드 × GL계정)으로 한 번만 그룹화
+- 그룹별 CSV 인코딩/저장을 워커 풀에서 병렬 처리
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+import pandas as pd
+
+# 기본 워커 수 (파일 저장은 I/O 위주이므로 CPU 수보다 약간 많게)
+DEFAULT_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+
+def _write_csv(frame, output_file, encoding):
+    """그룹 하나를 CSV로 저장"""
+    frame.to_csv(output_file, index=False, encoding=encoding)
+    return len(frame)
+
+
+def write_partitions(df, by, path_for, max_workers=None, encoding='utf-8-sig'):
+    """
+    df를 by 컬럼 조합으로 한 번 그룹화하여 그룹별 CSV 파일로 저장
+
+    Args:
+        df: 원본 데이터프레임
+        by: 그룹 키 컬럼 목록 (첫 번째 컬럼 = 상위 폴더 단위)
+        path_for: 그룹 키 튜플 → 저장 경로 (None이면 저장하지 않음)
+        max_workers: CSV 저장 워커 수 (기본 DEFAULT_WORKERS, 1이면 순차 저장)
+        encoding: CSV 인코딩
+
+    Returns:
+        {그룹 키: 저장 경로} (저장된 그룹만, 첫 번째 키 등장 순서)
+
+    같은 경로로 정제되는 키가 여럿이면 기존 순차 루프와 동일하게
+    (첫 번째 키 등장 순서 → 그룹 등장 순서) 마지막 키의 데이터가 남는다.
+    """
+    by = list(by)
+    if df is None or df.empty:
+        return {}
+
+    # 키 조합 목록 (NaN 키 제외) - 첫 번째 키 기준으로 안정 정렬
+    keys = df[by].dropna().drop_duplicates()
+    first_key = keys[by[0]]
+    first_order = pd.Categorical(first_key, categories=first_key.unique()).codes
+    keys = keys.iloc[first_order.argsort(kind='stable')]
+
+    # 경로 결정 및 충돌 해소 (마지막 키 우선)
+    paths = {}
+    targets = {}
+    for key in keys.itertuples(index=False, name=None):
+        output_file = path_for(key)
+        if output_file is not None:
+            paths[key] = output_file
+            targets[output_file] = key
+
+    written = {key: output_file for key, output_file in paths.items() if targets[output_file] == key}
+    for output_dir in {output_file.parent for output_file in targets}:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    # 한 번의 groupby 패스로 그룹을 스트리밍하며 워커 풀에 저장 작업 제출
+    workers = max_workers or DEFAULT_WORKERS
+    grouped = df.groupby(by, sort=False, observed=True)
+    if workers <= 1:
+        for key, group in grouped:
+            if key in written:
+                _write_csv(group, written[key], encoding)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_write_csv, group, written[key], encoding)
+                for key, group in grouped
+                if key in written
+            ]
+            for future in futures:
+                future.result()
+
+    return written
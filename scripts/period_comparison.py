@@ -0,0 +1,161 @@
+"""
+기간 비교 모듈
+- 기준월과 비교 방식(YoY, MoM, 최근 12개월, YTD)으로 전기/당기 월 목록 결정
+- 필요한 월의 costs_YYYYMM.csv를 한 번 쌓아서(stack) 비교표는 단일 pivot으로,
+  [Brand]/[Key]_combined.csv 파일은 단일 groupby 패스로 생성
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from partitioned_writer import write_partitions
+
+# 연월 계산은 python_scripts 공용 모듈 사용
+sys.path.insert(0, str(Path(__file__).parent.parent / 'python_scripts'))
+from month_utils import month_range, shift_month  # noqa: E402
+
+# 비교 방식
+COMPARISONS = ['yoy', 'mom', 'rolling12', 'ytd']
+
+# 기간 레이블 (전기, 당기)
+PERIOD_LABELS = ['prior', 'current']
+
+# 비용 파일명 패턴 (예: costs_202410.csv → 202410)
+COSTS_FILE_PATTERN = re.compile(r'^costs_(\d{6})\.csv$')
+
+
+def comparison_periods(comparison, base_month):
+    """
+    비교 방식별 기간 정의
+
+    Args:
+        comparison: 'yoy' (전년 동월), 'mom' (전월), 'rolling12' (최근 12개월 vs 그 전 12개월),
+                    'ytd' (당해 1월~기준월 vs 전년 같은 기간)
+        base_month: 기준월 (YYYYMM)
+
+    Returns:
+        [('prior', 월 목록), ('current', 월 목록)]
+    """
+    base_month = str(base_month)
+    if comparison == 'yoy':
+        prior, current = [shift_month(base_month, -12)], [base_month]
+    elif comparison == 'mom':
+        prior, current = [shift_month(base_month, -1)], [base_month]
+    elif comparison == 'rolling12':
+        current = month_range(shift_month(base_month, -11), base_month)
+        prior = [shift_month(month, -12) for month in current]
+    elif comparison == 'ytd':
+        current = month_range(base_month[:4] + '01', base_month)
+        prior = [shift_month(month, -12) for month in current]
+    else:
+        raise ValueError(f"Unknown comparison: {comparison} (choose from {', '.join(COMPARISONS)})")
+    return list(zip(PERIOD_LABELS, [prior, current]))
+
+
+def available_months(costs_dir):
+    """costs_dir의 costs_YYYYMM.csv 연월 목록 (오름차순)"""
+    months = []
+    for file_path in Path(costs_dir).glob('costs_*.csv'):
+        match = COSTS_FILE_PATTERN.match(file_path.name)
+        if match:
+            months.append(match.group(1))
+    return sorted(months)
+
+
+def load_costs(costs_dir, months):
+    """
+    월별 비용 파일을 월 순서로 쌓은 데이터프레임 (없는 월은 제외)
+
+    Returns:
+        (데이터프레임 또는 None, 로드한 월 목록)
+    """
+    frames = []
+    loaded = []
+    for month in sorted(set(months)):
+        file_path = Path(costs_dir) / f'costs_{month}.csv'
+        if file_path.exists():
+            frames.append(pd.read_csv(file_path, encoding='utf-8-sig'))
+            loaded.append(month)
+    if not frames:
+        return None, loaded
+    return pd.concat(frames, ignore_index=True), loaded
+
+
+def compare_periods(stacked, periods, keys):
+    """
+    키별 전기/당기 금액 비교표 (단일 pivot = 두 기간의 outer join)
+
+    Returns:
+        keys + prior, current, change, change_percent 컬럼 (한쪽 기간에만 있는 키는 0으로 채움)
+    """
+    period_of = {month: label for label, months in periods for month in months}
+    labeled = stacked.assign(period=stacked['year_month'].astype(str).map(period_of))
+    labeled = labeled[labeled['period'].notna()]
+
+    table = labeled.pivot_table(index=keys, columns='period', values='amount',
+                                aggfunc='sum', fill_value=0)
+    table = table.reindex(columns=PERIOD_LABELS, fill_value=0).reset_index()
+    table.columns.name = None
+
+    table['change'] = table['current'] - table['prior']
+    prior = table['prior'].where(table['prior'] > 0)
+    table['change_percent'] = (table['change'] / prior * 100).round(1).fillna(0)
+    return table
+
+
+def create_comparison(costs_dir, keys, path_for, comparison='yoy', base_month=None, max_workers=None):
+    """
+    기간 비교 파일 생성
+
+    - [Brand]/[Key]_combined.csv: 비교 대상 월의 원본 행 (월 순서, path_for로 경로 결정)
+    - costs_dir/comparison_{비교 방식}_{기준월}.csv: 키별 전기/당기 비교표
+
+    Args:
+        costs_dir: costs_YYYYMM.csv 폴더
+        keys: 비교 키 컬럼 (첫 번째 = 브랜드, 예: ['brand', 'gl_account'])
+        path_for: 키 튜플 → combined 파일 경로 (None이면 저장하지 않음)
+        comparison: COMPARISONS 중 하나
+        base_month: 기준월 (None이면 가장 최근 월)
+
+    Returns:
+        {키: combined 파일 경로} (비교할 데이터가 없으면 빈 dict)
+    """
+    costs_dir = Path(costs_dir)
+    months = available_months(costs_dir)
+    if not months:
+        print("  [WARN] No cost data found")
+        return {}
+
+    base_month = str(base_month or months[-1])
+    periods = comparison_periods(comparison, base_month)
+    print(f"  [PERIOD] {comparison} @ {base_month}: "
+          + ' vs '.join(f"{label} {period[0]}~{period[-1]}" for label, period in periods))
+
+    stacked, loaded = load_costs(costs_dir, [month for _, period in periods for month in period])
+    for label, period in periods:
+        missing = [month for month in period if month not in loaded]
+        if len(missing) == len(period):
+            print(f"  [WARN] No {label} period data ({period[0]}~{period[-1]}) for comparison")
+            return {}
+        if missing:
+            print(f"  [WARN] Missing {label} months: {', '.join(missing)}")
+
+    # 키 순서로 안정 정렬 (키 안에서는 월 순서 유지) 후 단일 패스로 저장
+    stacked = stacked.sort_values(keys, kind='stable', key=lambda column: column.astype(str))
+    written = write_partitions(stacked, keys, path_for, max_workers=max_workers)
+
+    table = compare_periods(stacked, periods, keys)
+    table_file = costs_dir / f'comparison_{comparison}_{base_month}.csv'
+    table.to_csv(table_file, index=False, encoding='utf-8-sig')
+    print(f"  [OK] Saved: {table_file.name} ({len(table):,} keys)")
+
+    counts = {}
+    for key in written:
+        counts[key[0]] = counts.get(key[0], 0) + 1
+    for brand, count in counts.items():
+        print(f"  [OK] {brand}: {count} combined")
+
+    return written
@@ -10,6 +10,11 @@ import os
 from pathlib import Path
 import numpy as np
 
+from ledger_cache import read_ledger_excel
+from ledger_rules import classify_cost_centers
+from ledger_schema import DERIVED_SCHEMA, apply_schema
+from partitioned_writer import write_partitions
+
 # 경로 설정
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / 'public' / 'data'
@@ -20,15 +25,6 @@ GL_ACCOUNT_DIR = DATA_DIR / 'gl_accounts'
 LEDGER_DIR.mkdir(exist_ok=True)
 GL_ACCOUNT_DIR.mkdir(exist_ok=True)
 
-def clean_amount(value):
-    """금액 데이터 정제 (쉼표 제거 및 숫자 변환)"""
-    if pd.isna(value):
-        return 0
-    if isinstance(value, (int, float)):
-        return float(value)
-    # 문자열인 경우 쉼표 제거
-    return float(str(value).replace(',', '').replace(' ', ''))
-
 def process_excel_to_csv(excel_file, year_month):
     """
     Excel 파일을 읽어서 기본 CSV로 변환
@@ -41,25 +37,24 @@ def process_excel_to_csv(excel_file, year_month):
     print(f"[FILE] Processing: {excel_file.name} ({year_month})")
     print(f"{'='*60}")
     
-    # Excel 파일 읽기
-    df = pd.read_excel(excel_file)
+    # Excel 파일 읽기 (컬럼형 캐시 우선)
+    df = read_ledger_excel(excel_file)
     
     print(f"[OK] Loaded data: {len(df)} rows")
     print(f"     Columns: {list(df.columns)}")
     
-    # 금액 컬럼 정제
-    if '금액(현지 통화)' in df.columns:
-        df['금액(현지 통화)'] = df['금액(현지 통화)'].apply(clean_amount)
+    # 금액 컬럼은 캐시 로드 시 스키마에서 int64로 정제됨 (ledger_schema)
     
-    # 코스트센터 타입 추가 (F: 부서, Z: 매장)
+    # 코스트센터 타입 추가 (규칙 테이블: F → 부서, Z → 매장, 그 외 기타)
     if '코스트 센터' in df.columns:
-        df['코스트센터타입'] = df['코스트 센터'].apply(
-            lambda x: '부서' if str(x).startswith('F') else ('매장' if str(x).startswith('Z') else '기타')
-        )
+        df['코스트센터타입'] = classify_cost_centers(df['코스트 센터'])
     
     # 연월 컬럼 추가
     df['연월'] = year_month
     
+    # 파생 컬럼도 범주형으로
+    df = apply_schema(df, DERIVED_SCHEMA)
+    
     # 기본 CSV 저장
     output_file = LEDGER_DIR / f'ledger_{year_month}.csv'
     df.to_csv(output_file, index=False, encoding='utf-8-sig')
@@ -91,7 +86,7 @@ def create_pivot_table(df, year_month):
         'CATEGORY_L1',
         'CATEGORY_L2',
         'CATEGORY_L3'
-    ]).agg({
+    ], observed=True).agg({
         '금액(현지 통화)': 'sum'
     }).reset_index()
     
@@ -108,10 +103,11 @@ def create_pivot_table(df, year_month):
     
     return pivot_df
 
-def create_gl_account_data(df, year_month):
+def create_gl_account_data(df, year_month, max_workers=None):
     """
     OpenAI 분석용 GL계정별 데이터 생성
     사업부별 폴더 생성 및 GL계정별 CSV 파일 생성
+    (사업부 × GL계정 단일 groupby 패스 + 병렬 저장)
     """
     print(f"\n[GL] Creating GL account data...")
     
@@ -120,46 +116,29 @@ def create_gl_account_data(df, year_month):
         print("[WARN] Missing required columns: GL Account or Business Area")
         return
     
-    # 사업부별로 그룹화
-    business_areas = df['사업 영역 내역'].dropna().unique()
-    
-    for business_area in business_areas:
-        if pd.isna(business_area) or business_area == '':
-            continue
-            
-        # 사업부명 정제 (폴더명으로 사용 가능하게)
-        safe_business_name = str(business_area).replace('/', '_').replace('\\', '_').strip()
-        
-        # 사업부 폴더 생성
-        business_dir = GL_ACCOUNT_DIR / safe_business_name
-        business_dir.mkdir(exist_ok=True)
+    def gl_output_file(key):
+        business_area, gl_account = key
+        if business_area == '' or gl_account == '':
+            return None
         
-        # 해당 사업부 데이터 필터링
-        business_df = df[df['사업 영역 내역'] == business_area].copy()
-        
-        # GL계정별로 그룹화
-        gl_accounts = business_df['G/L 계정 설명'].dropna().unique()
-        
-        print(f"\n  [DIR] {safe_business_name}: {len(gl_accounts)} GL accounts")
-        
-        for gl_account in gl_accounts:
-            if pd.isna(gl_account) or gl_account == '':
-                continue
-                
-            # GL계정명 정제
-            safe_gl_name = str(gl_account).replace('/', '_').replace('\\', '_').strip()
-            
-            # 해당 GL계정 데이터 필터링
-            gl_df = business_df[business_df['G/L 계정 설명'] == gl_account].copy()
-            
-            # 연월 추가
-            gl_df['연월'] = year_month
-            
-            # 파일명: GL계정명_연월.csv
-            output_file = business_dir / f'{safe_gl_name}_{year_month}.csv'
-            gl_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        # 사업부명/GL계정명 정제 (폴더명/파일명으로 사용 가능하게)
+        safe_business_name = str(business_area).replace('/', '_').replace('\\', '_').strip()
+        safe_gl_name = str(gl_account).replace('/', '_').replace('\\', '_').strip()
         
-        print(f"  [OK] Created {len(gl_accounts)} GL account files")
+        # 파일명: 사업부/GL계정명_연월.csv
+        return GL_ACCOUNT_DIR / safe_business_name / f'{safe_gl_name}_{year_month}.csv'
+    
+    # 연월 추가 후 사업부 × GL계정별 저장
+    written = write_partitions(df.assign(**{'연월': year_month}),
+                               ['사업 영역 내역', 'G/L 계정 설명'], gl_output_file,
+                               max_workers=max_workers)
+    
+    gl_counts = {}
+    for output_file in written.values():
+        gl_counts[output_file.parent.name] = gl_counts.get(output_file.parent.name, 0) + 1
+    for safe_business_name, gl_count in gl_counts.items():
+        print(f"\n  [DIR] {safe_business_name}: {gl_count} GL accounts")
+        print(f"  [OK] Created {gl_count} GL account files")
 
 def create_summary_report(all_data):
     """전체 데이터 요약 보고서 생성"""
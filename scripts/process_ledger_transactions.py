@@ -4,30 +4,67 @@
 - OpenAI 분석용 데이터 생성
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import contextlib
+import io
+import sys
 import pandas as pd
 from pathlib import Path
 import numpy as np
 
+from drilldown_index import INDEX_FILE as DRILLDOWN_INDEX_FILE, build_drilldown_index
+from gl_store import legacy_gl_file, write_month
+from ledger_cache import read_ledger_excel
+from ledger_rules import classify_cost_centers
+from ledger_schema import DERIVED_SCHEMA, apply_schema, frame_memory
+from ledger_manifest import (discover_ledger_files, is_month_current, load_manifest,
+                             record_month, save_manifest)
+from partitioned_writer import write_partitions
+from period_comparison import COMPARISONS, create_comparison
+from summary_cube import ROLLUPS, build_summaries
+
 # 경로 설정
 BASE_DIR = Path(__file__).parent.parent
+
+# python_scripts 공용 모듈 (실행 보고서)
+sys.path.insert(0, str(BASE_DIR / 'python_scripts'))
+from run_report import count_rows, finish_run, report_file, span, start_run  # noqa: E402
+
 DATA_DIR = BASE_DIR / 'public' / 'data'
 LEDGER_RAW_DIR = DATA_DIR / 'ledger_raw'
 COSTS_DIR = DATA_DIR / 'costs'
 GL_ANALYSIS_DIR = DATA_DIR / 'gl_analysis'
+# 처리 매니페스트는 웹으로 제공되지 않는 캐시 폴더에 저장 (public/data 아래 두지 않음)
+MANIFEST_FILE = BASE_DIR / '.cache' / 'ledger_manifest.json'
+LEGACY_MANIFEST_FILE = LEDGER_RAW_DIR / 'manifest.json'
 
 # 디렉토리 생성
 LEDGER_RAW_DIR.mkdir(exist_ok=True)
 COSTS_DIR.mkdir(exist_ok=True)
 GL_ANALYSIS_DIR.mkdir(exist_ok=True)
 
+def remove_output(path):
+    """
+    출력 파일 삭제 후 비게 된 상위 폴더도 삭제 (gl_analysis/[Brand], gl_store 파티션 폴더 등)
+    (public/data 바로 아래 출력 폴더는 유지)
+    """
+    path.unlink(missing_ok=True)
+    parent = path.parent
+    while parent.parent != DATA_DIR and DATA_DIR in parent.parents and not any(parent.iterdir()):
+        parent.rmdir()
+        parent = parent.parent
+
 def process_ledger_file(file_path, year_month):
     """원장 파일 처리"""
     print(f"\n{'='*60}")
     print(f"[FILE] Processing: {file_path.name}")
     print(f"{'='*60}")
     
-    # Excel 파일 읽기
-    df = pd.read_excel(file_path)
+    # Excel 파일 읽기 (컬럼형 캐시 우선)
+    with span('load_excel', year_month=year_month, file=file_path.name) as record:
+        df = read_ledger_excel(file_path)
+        record['rows_out'] = len(df)
     
     print(f"[OK] Loaded {len(df):,} transactions")
     print(f"     Columns: {len(df.columns)}")
@@ -44,18 +81,26 @@ def process_ledger_file(file_path, year_month):
         print(f"[ERROR] Missing columns: {missing_cols}")
         return None
     
-    # 연월 추가
-    df['연월'] = year_month
-    
-    # 코스트센터 타입 추가 (F: 부서, Z: 매장)
-    if '코스트 센터' in df.columns:
-        df['코스트센터타입'] = df['코스트 센터'].apply(
-            lambda x: '부서' if str(x).startswith('F') else ('매장' if str(x).startswith('Z') else '기타')
-        )
+    with span('classify', year_month=year_month) as record:
+        record['rows_in'] = len(df)
+        
+        # 연월 추가
+        df['연월'] = year_month
+        
+        # 코스트센터 타입 추가 (규칙 테이블: F → 부서, Z → 매장, 그 외 기타)
+        if '코스트 센터' in df.columns:
+            df['코스트센터타입'] = classify_cost_centers(df['코스트 센터'])
+        
+        # 파생 컬럼도 범주형으로 (이후 groupby는 범주 코드 기준)
+        df = apply_schema(df, DERIVED_SCHEMA)
+        record['rows_out'] = len(df)
+    print(f"[MEMORY] {frame_memory(df) / 1024 ** 2:,.2f} MB in memory (categorical schema)")
     
     # Raw CSV 저장
     output_file = LEDGER_RAW_DIR / f'transactions_{year_month}.csv'
-    df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    with span('write_raw', year_month=year_month) as record:
+        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        record['rows_in'] = record['rows_out'] = len(df)
     print(f"[OK] Saved raw data: {output_file.name}")
     
     # 통계 출력
@@ -67,7 +112,7 @@ def process_ledger_file(file_path, year_month):
     
     # 사업 영역별 통계
     print(f"\n[STATS] By Business Area:")
-    business_summary = df.groupby('사업 영역 내역')['금액(현지 통화)'].agg(['sum', 'count'])
+    business_summary = df.groupby('사업 영역 내역', observed=True)['금액(현지 통화)'].agg(['sum', 'count'])
     business_summary = business_summary.sort_values('sum', ascending=False)
     for idx, row in business_summary.head(10).iterrows():
         print(f"  - {idx}: {row['sum']:,.0f} KRW ({row['count']:,} txns)")
@@ -81,227 +126,238 @@ def create_aggregated_costs(df, year_month):
     if df is None or df.empty:
         return None
     
-    # 브랜드별, 카테고리별 집계
-    agg_df = df.groupby([
-        '사업 영역 내역',
-        'CATEGORY_L1',
-        'CATEGORY_L2',
-        'CATEGORY_L3',
-        'G/L 계정 설명'
-    ]).agg({
-        '금액(현지 통화)': 'sum'
-    }).reset_index()
-    
-    agg_df.columns = ['brand', 'category_l1', 'category_l2', 'category_l3', 
-                      'gl_account', 'amount']
-    agg_df['year_month'] = year_month
-    
-    # 빈 값 처리
-    agg_df = agg_df.fillna('')
+    with span('aggregate_costs', year_month=year_month) as record:
+        record['rows_in'] = len(df)
+        
+        # 브랜드별, 카테고리별 집계
+        agg_df = df.groupby([
+            '사업 영역 내역',
+            'CATEGORY_L1',
+            'CATEGORY_L2',
+            'CATEGORY_L3',
+            'G/L 계정 설명'
+        ], observed=True).agg({
+            '금액(현지 통화)': 'sum'
+        }).reset_index()
+        
+        agg_df.columns = ['brand', 'category_l1', 'category_l2', 'category_l3', 
+                          'gl_account', 'amount']
+        agg_df['year_month'] = year_month
+        
+        # 빈 값 처리 (범주형 키 컬럼은 문자열로 변환)
+        key_cols = ['brand', 'category_l1', 'category_l2', 'category_l3', 'gl_account']
+        agg_df = agg_df.astype({col: object for col in key_cols}).fillna('')
+        record['rows_out'] = len(agg_df)
     
     # 저장
     output_file = COSTS_DIR / f'costs_{year_month}.csv'
-    agg_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    with span('write_costs', year_month=year_month) as record:
+        agg_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        record['rows_in'] = record['rows_out'] = len(agg_df)
     print(f"[OK] Saved aggregated data: {output_file.name}")
     print(f"     Total rows: {len(agg_df):,}")
     
     return agg_df
 
-def create_brand_gl_analysis(df, year_month):
+def create_brand_gl_analysis(df, year_month, max_workers=None):
     """브랜드별 GL계정 분석 데이터 생성"""
     print(f"\n[ANALYSIS] Creating brand GL analysis data...")
     
     if df is None or df.empty:
-        return
+        return []
     
-    brands = df['사업 영역 내역'].dropna().unique()
+    def gl_output_file(key):
+        return legacy_gl_file(GL_ANALYSIS_DIR, key[0], key[1], year_month)
     
-    for brand in brands:
-        if not brand or brand == '':
-            continue
-        
-        # 브랜드 폴더 생성
-        safe_brand_name = str(brand).replace('/', '_').replace('\\', '_').strip()
-        brand_dir = GL_ANALYSIS_DIR / safe_brand_name
-        brand_dir.mkdir(exist_ok=True)
-        
-        # 해당 브랜드 데이터
-        brand_df = df[df['사업 영역 내역'] == brand].copy()
-        
-        # GL계정별로 파일 생성
-        gl_accounts = brand_df['G/L 계정 설명'].dropna().unique()
-        
-        for gl_account in gl_accounts:
-            if not gl_account or gl_account == '':
-                continue
-            
-            gl_df = brand_df[brand_df['G/L 계정 설명'] == gl_account].copy()
-            
-            # 파일명 정제
-            safe_gl_name = str(gl_account).replace('/', '_').replace('\\', '_').replace(':', '').replace('(', '').replace(')', '').strip()
-            safe_gl_name = safe_gl_name[:100]  # 파일명 길이 제한
-            
-            output_file = brand_dir / f'{safe_gl_name}_{year_month}.csv'
-            gl_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-        
-        print(f"  [OK] {safe_brand_name}: {len(gl_accounts)} GL accounts")
+    # (브랜드, GL계정) 단일 groupby 패스로 파일 저장
+    with span('write_gl_analysis', year_month=year_month) as record:
+        written = write_partitions(df, ['사업 영역 내역', 'G/L 계정 설명'], gl_output_file,
+                                   max_workers=max_workers)
+        record.update(rows_in=len(df), files=len(written))
+    
+    gl_counts = {}
+    for output_file in written.values():
+        gl_counts[output_file.parent.name] = gl_counts.get(output_file.parent.name, 0) + 1
+    for safe_brand_name, gl_count in gl_counts.items():
+        print(f"  [OK] {safe_brand_name}: {gl_count} GL accounts")
+    
+    return list(written.values())
 
-def create_combined_analysis():
-    """전년/당년 통합 분석 파일 생성"""
+def create_combined_analysis(comparison='yoy', base_month=None, write_files=True):
+    """
+    기간 비교 통합 분석 파일 생성 (기본: 가장 최근 월 vs 전년 동월)
+    브랜드 × GL계정별로 비교 대상 월의 행을 [Brand]/[GL_Account]_combined.csv에 저장
+    (write_files=False면 비교표만 저장하고 이전 실행의 combined 파일은 삭제,
+     combined 파일은 gl_store.py --export --combined로 생성)
+    """
     print(f"\n[COMBINE] Creating combined analysis files...")
     
-    # 두 연월의 데이터 로드
-    files = {
-        '202410': COSTS_DIR / 'costs_202410.csv',
-        '202510': COSTS_DIR / 'costs_202510.csv'
-    }
-    
-    dfs = {}
-    for year_month, file_path in files.items():
-        if file_path.exists():
-            dfs[year_month] = pd.read_csv(file_path, encoding='utf-8-sig')
-            print(f"  [LOAD] {year_month}: {len(dfs[year_month]):,} rows")
-    
-    if len(dfs) < 2:
-        print("  [WARN] Need both 202410 and 202510 data for comparison")
-        return
-    
-    # 브랜드별로 통합
-    all_brands = set()
-    for df in dfs.values():
-        all_brands.update(df['brand'].unique())
-    
-    for brand in sorted(all_brands):
-        if not brand:
-            continue
-        
-        safe_brand_name = str(brand).replace('/', '_').replace('\\', '_').strip()
-        brand_dir = GL_ANALYSIS_DIR / safe_brand_name
-        brand_dir.mkdir(exist_ok=True)
-        
-        # 각 GL계정별로 통합
-        all_gl_accounts = set()
-        for df in dfs.values():
-            brand_df = df[df['brand'] == brand]
-            all_gl_accounts.update(brand_df['gl_account'].unique())
-        
-        combined_count = 0
-        for gl_account in sorted(all_gl_accounts):
-            if not gl_account:
-                continue
-            
-            combined_rows = []
-            for year_month, df in dfs.items():
-                gl_df = df[(df['brand'] == brand) & (df['gl_account'] == gl_account)]
-                if not gl_df.empty:
-                    combined_rows.append(gl_df)
-            
-            if combined_rows:
-                combined_df = pd.concat(combined_rows, ignore_index=True)
-                safe_gl_name = str(gl_account).replace('/', '_').replace('\\', '_').replace(':', '').replace('(', '').replace(')', '').strip()
-                safe_gl_name = safe_gl_name[:100]
-                
-                output_file = brand_dir / f'{safe_gl_name}_combined.csv'
-                combined_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-                combined_count += 1
-        
-        print(f"  [OK] {safe_brand_name}: {combined_count} GL accounts combined")
+    if not write_files:
+        # 이전 비교 기간의 파일이 남아 있으면 API가 기존 파일로 대체 조회할 때 그대로 제공되므로 삭제
+        stale_files = list(GL_ANALYSIS_DIR.glob('*/*_combined.csv'))
+        for stale_file in stale_files:
+            remove_output(stale_file)
+        if stale_files:
+            print(f"[OK] Removed {len(stale_files)} stale combined files")
+    
+    def combined_output_file(key):
+        if not write_files:
+            return None
+        return legacy_gl_file(GL_ANALYSIS_DIR, key[0], key[1], 'combined')
+    
+    with span('combined', comparison=comparison) as record:
+        result = create_comparison(COSTS_DIR, ['brand', 'gl_account'], combined_output_file,
+                                   comparison=comparison, base_month=base_month)
+        record['files'] = len(result)
+    return result
 
 def create_summary_reports():
-    """요약 보고서 생성"""
+    """요약 보고서 생성 (요약 큐브에서 변경된 월만 다시 집계)"""
     print(f"\n[SUMMARY] Creating summary reports...")
+    with span('summary') as record:
+        cube = build_summaries(COSTS_DIR, ROLLUPS,
+                               count_columns=[('Brands', 'brand'), ('GL Accounts', 'gl_account'),
+                                              ('L1 Categories', 'category_l1')])
+        record['rows_out'] = count_rows(cube)
+
+def process_month(file_path, year_month, max_workers=None, layout='csv'):
+    """
+    한 달 처리 (원장 로드 → 집계 → GL계정 분석 데이터 저장)
+
+    Args:
+        layout: 'csv' (gl_analysis/[Brand]/[GL_Account]_YYYYMM.csv) 또는
+                'store' (gl_store 브랜드/연월 파티션 + 인덱스)
+
+    Returns:
+        (거래 행 수, 출력 파일 목록), 필수 컬럼이 없으면 None
+        (프로세스 풀에서 실행되므로 데이터프레임 대신 결과 요약만 반환)
+    """
+    # 1. 원장 파일 처리
+    df = process_ledger_file(file_path, year_month)
+    if df is None:
+        return None
     
-    # 모든 비용 데이터 로드
-    all_data = []
-    for file in COSTS_DIR.glob('costs_*.csv'):
-        df = pd.read_csv(file, encoding='utf-8-sig')
-        all_data.append(df)
-    
-    if not all_data:
-        print("  [WARN] No cost data found")
-        return
-    
-    combined = pd.concat(all_data, ignore_index=True)
-    
-    # 1. 브랜드별 월별 합계
-    brand_monthly = combined.groupby(['brand', 'year_month']).agg({
-        'amount': 'sum'
-    }).reset_index()
-    
-    brand_monthly_file = COSTS_DIR / 'summary_by_brand_month.csv'
-    brand_monthly.to_csv(brand_monthly_file, index=False, encoding='utf-8-sig')
-    print(f"  [OK] Saved: {brand_monthly_file.name}")
-    
-    # 2. 브랜드별, 카테고리별 합계
-    brand_category = combined.groupby(['brand', 'year_month', 'category_l1']).agg({
-        'amount': 'sum'
-    }).reset_index()
-    
-    brand_category_file = COSTS_DIR / 'summary_by_brand_category.csv'
-    brand_category.to_csv(brand_category_file, index=False, encoding='utf-8-sig')
-    print(f"  [OK] Saved: {brand_category_file.name}")
-    
-    # 3. GL계정별 합계
-    gl_summary = combined.groupby(['brand', 'year_month', 'gl_account']).agg({
-        'amount': 'sum'
-    }).reset_index()
-    
-    gl_summary_file = COSTS_DIR / 'summary_by_gl_account.csv'
-    gl_summary.to_csv(gl_summary_file, index=False, encoding='utf-8-sig')
-    print(f"  [OK] Saved: {gl_summary_file.name}")
-    
-    # 전체 통계
-    print(f"\n{'='*60}")
-    print("[SUMMARY] Overall Statistics")
-    print(f"{'='*60}")
-    
-    for year_month in sorted(combined['year_month'].unique()):
-        ym_data = combined[combined['year_month'] == year_month]
-        total = ym_data['amount'].sum()
-        print(f"\n{year_month}:")
-        print(f"  Total Amount: {total:,.0f} KRW")
-        print(f"  Brands: {len(ym_data['brand'].unique())}")
-        print(f"  GL Accounts: {len(ym_data['gl_account'].unique())}")
-        print(f"  L1 Categories: {len(ym_data['category_l1'].unique())}")
-        print(f"  Data Rows: {len(ym_data):,}")
+    # 2. 집계 데이터 생성
+    create_aggregated_costs(df, year_month)
+    
+    # 3. 브랜드별 GL계정 분석 데이터 생성
+    if layout == 'store':
+        print(f"\n[STORE] Writing GL analysis partitions...")
+        with span('write_gl_store', year_month=year_month) as record:
+            gl_files = write_month(df, year_month)
+            record.update(rows_in=len(df), files=len(gl_files))
+    else:
+        gl_files = create_brand_gl_analysis(df, year_month, max_workers=max_workers)
+    
+    outputs = [LEDGER_RAW_DIR / f'transactions_{year_month}.csv',
+               COSTS_DIR / f'costs_{year_month}.csv'] + gl_files
+    return len(df), outputs
+
+def _process_month_in_worker(file_path, year_month, layout):
+    """프로세스 풀 워커: 월 처리 로그를 모아서 반환 (여러 월 출력이 섞이지 않도록)"""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        # 워커마다 프로세스가 따로 있으므로 파일 저장은 순차
+        result = process_month(file_path, year_month, max_workers=1, layout=layout)
+    return result, log.getvalue()
+
+def process_months(months, workers=1, layout='csv'):
+    """
+    월 목록 처리 → {연월: process_month 결과}
+
+    workers > 1이면 월 단위로 프로세스 풀에 분배 (Excel 파싱/집계는 CPU 위주라 스레드로는 병렬화되지 않음)
+    월별 로그는 완료된 순서대로 한 번에 출력
+    """
+    if workers <= 1 or len(months) <= 1:
+        return {year_month: process_month(file_path, year_month, layout=layout) for file_path, year_month in months}
+    
+    print(f"\n[PARALLEL] Processing {len(months)} months with {min(workers, len(months))} worker processes")
+    results = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(months))) as executor:
+        futures = {executor.submit(_process_month_in_worker, file_path, year_month, layout): year_month
+                   for file_path, year_month in months}
+        for future in as_completed(futures):
+            result, log = future.result()
+            print(log, end='', flush=True)
+            results[futures[future]] = result
+    return results
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='원장 거래 데이터 처리')
+    parser.add_argument('--force', action='store_true',
+                        help='매니페스트를 무시하고 모든 월을 다시 처리')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='월 병렬 처리 프로세스 수 (기본 1: 순차 처리)')
+    parser.add_argument('--layout', choices=['csv', 'store'], default='csv',
+                        help='GL계정 분석 데이터 저장 방식 (csv: 브랜드 × GL계정별 CSV, store: gl_store 파티션)')
+    parser.add_argument('--compare', choices=COMPARISONS,
+                        help='통합 분석 비교 방식 (기본 yoy: 전년 동월)')
+    parser.add_argument('--base-month', metavar='YYYYMM',
+                        help='비교 기준월 (기본: 가장 최근 월)')
+    args = parser.parse_args()
+    
+    # 단계별 시간/메모리 기록 (.cache/run_reports/process_ledger_transactions.run.jsonl)
+    start_run(report_file('process_ledger_transactions'), 'process_ledger_transactions',
+              workers=args.workers, layout=args.layout)
+    
     print(f"\n{'#'*60}")
     print(f"# Ledger Transaction Data Processing")
     print(f"{'#'*60}")
     
-    # 처리할 파일 목록
-    files_to_process = [
-        ('2410원장.xlsx', '202410'),
-        ('2510원장.xlsx', '202510')
-    ]
+    # 처리할 파일 목록 (data 폴더의 YYMM원장.xlsx)
+    files_to_process = discover_ledger_files(DATA_DIR)
+    if not files_to_process:
+        print(f"[WARN] No ledger files (YYMM원장.xlsx) found in {DATA_DIR.relative_to(BASE_DIR)}")
     
-    all_data = {}
+    # 이전 위치(public/data/ledger_raw)의 매니페스트는 한 번 옮겨 온 뒤 삭제
+    manifest = load_manifest(MANIFEST_FILE if MANIFEST_FILE.exists() else LEGACY_MANIFEST_FILE)
     
+    # 원본이 바뀌지 않은 월은 건너뛰기
+    months = []
     for filename, year_month in files_to_process:
         file_path = DATA_DIR / filename
-        
-        if not file_path.exists():
-            print(f"[WARN] File not found: {filename}")
+        if not args.force and is_month_current(manifest, year_month, file_path, BASE_DIR, args.layout):
+            print(f"\n[SKIP] {filename}: unchanged since last run")
+            continue
+        months.append((file_path, year_month))
+    
+    # 1~3. 월별 처리 (원장 로드, 집계, GL계정 분석)
+    results = process_months(months, args.workers, args.layout)
+    
+    # 4. 매니페스트 기록 및 더 이상 생성되지 않는 출력 정리 (연월 순서)
+    for file_path, year_month in months:
+        result = results[year_month]
+        if result is None:
             continue
+        rows, outputs = result
+        stale_outputs = record_month(manifest, year_month, file_path, rows, outputs, BASE_DIR, args.layout)
+        for stale_output in stale_outputs:
+            remove_output(BASE_DIR / stale_output)
+        if stale_outputs:
+            print(f"[OK] Removed {len(stale_outputs)} stale output files ({year_month})")
+    
+    save_manifest(manifest, MANIFEST_FILE)
+    LEGACY_MANIFEST_FILE.unlink(missing_ok=True)
+    
+    # 새로 처리한 월이 없고 비교 조건도 기본값이면 기존 결과 유지
+    comparison_requested = args.compare is not None or args.base_month is not None
+    outputs_exist = (COSTS_DIR / 'summary_by_brand_month.csv').exists() and DRILLDOWN_INDEX_FILE.exists()
+    if not months and not comparison_requested and outputs_exist:
+        print(f"\n[SKIP] All months up to date - combined/summary files unchanged")
+    else:
+        # 5. 통합 분석 파일 생성
+        create_combined_analysis(args.compare or 'yoy', args.base_month, write_files=args.layout == 'csv')
         
-        # 1. 원장 파일 처리
-        df = process_ledger_file(file_path, year_month)
-        all_data[year_month] = df
+        # 6. 드릴다운 인덱스 생성 (브랜드 × GL계정 × 연월 → drilldown.csv 바이트 구간)
+        print(f"\n[DRILLDOWN] Building drilldown index...")
+        with span('drilldown_index'):
+            build_drilldown_index(COSTS_DIR, comparison=args.compare or 'yoy', base_month=args.base_month)
         
-        # 2. 집계 데이터 생성
-        if df is not None:
-            agg_df = create_aggregated_costs(df, year_month)
-            
-            # 3. 브랜드별 GL계정 분석 데이터 생성
-            create_brand_gl_analysis(df, year_month)
-    
-    # 4. 통합 분석 파일 생성
-    create_combined_analysis()
+        # 7. 요약 보고서 생성
+        create_summary_reports()
     
-    # 5. 요약 보고서 생성
-    create_summary_reports()
+    finish_run()
     
     print(f"\n{'#'*60}")
     print(f"# [COMPLETE] All processing finished!")
@@ -314,7 +370,13 @@ def main():
     print(f"    * summary_*.csv: Summary reports")
     print(f"  - {GL_ANALYSIS_DIR.relative_to(BASE_DIR)}")
     print(f"    * [Brand]/[GL_Account]_YYYYMM.csv: Monthly data by GL account")
-    print(f"    * [Brand]/[GL_Account]_combined.csv: YoY comparison data")
+    print(f"    * [Brand]/[GL_Account]_combined.csv: Period comparison data (--compare)")
+    print(f"    * drilldown.csv + drilldown_index.json: Brand x GL account x month slices")
+    if args.layout == 'store':
+        print(f"  - {(DATA_DIR / 'gl_store').relative_to(BASE_DIR)}")
+        print(f"    * brand=[Brand]/year_month=YYYYMM/part.*: GL analysis partitions (sorted by GL account)")
+        print(f"    * _index/YYYYMM.csv: Brand x GL account row ranges")
+        print(f"    * Legacy CSV export: python gl_store.py --export --combined")
     print(f"\n[NEXT] Next steps:")
     print(f"  1. Review generated CSV files")
     print(f"  2. Dashboard is running at http://localhost:3000")
@@ -0,0 +1,209 @@
+"""
+요약 큐브 모듈
+- costs_YYYYMM.csv 전체를 가장 세밀한 단위(브랜드 × 연월 × 카테고리 L1~L3 × GL계정)로 한 번 집계한 큐브를 캐시
+- summary_*.csv 등 상위 요약은 모두 큐브를 다시 집계해서 생성 (월별 원본 파일을 다시 읽지 않음)
+- 증분 갱신: 월별 costs 파일의 크기/수정 시각이 바뀐 월만 다시 읽어 큐브의 해당 월을 교체
+  (삭제된 월은 큐브에서 제거)
+
+사용법:
+    python summary_cube.py               # 큐브 갱신 + summary_*.csv 생성
+    python summary_cube.py --rebuild     # 캐시 무시하고 전체 월 다시 집계
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from ledger_schema import concat_typed, to_category
+from period_comparison import available_months
+
+try:
+    import pyarrow  # noqa: F401
+    CUBE_FORMAT = 'parquet'
+except ImportError:
+    CUBE_FORMAT = 'pickle'
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+COSTS_DIR = BASE_DIR / 'public' / 'data' / 'costs'
+CUBE_DIR = BASE_DIR / '.cache' / 'summary_cube'
+
+# 큐브 버전 (집계 규칙이 바뀌면 올려서 기존 큐브 무효화)
+CUBE_VERSION = 1
+
+# 큐브 집계 단위 (costs 파일에 없는 컬럼은 제외, 예: 피벗 원장 costs에는 gl_account 없음)
+CUBE_GRAIN = ['brand', 'year_month', 'category_l1', 'category_l2', 'category_l3', 'gl_account']
+
+# 요약 파일: 파일명 → 집계 키
+ROLLUPS = {
+    'summary_by_brand_month.csv': ['brand', 'year_month'],
+    'summary_by_brand_category.csv': ['brand', 'year_month', 'category_l1'],
+    'summary_by_gl_account.csv': ['brand', 'year_month', 'gl_account'],
+}
+
+
+def _cube_paths(costs_dir, cube_dir):
+    """costs 폴더별 큐브/메타 파일 경로 (폴더 경로 해시로 구분)"""
+    key = hashlib.sha256(str(Path(costs_dir).resolve()).encode('utf-8')).hexdigest()[:16]
+    suffix = 'parquet' if CUBE_FORMAT == 'parquet' else 'pkl'
+    return Path(cube_dir) / f'cube_{key}.{suffix}', Path(cube_dir) / f'cube_{key}.json'
+
+
+def _file_signature(file_path):
+    stat = Path(file_path).stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def aggregate_month(file_path):
+    """
+    costs 파일 하나 → 큐브 단위 집계 (amount 합계, rows = 원본 행 수)
+    결측 키도 그룹으로 유지 (상위 요약에서 기존 groupby와 같은 규칙으로 제외)
+    """
+    key_columns = [col for col in CUBE_GRAIN if col != 'year_month']
+    df = pd.read_csv(file_path, encoding='utf-8-sig', dtype={col: str for col in CUBE_GRAIN})
+    grain = [col for col in CUBE_GRAIN if col in df.columns]
+    for col in key_columns:
+        if col in df.columns:
+            df[col] = to_category(df[col])
+
+    cube = df.groupby(grain, observed=True, dropna=False, sort=False).agg(
+        amount=('amount', 'sum'), rows=('amount', 'size')).reset_index()
+    cube['year_month'] = cube['year_month'].astype(str)
+    return cube
+
+
+def _load_cube(cube_file, meta_file, grain):
+    if not cube_file.exists() or not meta_file.exists():
+        return None, {}
+    with open(meta_file, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('version') != CUBE_VERSION or meta.get('grain') != grain:
+        return None, {}
+    cube = pd.read_parquet(cube_file) if CUBE_FORMAT == 'parquet' else pd.read_pickle(cube_file)
+    return cube, meta.get('months', {})
+
+
+def _save_cube(cube, cube_file, meta_file, grain, signatures):
+    cube_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cube_file.with_name(cube_file.name + '.tmp')
+    if CUBE_FORMAT == 'parquet':
+        cube.to_parquet(tmp_file, index=False)
+    else:
+        cube.to_pickle(tmp_file)
+    tmp_file.replace(cube_file)
+
+    tmp_meta = meta_file.with_name(meta_file.name + '.tmp')
+    with open(tmp_meta, 'w', encoding='utf-8') as f:
+        json.dump({'version': CUBE_VERSION, 'grain': grain, 'months': signatures}, f, indent=2)
+    tmp_meta.replace(meta_file)
+
+
+def update_cube(costs_dir=COSTS_DIR, cube_dir=CUBE_DIR, rebuild=False):
+    """
+    큐브 증분 갱신
+
+    Returns:
+        (큐브 데이터프레임 또는 None, 다시 집계한 월 목록)
+    """
+    costs_dir = Path(costs_dir)
+    months = available_months(costs_dir)
+    if not months:
+        return None, []
+
+    signatures = {month: _file_signature(costs_dir / f'costs_{month}.csv') for month in months}
+    columns = pd.read_csv(costs_dir / f'costs_{months[-1]}.csv', encoding='utf-8-sig', nrows=0).columns
+    grain = [col for col in CUBE_GRAIN if col in columns]
+
+    cube_file, meta_file = _cube_paths(costs_dir, cube_dir)
+    cube, cached = (None, {}) if rebuild else _load_cube(cube_file, meta_file, grain)
+
+    changed = [month for month in months if cached.get(month) != signatures[month]]
+    if cube is not None and not changed and set(cached) == set(months):
+        return cube, []
+
+    # 변경/삭제된 월을 제외한 기존 큐브 + 변경된 월 새 집계
+    frames = []
+    if cube is not None:
+        keep = cube['year_month'].isin([month for month in months if month not in changed])
+        frames.append(cube[keep])
+    frames += [aggregate_month(costs_dir / f'costs_{month}.csv') for month in changed]
+
+    cube = concat_typed(frames)
+    cube = cube.sort_values('year_month', kind='stable').reset_index(drop=True)
+    _save_cube(cube, cube_file, meta_file, grain, signatures)
+    return cube, changed
+
+
+def rollup(cube, keys):
+    """큐브 → keys 단위 금액 합계 (결측 키 제외, 키 순 정렬)"""
+    return cube.groupby(keys, observed=True)['amount'].sum().reset_index()
+
+
+def print_month_stats(cube, count_columns):
+    """
+    월별 전체 통계 출력
+
+    Args:
+        count_columns: [(레이블, 컬럼), ...] 월별 고유값 수를 출력할 컬럼
+    """
+    print(f"\n{'='*60}")
+    print("[SUMMARY] Overall Statistics")
+    print(f"{'='*60}")
+
+    for year_month, ym_data in cube.groupby('year_month', observed=True):
+        print(f"\n{year_month}:")
+        print(f"  Total Amount: {ym_data['amount'].sum():,.0f} KRW")
+        for label, col in count_columns:
+            if col in ym_data.columns:
+                print(f"  {label}: {ym_data[col].nunique()}")
+        print(f"  Data Rows: {ym_data['rows'].sum():,}")
+
+
+def build_summaries(costs_dir=COSTS_DIR, rollups=ROLLUPS, count_columns=(), cube_dir=CUBE_DIR, rebuild=False):
+    """
+    큐브 갱신 후 요약 파일 생성
+
+    Args:
+        rollups: {파일명: 집계 키} (큐브에 없는 키가 있으면 건너뜀)
+        count_columns: print_month_stats에 넘길 [(레이블, 컬럼), ...]
+
+    Returns:
+        큐브 데이터프레임 (비용 데이터가 없으면 None)
+    """
+    costs_dir = Path(costs_dir)
+    cube, changed = update_cube(costs_dir, cube_dir, rebuild=rebuild)
+    if cube is None:
+        print("  [WARN] No cost data found")
+        return None
+
+    months = cube['year_month'].nunique()
+    print(f"  [CUBE] {len(cube):,} cells, {len(changed)}/{months} months re-aggregated")
+
+    for file_name, keys in rollups.items():
+        if any(key not in cube.columns for key in keys):
+            continue
+        output_file = costs_dir / file_name
+        rollup(cube, keys).to_csv(output_file, index=False, encoding='utf-8-sig')
+        print(f"  [OK] Saved: {output_file.name}")
+
+    if count_columns:
+        print_month_stats(cube, count_columns)
+
+    return cube
+
+
+def main():
+    parser = argparse.ArgumentParser(description='비용 요약 큐브 갱신 및 summary_*.csv 생성')
+    parser.add_argument('--rebuild', action='store_true', help='캐시된 큐브를 무시하고 전체 월 다시 집계')
+    args = parser.parse_args()
+
+    print(f"\n[SUMMARY] Building summary cube for {COSTS_DIR.relative_to(BASE_DIR)}...")
+    build_summaries(rebuild=args.rebuild,
+                    count_columns=[('Brands', 'brand'), ('GL Accounts', 'gl_account'), ('L1 Categories', 'category_l1')])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+"""
+합성 원장 데이터 생성 모듈 (벤치마크/부하 테스트용)
+- 실제 데이터와 같은 형태의 세 가지 원본을 원하는 규모로 생성
+  pivot: 피벗 원장 CSV (ledger_YYYYMM.csv, 브랜드 → 대/중분류 → 소분류 행, 상위 레이블 2회 반복)
+  transactions: 거래 원장 (YYMM원장.xlsx 컬럼, 사업 영역 × 코스트센터 × G/L 계정 단위 거래)
+  snowflake: Snowflake 내보내기 (csv_to_dashboard.py 입력 cost/sales/headcount/stores CSV
+             + cost_query.py 입력 snowflake_costs.csv)
+- 브랜드, GL 계정, 코스트센터 수와 월 수, 행 수를 지정 (같은 시드 → 같은 데이터)
+- GL 계정/코스트센터 빈도는 순위에 반비례 (소수 계정에 거래가 몰리는 실제 분포와 비슷하게),
+  금액은 로그정규 분포 + 일부 음수(역분개)
+
+사용법:
+    python synthetic_ledger.py --output ../.cache/synthetic --rows 100000
+    python synthetic_ledger.py --output ../.cache/synthetic --rows 1000000 --months 3 --formats pivot snowflake
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from period_comparison import month_range, shift_month
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+OUTPUT_DIR = BASE_DIR / '.cache' / 'synthetic'
+
+# 브랜드 (사업 영역 내역, Snowflake 브랜드 코드)
+BRANDS = [
+    ('Discovery', 'X'),
+    ('Duvetica', 'V'),
+    ('MLB', 'M'),
+    ('MLB KIDS', 'I'),
+    ('SERGIO TACCHINI', 'ST'),
+]
+
+# 대분류 (실제 피벗 원장의 CATEGORY_L1)
+CATEGORIES_L1 = [
+    'VMD/ 매장보수대', '광고선전비', '기타영업비', '복리비/차량/핸드폰', '수선비', '여비교통비',
+    '저장품사용(쇼핑백/사은품)', '샘플대(제작/구입)', '인건비', '자가임차료(사옥)', '지급수수료', '지급임차료',
+]
+
+# 대분류당 중분류 수
+L2_PER_L1 = 4
+
+# 코스트센터 중 부서(F) 비율 (나머지는 매장 Z, 일부 기타 C)
+DEPARTMENT_SHARE = 0.25
+OTHER_SHARE = 0.02
+
+# 역분개(음수 금액) 비율
+REVERSAL_SHARE = 0.03
+
+FORMATS = ['pivot', 'transactions', 'snowflake']
+
+# 기본 규모
+DEFAULT_SPEC = {
+    'brands': len(BRANDS),
+    'gl_accounts': 60,
+    'cost_centers': 400,
+}
+
+
+def brand_list(count):
+    """[(브랜드명, 브랜드 코드)] (BRANDS보다 많으면 BRAND_06 … 추가)"""
+    brands = list(BRANDS[:count])
+    brands += [(f'BRAND_{i + 1:02d}', f'B{i + 1:02d}') for i in range(len(brands), count)]
+    return brands
+
+
+def gl_accounts(count):
+    """
+    GL 계정 목록 → (코드, 계정명, 대분류, 중분류) 배열 딕셔너리
+    계정명은 '대분류_번호' (소분류 = 계정명)
+    """
+    index = np.arange(count)
+    l1 = np.array(CATEGORIES_L1, dtype=object)[index % len(CATEGORIES_L1)]
+    numbers = index // len(CATEGORIES_L1)
+    names = np.array([f'{category}_{number + 1:02d}' for category, number in zip(l1, numbers)], dtype=object)
+    l2 = np.array([f'{category}_그룹{number % L2_PER_L1 + 1}' for category, number in zip(l1, numbers)],
+                  dtype=object)
+    codes = np.array([str(5_100_000 + i) for i in index], dtype=object)
+    return {'code': codes, 'name': names, 'l1': l1, 'l2': l2}
+
+
+def cost_centers(count, rng):
+    """코스트센터 목록 → (코드, 이름, 타입) 배열 딕셔너리 (F: 부서, Z: 매장, C: 기타)"""
+    kinds = rng.choice(['F', 'Z', 'C'], size=count,
+                       p=[DEPARTMENT_SHARE, 1 - DEPARTMENT_SHARE - OTHER_SHARE, OTHER_SHARE])
+    codes = np.array([f'{kind}{i:05d}' for i, kind in enumerate(kinds)], dtype=object)
+    types = np.select([kinds == 'F', kinds == 'Z'], ['부서', '매장'], default='기타').astype(object)
+    names = np.array([f'{kind_name} {i:05d}' for i, kind_name in enumerate(types)], dtype=object)
+    return {'code': codes, 'name': names, 'type': types}
+
+
+def _ranked_choice(rng, count, size):
+    """0..count-1 중 size개 추출 (순위에 반비례하는 빈도)"""
+    weights = 1.0 / np.arange(1, count + 1)
+    return rng.choice(count, size=size, p=weights / weights.sum())
+
+
+def _amounts(rng, size, mean=13.0, sigma=1.5):
+    """로그정규 금액 (원 단위 정수, REVERSAL_SHARE 비율은 음수)"""
+    amounts = np.round(rng.lognormal(mean, sigma, size)).astype('int64')
+    return np.where(rng.random(size) < REVERSAL_SHARE, -amounts, amounts)
+
+
+def generate_transactions(rows, spec=DEFAULT_SPEC, seed=0):
+    """
+    거래 원장 데이터프레임 (YYMM원장.xlsx와 같은 컬럼, 스키마 적용 전 object/int64)
+    """
+    rng = np.random.default_rng(seed)
+    brands = np.array([name for name, _ in brand_list(spec['brands'])], dtype=object)
+    accounts = gl_accounts(spec['gl_accounts'])
+    centers = cost_centers(spec['cost_centers'], rng)
+
+    brand_idx = rng.integers(0, len(brands), rows)
+    gl_idx = _ranked_choice(rng, len(accounts['code']), rows)
+    cctr_idx = _ranked_choice(rng, len(centers['code']), rows)
+
+    return pd.DataFrame({
+        '사업 영역 내역': brands[brand_idx],
+        '코스트 센터': centers['code'][cctr_idx],
+        '코스트센터명': centers['name'][cctr_idx],
+        'G/L 계정': accounts['code'][gl_idx],
+        'G/L 계정 설명': accounts['name'][gl_idx],
+        '금액(현지 통화)': _amounts(rng, rows, mean=11.0),
+        'CATEGORY_L1': accounts['l1'][gl_idx],
+        'CATEGORY_L2': accounts['l2'][gl_idx],
+        'CATEGORY_L3': accounts['name'][gl_idx],
+    })
+
+
+def generate_pivot(rows, year_month, spec=DEFAULT_SPEC, seed=0):
+    """
+    피벗 원장 데이터프레임 (ledger_YYYYMM.csv와 같은 형태, 약 rows행)
+
+    브랜드 행 → 대분류 2회 → (중분류 2회 → 소분류 행) 반복, 마지막 행은 총합계
+    상위 행 금액은 하위 소분류 합계
+    """
+    rng = np.random.default_rng(seed)
+    brands = [name for name, _ in brand_list(spec['brands'])]
+
+    # 브랜드당 행 수 = 1 + 대분류 × (2 + 중분류 × (2 + 소분류))
+    per_brand = max(rows - 4, len(brands)) / len(brands)
+    l3_per_l2 = max(1, round((per_brand - 1) / len(CATEGORIES_L1) / L2_PER_L1 - 2))
+
+    labels, amounts = [], []
+    grand_total = 0
+    for brand in brands:
+        brand_labels, brand_amounts = [], []
+        brand_total = 0
+        for category in CATEGORIES_L1:
+            leaves = _amounts(rng, L2_PER_L1 * l3_per_l2).reshape(L2_PER_L1, l3_per_l2)
+            l1_total = int(leaves.sum())
+            brand_labels += [category, category]
+            brand_amounts += [l1_total, l1_total]
+            for j, leaf_amounts in enumerate(leaves):
+                group = f'{category}_그룹{j + 1}'
+                brand_labels += [group, group] + [f'{group}_{k + 1:04d}' for k in range(l3_per_l2)]
+                brand_amounts += [int(leaf_amounts.sum())] * 2 + leaf_amounts.tolist()
+            brand_total += l1_total
+        labels += [brand] + brand_labels
+        amounts += [brand_total] + brand_amounts
+        grand_total += brand_total
+
+    # 원본 피벗 내보내기의 머리글 두 행 + 총합계 행
+    labels = ['', '행 레이블'] + labels + ['총합계']
+    amounts = [None, '합계 : 금액(현지 통화)'] + amounts + [grand_total]
+    return pd.DataFrame({'Unnamed: 0': labels, 'Unnamed: 1': amounts, '연월': year_month})
+
+
+def generate_snowflake_costs(rows, months, spec=DEFAULT_SPEC, seed=0):
+    """
+    Snowflake 비용 내보내기 (csv_to_dashboard.py --cost 입력 컬럼)
+    """
+    rng = np.random.default_rng(seed)
+    brands = np.array([name.upper() for name, _ in brand_list(spec['brands'])], dtype=object)
+    accounts = gl_accounts(spec['gl_accounts'])
+    centers = cost_centers(spec['cost_centers'], rng)
+
+    gl_idx = _ranked_choice(rng, len(accounts['code']), rows)
+    cctr_idx = _ranked_choice(rng, len(centers['code']), rows)
+
+    return pd.DataFrame({
+        'month': np.array(months, dtype=object)[rng.integers(0, len(months), rows)],
+        'brand_code': brands[rng.integers(0, len(brands), rows)],
+        'gl_account': accounts['code'][gl_idx],
+        'gl_name': accounts['name'][gl_idx],
+        'cctr_code': centers['code'][cctr_idx],
+        'cctr_name': centers['name'][cctr_idx],
+        'cctr_type': centers['type'][cctr_idx],
+        'cost_amt': _amounts(rng, rows),
+    })
+
+
+def generate_snowflake_tables(months, spec=DEFAULT_SPEC, seed=0):
+    """
+    Snowflake 월별 보조 테이블 (csv_to_dashboard.py --sales/--headcount/--stores 입력)
+
+    Returns:
+        (매출, 인원수, 매장수) 데이터프레임
+    """
+    rng = np.random.default_rng(seed)
+    brands = [name.upper() for name, _ in brand_list(spec['brands'])]
+    keys = pd.MultiIndex.from_product([months, brands], names=['month', 'brand_code']).to_frame(index=False)
+    size = len(keys)
+
+    sales = keys.assign(sale_amt=rng.integers(1_000_000_000, 30_000_000_000, size))
+    headcount = keys.assign(headcount=rng.integers(50, 300, size))
+    stores = keys.assign(store_cnt=rng.integers(20, 120, size))
+    return sales, headcount, stores
+
+
+def to_snowflake_costs_csv(costs, spec=DEFAULT_SPEC):
+    """csv_to_dashboard 입력 형태 → snowflake_costs.csv 컬럼 (cost_query.py 입력)"""
+    brand_codes = {name.upper(): code for name, code in brand_list(spec['brands'])}
+    accounts = gl_accounts(spec['gl_accounts'])
+    l1 = dict(zip(accounts['name'], accounts['l1']))
+    l2 = dict(zip(accounts['name'], accounts['l2']))
+    return pd.DataFrame({
+        'YYYYMM': costs['month'],
+        'BRD_CD': costs['brand_code'].map(brand_codes),
+        'BRD_NM': costs['brand_code'],
+        'CCTR_CD': costs['cctr_code'],
+        'CCTR_NM': costs['cctr_name'],
+        'CCTR_TYPE': costs['cctr_type'],
+        'CATEGORY_L1': costs['gl_name'].map(l1),
+        'CATEGORY_L2': costs['gl_name'].map(l2),
+        'CATEGORY_L3': costs['gl_name'],
+        'GL_CD': costs['gl_account'],
+        'GL_NM': costs['gl_name'],
+        'COST_AMT': costs['cost_amt'],
+    })
+
+
+def write_dataset(output_dir, rows, months, formats=FORMATS, spec=DEFAULT_SPEC, seed=0):
+    """
+    합성 원본 파일 저장
+
+    Args:
+        rows: 원본 하나(월별 피벗/거래 원장, Snowflake 비용 전체)의 행 수
+        months: 연월 목록
+
+    Returns:
+        저장한 파일 경로 목록
+    """
+    output_dir = Path(output_dir)
+    written = []
+
+    if 'pivot' in formats:
+        (output_dir / 'ledger').mkdir(parents=True, exist_ok=True)
+        for i, year_month in enumerate(months):
+            output_file = output_dir / 'ledger' / f'ledger_{year_month}.csv'
+            generate_pivot(rows, year_month, spec, seed + i).to_csv(output_file, index=False, encoding='utf-8-sig')
+            written.append(output_file)
+
+    if 'transactions' in formats:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for i, year_month in enumerate(months):
+            output_file = output_dir / f'{year_month[2:]}원장.xlsx'
+            generate_transactions(rows, spec, seed + i).to_excel(output_file, index=False)
+            written.append(output_file)
+
+    if 'snowflake' in formats:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        costs = generate_snowflake_costs(rows, months, spec, seed)
+        tables = zip(['cost_data', 'sales_data', 'headcount_data', 'store_data'],
+                     [costs, *generate_snowflake_tables(months, spec, seed)])
+        for name, df in tables:
+            output_file = output_dir / f'{name}.csv'
+            df.to_csv(output_file, index=False, encoding='utf-8-sig')
+            written.append(output_file)
+        output_file = output_dir / 'snowflake_costs.csv'
+        to_snowflake_costs_csv(costs, spec).to_csv(output_file, index=False, encoding='utf-8-sig')
+        written.append(output_file)
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 원장 데이터 생성 (피벗/거래 원장/Snowflake 내보내기)')
+    parser.add_argument('--output', type=Path, default=OUTPUT_DIR, help='출력 폴더 (기본 .cache/synthetic)')
+    parser.add_argument('--rows', type=int, default=100_000, help='원본 하나의 행 수 (기본 100000)')
+    parser.add_argument('--months', type=int, default=2, help='월 수 (기본 2, --end-month까지)')
+    parser.add_argument('--end-month', default='202510', metavar='YYYYMM', help='마지막 연월 (기본 202510)')
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=FORMATS, help='생성할 원본 종류')
+    parser.add_argument('--brands', type=int, default=DEFAULT_SPEC['brands'], help='브랜드 수')
+    parser.add_argument('--gl-accounts', type=int, default=DEFAULT_SPEC['gl_accounts'], help='GL 계정 수')
+    parser.add_argument('--cost-centers', type=int, default=DEFAULT_SPEC['cost_centers'], help='코스트센터 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    spec = {'brands': args.brands, 'gl_accounts': args.gl_accounts, 'cost_centers': args.cost_centers}
+    months = month_range(shift_month(args.end_month, 1 - args.months), args.end_month)
+
+    print(f"[SYNTHETIC] {args.rows:,} rows x {len(months)} months ({', '.join(args.formats)})")
+    for output_file in write_dataset(args.output, args.rows, months, args.formats, spec, args.seed):
+        print(f"  [OK] Saved: {output_file}")
+
+
+if __name__ == '__main__':
+    main()
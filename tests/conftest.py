@@ -0,0 +1,24 @@
+"""
+테스트 공용 설정
+- python_scripts, scripts 폴더의 모듈을 스크립트에서와 같은 방식(폴더를 sys.path에 추가)으로 import
+- 캐시/실행 보고서는 테스트별 임시 폴더로 교체 (저장소의 .cache, public/data는 변경하지 않음)
+
+실행:
+    python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / 'scripts'))
+sys.path.insert(0, str(BASE_DIR / 'python_scripts'))
+
+
+@pytest.fixture(autouse=True)
+def isolated_run_reports(tmp_path, monkeypatch):
+    """실행 보고서를 임시 폴더에 기록"""
+    import run_report
+    monkeypatch.setattr(run_report, 'REPORT_DIR', tmp_path / 'run_reports')
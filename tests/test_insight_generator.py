@@ -0,0 +1,52 @@
+"""insight_generator.py - 가짜 OpenAI 엔드포인트(fake_openai_server.py)로 재시도/캐시 확인"""
+
+import asyncio
+
+import openai
+import pytest
+
+import insight_generator
+from fake_openai_server import start_server
+
+
+@pytest.fixture
+def fake_server():
+    # 2번째 요청마다 429, 3번째 요청마다 500 (Retry-After 0초)
+    server, base_url = start_server(rate_limit_every=2, error_every=3, retry_after=0)
+    yield server, base_url
+    server.shutdown()
+    server.server_close()
+
+
+def make_jobs(output_dir, count=6):
+    return [{
+        'label': f'BRAND{i} 202510',
+        'request': insight_generator.build_request(f'테스트 프롬프트 {i}'),
+        'output': output_dir / f'insights_BRAND{i}_202510.csv',
+    } for i in range(count)]
+
+
+def generate(jobs, base_url):
+    async def run():
+        client = openai.AsyncOpenAI(api_key='local', base_url=base_url, max_retries=0, timeout=10)
+        async with client:
+            return await insight_generator.generate_all(jobs, client, concurrency=3, requests_per_minute=0)
+    return asyncio.run(run())
+
+
+def test_rerun_after_retryable_errors_serves_from_cache(fake_server, tmp_path, monkeypatch):
+    server, base_url = fake_server
+    monkeypatch.setattr(insight_generator, 'CACHE_DIR', tmp_path / 'cache')
+    monkeypatch.setattr(insight_generator, 'BACKOFF_BASE', 0.01)
+    jobs = make_jobs(tmp_path / 'out')
+
+    first = generate(jobs, base_url)
+    assert first == {'cached': 0, 'generated': len(jobs), 'failed': 0}
+    assert server.stats['rate_limited'] > 0 and server.stats['errors'] > 0
+    outputs = {job['output']: job['output'].read_bytes() for job in jobs}
+
+    requests = server.stats['requests']
+    second = generate(jobs, base_url)
+    assert second == {'cached': len(jobs), 'generated': 0, 'failed': 0}
+    assert server.stats['requests'] == requests
+    assert {path: path.read_bytes() for path in outputs} == outputs
@@ -0,0 +1,89 @@
+"""
+원장 파이프라인 ↔ 드릴다운 인덱스 테스트
+- process_ledger_transactions.py가 만든 인덱스가 남아 있는 상태에서 피벗 원장 파이프라인을 실행하면
+  인덱스/드릴다운 파일이 삭제되어 웹 계층이 [Brand]/[Category]_*.csv를 읽어야 함
+- gl_account가 없는 costs만 있으면 인덱스 생성은 경고 후 종료
+"""
+
+import shutil
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import drilldown_index
+import ledger_pipeline
+import summary_cube
+
+LEDGER_DIR = Path(__file__).parent.parent / 'public' / 'data' / 'ledger'
+
+
+def write_transaction_costs(costs_dir, year_month):
+    """process_ledger_transactions.py 형식의 costs_YYYYMM.csv (gl_account 포함)"""
+    df = pd.DataFrame({
+        'brand': ['MLB', 'MLB', 'Discovery'],
+        'category_l1': ['광고선전비', '광고선전비', '지급수수료'],
+        'category_l2': ['매체광고', '매체광고', '매장보수대'],
+        'category_l3': ['광고선전비_매체광고', '광고선전비_판촉물', '지급수수료_매장보수대'],
+        'gl_account': ['광고선전비_매체광고', '광고선전비_판촉물', '지급수수료_매장보수대'],
+        'amount': [1000, 2000, 3000],
+        'year_month': [year_month] * 3,
+    })
+    df.to_csv(costs_dir / f'costs_{year_month}.csv', index=False, encoding='utf-8-sig')
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    data_dir = tmp_path / 'data'
+    shutil.copytree(LEDGER_DIR, data_dir / 'ledger')
+    (data_dir / 'costs').mkdir()
+    (data_dir / 'gl_analysis').mkdir()
+
+    monkeypatch.setattr(ledger_pipeline, 'DATA_DIR', data_dir)
+    monkeypatch.setattr(ledger_pipeline, 'LEDGER_DIR', data_dir / 'ledger')
+    monkeypatch.setattr(ledger_pipeline, 'COSTS_DIR', data_dir / 'costs')
+    monkeypatch.setattr(ledger_pipeline, 'GL_ANALYSIS_DIR', data_dir / 'gl_analysis')
+    monkeypatch.setattr(ledger_pipeline, 'build_summaries',
+                        partial(summary_cube.build_summaries, cube_dir=tmp_path / 'summary_cube'))
+    return data_dir
+
+
+def build_index(data_dir):
+    gl_analysis_dir = data_dir / 'gl_analysis'
+    return drilldown_index.build_drilldown_index(
+        data_dir / 'costs', gl_analysis_dir / 'drilldown.csv', gl_analysis_dir / 'drilldown_index.json')
+
+
+def test_pivot_pipeline_removes_stale_drilldown_index(data_dir):
+    gl_analysis_dir = data_dir / 'gl_analysis'
+    write_transaction_costs(data_dir / 'costs', '202410')
+    assert build_index(data_dir)['months'] == ['202410']
+    assert (gl_analysis_dir / 'drilldown_index.json').exists()
+
+    ledger_pipeline.run_pipeline(strategy='v4', months=['202410'], workers=1)
+
+    assert not (gl_analysis_dir / 'drilldown_index.json').exists()
+    assert not (gl_analysis_dir / 'drilldown.csv').exists()
+    assert list(gl_analysis_dir.glob('*/*_202410.csv'))
+
+    # 피벗 costs만 남으면 인덱스를 만들지 않음 (빈 데이터로 실패하지 않음)
+    assert build_index(data_dir) is None
+    assert not (gl_analysis_dir / 'drilldown_index.json').exists()
+
+
+def test_drilldown_index_skips_months_without_gl_account(data_dir, capsys):
+    write_transaction_costs(data_dir / 'costs', '202410')
+    ledger_pipeline.run_pipeline(strategy='v4', months=['202510'], workers=1)
+    capsys.readouterr()
+
+    index = build_index(data_dir)
+
+    assert "Skipped months without gl_account: 202510" in capsys.readouterr().out
+    assert index['months'] == ['202410']
+    assert index['combined_months'] == ['202410']
+    assert set(index['entries']) == {'MLB', 'Discovery'}
+    csv_text = drilldown_index.read_drilldown('MLB', '광고선전비_매체광고',
+                                              index_file=data_dir / 'gl_analysis' / 'drilldown_index.json')
+    rows = [line.split(',') for line in csv_text.splitlines()[1:]]
+    assert [(row[4], float(row[5]), row[6]) for row in rows] == [('광고선전비_매체광고', 1000.0, '202410')]
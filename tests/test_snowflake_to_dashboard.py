@@ -0,0 +1,81 @@
+"""snowflake_to_dashboard.py - SQLite 픽스처(snowflake_fixture.py)로 오프라인 실행"""
+
+import json
+import sys
+
+import pytest
+
+import snowflake_cache
+import snowflake_to_dashboard
+from snowflake_fixture import build_fixture
+
+
+@pytest.fixture
+def fixture_db(tmp_path):
+    db_path = tmp_path / 'fixture.db'
+    build_fixture(str(db_path), '202401', 6, cctr_per_brand=4)
+    return db_path
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['snowflake_to_dashboard.py', *map(str, args)])
+    snowflake_to_dashboard.main()
+
+
+def read_outputs(output_dir):
+    """브랜드별 JSON (생성 시각 제외)"""
+    outputs = {}
+    for path in sorted(output_dir.glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data.pop('generated_at')
+        outputs[path.name] = data
+    return outputs
+
+
+def test_parallel_cached_runs_match_serial_no_cache_run(fixture_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(snowflake_cache, 'CACHE_DIR', tmp_path / 'cache')
+    common = ['--month', '202406', '--months-back', 5, '--sqlite', fixture_db]
+
+    run_main(monkeypatch, *common, '--no-cache', '--workers', 1, '--output', tmp_path / 'no_cache')
+    run_main(monkeypatch, *common, '--workers', 4, '--output', tmp_path / 'cold')
+    run_main(monkeypatch, *common, '--workers', 4, '--output', tmp_path / 'warm')
+
+    expected = read_outputs(tmp_path / 'no_cache')
+    assert len(expected) == 5
+    assert read_outputs(tmp_path / 'cold') == expected
+    assert read_outputs(tmp_path / 'warm') == expected
+    assert any((tmp_path / 'cache').rglob('202401.*'))
+
+
+@pytest.fixture
+def mixed_type_db(tmp_path):
+    """첫 배치에서는 note가 전부 NULL, amount가 정수이고 이후 배치에서 문자열/실수가 나오는 테이블"""
+    import sqlite3
+    db_path = tmp_path / 'mixed.db'
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE T (ID INTEGER, NOTE TEXT, AMOUNT)")
+    conn.executemany("INSERT INTO T VALUES (?, ?, ?)",
+                     [(i, None if i < 5 else f'n{i}', i if i < 5 else i + 0.5) for i in range(12)])
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+@pytest.mark.skipif(snowflake_to_dashboard.pa is None, reason='pyarrow 필요')
+def test_dbapi_batches_with_changing_types(mixed_type_db, tmp_path, monkeypatch):
+    import pandas as pd
+    monkeypatch.setattr(snowflake_to_dashboard, 'FETCH_BATCH_ROWS', 5)
+    conn = snowflake_to_dashboard.connect_sqlite(str(mixed_type_db))
+    query = "SELECT ID, NOTE, AMOUNT FROM T ORDER BY ID"
+    try:
+        expected = pd.DataFrame.from_records(conn.execute(query).fetchall(), columns=['id', 'note', 'amount'])
+        df = snowflake_to_dashboard.read_query(conn, query)
+        path = tmp_path / 'mixed.parquet'
+        rows = snowflake_to_dashboard.write_query_parquet(conn, query, str(path))
+    finally:
+        conn.close()
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert rows == len(expected)
+    pd.testing.assert_frame_equal(pd.read_parquet(path), expected)